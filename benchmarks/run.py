@@ -0,0 +1,341 @@
+"""
+QuantumPytho benchmark suite.
+
+Times the engine, each circuit builder, the modules and the FastAPI
+endpoints at several sizes, with cold caches (fresh engine, builder
+memoization cleared) and warm caches (same engine, second call).
+
+Usage:
+    python benchmarks/run.py                       # run, compare to baseline
+    python benchmarks/run.py --update-baseline     # store a new baseline
+    python benchmarks/run.py --filter engine.run   # only matching cases
+
+Results are written as JSON (``--output``). Any case whose median time
+exceeds its baseline median by more than ``--threshold`` (a fraction, 0.25
+= 25 %) and by at least ``--min-delta-ms`` is reported and the process
+exits with status 1. The stored baseline is machine-specific: regenerate it
+with ``--update-baseline`` on the machine that runs the comparison.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+
+@dataclass
+class Case:
+    name: str
+    # Returns the callable to time. Called once per cold repetition, so
+    # anything it builds (engine, client) starts with empty caches.
+    setup: Callable[[], Callable[[], object]]
+
+
+def _clear_builder_caches() -> None:
+    from quantumpytho.modules.circuit_explorer import (
+        build_bell_circuit,
+        build_hadamard_circuit,
+    )
+    from quantumpytho.modules.qrng_sacred import (
+        build_qrng_circuit,
+        build_qrng_template,
+    )
+    from quantumpytho.modules.teleport_bridge import (
+        build_teleport_circuit,
+        build_teleport_template,
+    )
+
+    for fn in (
+        build_bell_circuit,
+        build_hadamard_circuit,
+        build_qrng_circuit,
+        build_qrng_template,
+        build_teleport_circuit,
+        build_teleport_template,
+    ):
+        fn.cache_clear()
+    # Text diagrams memoized by the server tasks (drawn on every response).
+    from quantumpytho.tasks import _DIAGRAMS
+
+    _DIAGRAMS.clear()
+
+
+def _engine():
+    from quantumpytho.config import QuantumConfig
+    from quantumpytho.engine import QuantumEngine
+
+    return QuantumEngine(QuantumConfig(shots=1024))
+
+
+def engine_cases() -> Iterator[Case]:
+    from quantumpytho.modules.circuit_explorer import (
+        build_bell_circuit,
+        build_hadamard_circuit,
+    )
+    from quantumpytho.modules.qrng_sacred import build_qrng_circuit
+    from quantumpytho.modules.teleport_bridge import build_teleport_circuit
+
+    builders: list[tuple[str, Callable[[], object]]] = [
+        ("bell", build_bell_circuit),
+        ("teleport", build_teleport_circuit),
+    ]
+    for depth in (1, 10, 100):
+        builders.append(
+            (f"hadamard[{depth}]", lambda d=depth: build_hadamard_circuit(d))
+        )
+    for width in (4, 8, 16, 32):
+        builders.append((f"qrng[{width}]", lambda w=width: build_qrng_circuit(w)))
+
+    for name, build in builders:
+
+        def setup(build=build):
+            _clear_builder_caches()
+            engine = _engine()
+            return lambda: engine.run(build())
+
+        yield Case(f"engine.run/{name}", setup)
+
+
+def module_cases() -> Iterator[Case]:
+    from quantumpytho.modules.bloch_ascii import one_qubit_from_angles
+    from quantumpytho.modules.qrng_sacred import qrng_phi_sequence
+    from quantumpytho.modules.vqe_h2_ascii import (
+        coordinate_descent,
+        coordinate_descent_1d,
+    )
+
+    for width in (4, 8, 12):
+
+        def setup(width=width):
+            _clear_builder_caches()
+            engine = _engine()
+            return lambda: qrng_phi_sequence(engine, num_qubits=width, length=16)
+
+        yield Case(f"qrng_phi_sequence/{width}", setup)
+
+    from quantumpytho.modules.teleport_bridge import teleport_fidelity_sweep
+
+    for points in (4, 16):
+
+        def setup(points=points):
+            _clear_builder_caches()
+            engine = _engine()
+            thetas = [i * 3.14159 / points for i in range(points)]
+            return lambda: teleport_fidelity_sweep(engine, thetas, 0.3)
+
+        yield Case(f"teleport_fidelity_sweep/{points}", setup)
+
+    for points in (1, 100, 1000):
+
+        def setup(points=points):
+            angles = [(i * 3.14159 / points, i * 0.1) for i in range(points)]
+            return lambda: [one_qubit_from_angles(t, p) for t, p in angles]
+
+        yield Case(f"one_qubit_from_angles/{points}", setup)
+
+    for iters in (10, 100, 1000):
+
+        def setup(iters=iters):
+            return lambda: coordinate_descent_1d(
+                lambda t: math.cos(t) + 0.1 * t * t, 0.3, 0.5, iters
+            )
+
+        yield Case(f"coordinate_descent_1d/{iters}", setup)
+
+    for starts, dim in ((1, 4), (16, 4), (16, 16)):
+
+        def setup(starts=starts, dim=dim):
+            import numpy as np
+
+            theta0 = np.random.default_rng(7).uniform(-2, 2, (starts, dim))
+
+            def cost(points):
+                return (np.cos(points) + 0.1 * points * points).sum(axis=1)
+
+            return lambda: coordinate_descent(cost, theta0, 0.5, 100, tol=1e-6)
+
+        yield Case(f"coordinate_descent/{starts}x{dim}", setup)
+
+    try:
+        import qiskit_algorithms  # noqa: F401
+        import qiskit_nature  # noqa: F401
+    except ImportError:
+        return
+    from quantumpytho.modules.vqe_h2_exact import run_vqe_h2_physical
+
+    for iters in (10, 50):
+
+        def setup(iters=iters):
+            return lambda: run_vqe_h2_physical(max_iters=iters)
+
+        yield Case(f"run_vqe_h2_physical/{iters}", setup)
+
+    for mode, optimizer in (
+        ("estimator", "cobyla"),
+        ("exact", "l_bfgs_b"),
+        ("shots", "cobyla"),
+    ):
+
+        def setup(mode=mode, optimizer=optimizer):
+            return lambda: run_vqe_h2_physical(
+                max_iters=50, mode=mode, optimizer=optimizer
+            )
+
+        yield Case(f"run_vqe_h2_physical/{mode}/{optimizer}", setup)
+
+
+def server_cases() -> Iterator[Case]:
+    try:
+        from fastapi.testclient import TestClient
+    except ImportError:
+        return
+    import server
+    from quantumpytho.config import QuantumConfig
+    from quantumpytho.workers import SimulationPool
+
+    requests: list[tuple[str, str, str, dict | None]] = [
+        ("GET /bell", "get", "/bell", None),
+        ("GET /qrng", "get", "/qrng", None),
+        ("GET /teleport", "get", "/teleport", None),
+        ("POST /bloch", "post", "/bloch", {"theta": 1.0, "phi": 1.0}),
+        ("POST /hadamard[3]", "post", "/hadamard", {"depth": 3}),
+        ("POST /hadamard[100]", "post", "/hadamard", {"depth": 100}),
+    ]
+    for name, method, path, body in requests:
+
+        def setup(method=method, path=path, body=body):
+            _clear_builder_caches()
+            # Cold means a response-cache miss too (cached paths, e.g. /bloch).
+            if server.response_cache is not None:
+                server.response_cache.clear()
+            # In-process thread pool: times the endpoint, not process startup.
+            previous = server.pool
+            server.pool = SimulationPool(
+                workers=1, config=QuantumConfig(), use_processes=False
+            )
+            previous.shutdown(wait=False)
+            client = TestClient(server.app)
+            call = getattr(client, method)
+            kwargs = {} if body is None else {"json": body}
+            return lambda: call(path, **kwargs).raise_for_status()
+
+        yield Case(f"server/{name}", setup)
+
+
+def all_cases() -> Iterator[Case]:
+    yield from engine_cases()
+    yield from module_cases()
+    yield from server_cases()
+
+
+def time_case(case: Case, repeat: int) -> dict[str, dict[str, float]]:
+    """
+    Median/min seconds over ``repeat`` runs, for the first call on fresh
+    state (cold) and for a repeated call on the same state (warm).
+    """
+    cold, warm = [], []
+    for _ in range(repeat):
+        fn = case.setup()
+        t0 = time.perf_counter()
+        fn()
+        cold.append(time.perf_counter() - t0)
+        t0 = time.perf_counter()
+        fn()
+        warm.append(time.perf_counter() - t0)
+    return {
+        phase: {"median": statistics.median(samples), "min": min(samples)}
+        for phase, samples in (("cold", cold), ("warm", warm))
+    }
+
+
+def compare(
+    results: dict[str, dict],
+    baseline: dict[str, dict],
+    threshold: float,
+    min_delta: float = 0.0,
+) -> list[str]:
+    """
+    Describe every (case, phase) whose median regressed beyond threshold.
+    Slowdowns smaller than ``min_delta`` seconds are treated as noise.
+    """
+    regressions = []
+    for name, phases in results.items():
+        for phase, stats in phases.items():
+            base = baseline.get(name, {}).get(phase)
+            if not base:
+                continue
+            limit = max(base["median"] * (1.0 + threshold), base["median"] + min_delta)
+            if stats["median"] > limit:
+                regressions.append(
+                    f"{name} [{phase}]: {stats['median'] * 1e3:.3f} ms "
+                    f"vs baseline {base['median'] * 1e3:.3f} ms "
+                    f"(+{stats['median'] / base['median'] - 1:.0%})"
+                )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", type=Path, default=ROOT / "bench_results.json")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=0.5,
+        help="ignore slowdowns smaller than this many milliseconds",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--filter", default="", help="substring of case names")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    results: dict[str, dict] = {}
+    for case in all_cases():
+        if args.filter not in case.name:
+            continue
+        results[case.name] = stats = time_case(case, args.repeat)
+        print(
+            f"{case.name:40s} cold {stats['cold']['median'] * 1e3:10.3f} ms"
+            f"   warm {stats['warm']['median'] * 1e3:10.3f} ms"
+        )
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; skipping comparison.")
+        return 0
+    baseline = json.loads(args.baseline.read_text())["results"]
+    regressions = compare(results, baseline, args.threshold, args.min_delta_ms / 1e3)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
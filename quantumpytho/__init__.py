@@ -10,5 +10,5 @@ A modular quantum playground:
 - Decoherence toggle
 """
 
-__all__ = ["config", "engine", "menu", "modules"]
+__all__ = ["cli", "config", "engine", "menu", "modules"]
 __version__ = "0.1.0"
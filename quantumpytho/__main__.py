@@ -1,6 +1,8 @@
 """Allow running with: python -m quantumpytho"""
 
-from .menu import run_app
+import sys
+
+from .cli import main
 
 if __name__ == "__main__":
-    run_app()
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+Exact outcome distributions for small measured circuits.
+
+A circuit qualifies when it is a sequence of unitary gates followed by
+terminal measurements (no gate touches a qubit after it is measured, no
+resets, control flow or unbound parameters) and it is no wider than the
+caller's limit. Its measurement distribution is then computed from the
+statevector, and counts are drawn from it with a multinomial instead of
+running shots on a simulator.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .counts import CountsArray
+
+if TYPE_CHECKING:
+    import numpy as np
+    from qiskit import QuantumCircuit
+
+# Outcomes less likely than this are treated as numerical noise (e.g. the
+# ~1e-32 residue of H·H) and dropped.
+PROBABILITY_CUTOFF = 1e-12
+
+
+@dataclass(frozen=True)
+class ExactDistribution:
+    """
+    Measurement outcomes (Qiskit count-key format), their clbit values and
+    their probabilities.
+    """
+
+    outcomes: tuple[str, ...]
+    probabilities: np.ndarray
+    values: np.ndarray
+    num_clbits: int
+    creg_sizes: tuple[int, ...]
+
+    def as_dict(self) -> dict[str, float]:
+        return dict(zip(self.outcomes, self.probabilities.tolist(), strict=True))
+
+
+def measured_qubits(circuit: QuantumCircuit) -> list[tuple[int, int]] | None:
+    """
+    ``(qubit, clbit)`` index pairs of the circuit's measurements if the
+    circuit has the shape described in the module docstring, else None.
+    """
+    from qiskit.circuit import Gate
+
+    if circuit.parameters or sum(r.size for r in circuit.cregs) != circuit.num_clbits:
+        return None
+    measured: dict[int, int] = {}
+    written: set[int] = set()
+    for inst in circuit.data:
+        name = inst.operation.name
+        if name == "barrier":
+            continue
+        qubits = [circuit.find_bit(q).index for q in inst.qubits]
+        if any(q in measured for q in qubits):
+            return None
+        if name == "measure":
+            clbit = circuit.find_bit(inst.clbits[0]).index
+            if clbit in written:
+                return None
+            written.add(clbit)
+            measured[qubits[0]] = clbit
+        elif not isinstance(inst.operation, Gate) or inst.clbits:
+            return None
+    return list(measured.items()) or None
+
+
+def exact_distribution(
+    circuit: QuantumCircuit, max_qubits: int
+) -> ExactDistribution | None:
+    """
+    Exact measurement distribution of ``circuit``, or None if it does not
+    qualify (see module docstring) or is wider than ``max_qubits``.
+    """
+    if circuit.num_qubits > max_qubits:
+        return None
+    pairs = measured_qubits(circuit)
+    if pairs is None:
+        return None
+
+    import numpy as np
+    from qiskit.quantum_info import Statevector
+
+    unitary = circuit.remove_final_measurements(inplace=False)
+    qubits = [q for q, _ in pairs]
+    probs = Statevector(unitary).probabilities(qargs=qubits)
+    # Outcome index i has qubits[j] in bit j; move that bit to its clbit.
+    index = np.arange(len(probs))
+    values = np.zeros_like(index)
+    for j, (_, clbit) in enumerate(pairs):
+        values |= ((index >> j) & 1) << clbit
+    keep = probs > PROBABILITY_CUTOFF
+    probs, values = probs[keep], values[keep]
+    return ExactDistribution(
+        outcomes=tuple(_count_key(circuit, int(v)) for v in values),
+        probabilities=probs / probs.sum(),
+        values=values.astype(np.uint64),
+        num_clbits=circuit.num_clbits,
+        creg_sizes=tuple(reg.size for reg in circuit.cregs),
+    )
+
+
+def _count_key(circuit: QuantumCircuit, value: int) -> str:
+    """Format a clbit integer like Qiskit count keys (one group per register)."""
+    groups = []
+    for reg in reversed(circuit.cregs):
+        bits = [(value >> circuit.find_bit(b).index) & 1 for b in reg]
+        groups.append("".join(str(b) for b in reversed(bits)))
+    return " ".join(groups)
+
+
+def sample(
+    dist: ExactDistribution,
+    shots: int,
+    rng: np.random.Generator,
+    memory: bool = False,
+    compact: bool = False,
+) -> tuple[dict[str, int] | CountsArray, list[str] | None]:
+    """
+    Draw ``shots`` outcomes from ``dist``: counts (zero-count outcomes
+    omitted; a ``CountsArray`` with ``compact``) and, with ``memory``, the
+    per-shot outcomes in draw order.
+    """
+    import numpy as np
+
+    if memory:
+        draws = rng.choice(len(dist.outcomes), size=shots, p=dist.probabilities)
+        shot_memory = [dist.outcomes[i] for i in draws]
+        tallies = np.bincount(draws, minlength=len(dist.outcomes))
+    else:
+        shot_memory = None
+        tallies = rng.multinomial(shots, dist.probabilities)
+    if compact:
+        seen = tallies > 0
+        counts = CountsArray(
+            dist.values[seen],
+            tallies[seen].astype(np.int64),
+            dist.num_clbits,
+            dist.creg_sizes,
+        )
+        return counts, shot_memory
+    counts = {
+        outcome: int(n) for outcome, n in zip(dist.outcomes, tallies, strict=True) if n
+    }
+    return counts, shot_memory
@@ -0,0 +1,118 @@
+"""
+Bounded LRU cache of backend-compiled circuits.
+
+Circuits are keyed by structure (registers, instructions, parameters and
+operands) rather than by object identity, so two independently built but
+identical circuits share one compiled entry.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+
+
+def circuit_key(circuit: QuantumCircuit) -> str:
+    """
+    Structural hash of a circuit.
+
+    Two circuits with the same registers (name and size, in order), global
+    phase and instruction list (operation name, parameters, qubit and clbit
+    indices, condition) get the same key. Registers are part of the key
+    because they shape the count keys and diagrams, e.g. one 2-bit register
+    reports ``"11"`` where two 1-bit registers report ``"1 1"``. Nested
+    control-flow blocks are hashed recursively.
+    """
+    digest = hashlib.sha1()
+    _update_digest(digest, circuit)
+    return digest.hexdigest()
+
+
+def _update_digest(digest, circuit: QuantumCircuit) -> None:
+    from qiskit import QuantumCircuit
+
+    digest.update(
+        f"{circuit.num_qubits}|{circuit.num_clbits}|{circuit.global_phase!r}".encode()
+    )
+    for kind, registers in (("q", circuit.qregs), ("c", circuit.cregs)):
+        for reg in registers:
+            digest.update(f"{kind}{(reg.name, reg.size)!r}".encode())
+    for inst in circuit.data:
+        op = inst.operation
+        qargs = tuple(circuit.find_bit(q).index for q in inst.qubits)
+        cargs = tuple(circuit.find_bit(c).index for c in inst.clbits)
+        digest.update(f"{op.name}{qargs}{cargs}".encode())
+        for param in op.params:
+            if isinstance(param, QuantumCircuit):
+                _update_digest(digest, param)
+            else:
+                digest.update(repr(param).encode())
+        condition = getattr(op, "condition", None)
+        if condition is not None:
+            digest.update(repr(condition).encode())
+
+
+class CircuitCache:
+    """
+    LRU mapping of structural circuit key -> compiled circuit.
+
+    ``hits`` and ``misses`` count lookups since the last ``clear()``.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, QuantumCircuit] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compile(
+        self,
+        circuit: QuantumCircuit,
+        compile_fn: Callable[[QuantumCircuit], QuantumCircuit],
+        variant: str = "",
+    ) -> QuantumCircuit:
+        """
+        Return the cached compilation of ``circuit``, compiling on a miss.
+        ``variant`` separates entries compiled differently (e.g. with other
+        transpiler settings) for the same circuit.
+        """
+        if self.maxsize == 0:
+            self.misses += 1
+            return compile_fn(circuit)
+
+        key = f"{variant}:{circuit_key(circuit)}"
+        compiled = self._entries.get(key)
+        if compiled is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return compiled
+
+        self.misses += 1
+        compiled = compile_fn(circuit)
+        self._entries[key] = compiled
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return compiled
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
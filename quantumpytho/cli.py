@@ -0,0 +1,371 @@
+"""
+``qpy`` command line.
+
+Without a subcommand ``qpy`` starts the interactive menu. The subcommands
+run jobs non-interactively and write one JSON object per finished job
+(NDJSON) to stdout or ``--output``, in completion order:
+
+    qpy qrng --num-qubits 8 --length 16
+    qpy bell --repeat 100 --noise
+    qpy sweep --depths 1..500 --workers 4
+    qpy vqe --distances 0.5..2.5:0.25
+    qpy run jobs.jsonl --workers 4
+
+A manifest (``qpy run``) is a JSON array or JSON Lines file of job objects,
+each with a ``task`` (``qrng``, ``bell``, ``sweep`` or ``vqe``), that task's
+parameters and an optional ``id``:
+
+    {"id": "a", "task": "sweep", "depth": 12, "noise": true}
+    {"task": "vqe", "distance": 0.9, "max_iters": 30}
+
+Every output line carries the job's ``id`` (its manifest index by
+default), ``task``, ``params`` and either ``result`` or ``error``. The exit
+status is 1 if any job failed.
+
+``qpy --profile [--profile-format collapsed] <command>`` (or
+``QPY_PROFILE=pstats|collapsed``) profiles the command, including its
+worker tasks, or each menu action, and writes the profiles to
+``$QPY_PROFILE_DIR`` (see ``quantumpytho.profiling``).
+
+Heavy imports (Qiskit, the worker pool) happen only once a subcommand
+runs, so the menu and ``--help`` start quickly.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field
+from typing import IO, Any
+
+# task name -> (parameter name -> type). Jobs with unknown parameters are
+# rejected before anything runs.
+TASK_PARAMS: dict[str, dict[str, type]] = {
+    "qrng": {"num_qubits": int, "length": int},
+    "bell": {"noise": bool},
+    "sweep": {"depth": int, "noise": bool},
+    "vqe": {
+        "distance": float,
+        "max_iters": int,
+        "basis": str,
+        "mapper": str,
+        "mode": str,
+        "optimizer": str,
+    },
+}
+
+
+@dataclass
+class Job:
+    id: Any
+    task: str
+    params: dict[str, Any] = field(default_factory=dict)
+
+
+def parse_range(text: str, kind: type = int) -> list:
+    """
+    Parse a comma-separated list of values and inclusive ranges:
+    ``"1..500"``, ``"1,2,5..10"``, ``"0.5..2.5:0.25"`` (with a step).
+    """
+    values: list = []
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        if ".." not in part:
+            values.append(kind(part))
+            continue
+        bounds, _, step_text = part.partition(":")
+        start_text, _, stop_text = bounds.partition("..")
+        start, stop = kind(start_text), kind(stop_text)
+        step = kind(step_text) if step_text else kind(1)
+        if step <= 0:
+            raise ValueError(f"Range step must be positive: {part!r}")
+        if stop < start:
+            raise ValueError(f"Range stop is below its start: {part!r}")
+        n = int(round((stop - start) / step))
+        values.extend(start + i * step for i in range(n + 1))
+    if kind is float:
+        values = [round(v, 10) for v in values]
+    return values
+
+
+def _range_arg(kind: type):
+    def parse(text: str) -> list:
+        try:
+            return parse_range(text, kind)
+        except ValueError as e:
+            raise argparse.ArgumentTypeError(str(e)) from None
+
+    return parse
+
+
+def make_job(spec: Any, index: int) -> Job:
+    """Validate one manifest entry and turn it into a ``Job``."""
+    if not isinstance(spec, dict):
+        raise ValueError(f"Job {index}: expected an object, got {spec!r}")
+    spec = dict(spec)
+    task = spec.pop("task", None)
+    job_id = spec.pop("id", index)
+    if task not in TASK_PARAMS:
+        raise ValueError(
+            f"Job {job_id}: unknown task {task!r} "
+            f"(expected one of {', '.join(TASK_PARAMS)})"
+        )
+    types = TASK_PARAMS[task]
+    unknown = set(spec) - set(types)
+    if unknown:
+        raise ValueError(
+            f"Job {job_id}: unknown parameter(s) for {task}: "
+            f"{', '.join(sorted(unknown))}"
+        )
+    if task == "sweep" and "depth" not in spec:
+        raise ValueError(f"Job {job_id}: sweep needs a depth")
+    params = {}
+    for name, value in spec.items():
+        if types[name] is bool and not isinstance(value, bool):
+            # bool("false") is True; only accept real booleans.
+            raise ValueError(
+                f"Job {job_id}: {name} must be true or false, got {value!r}"
+            )
+        params[name] = types[name](value)
+    return Job(job_id, task, params)
+
+
+def load_manifest(stream: IO[str]) -> list[Job]:
+    """Read jobs from a JSON array or a JSON Lines document."""
+    text = stream.read()
+    if text.lstrip().startswith("["):
+        specs = json.loads(text)
+    else:
+        specs = [json.loads(line) for line in text.splitlines() if line.strip()]
+    return [make_job(spec, i) for i, spec in enumerate(specs)]
+
+
+def submit_job(pool, job: Job) -> Future:
+    """Submit ``job`` to a ``SimulationPool``; batch tasks skip drawing."""
+    from . import tasks
+
+    params = dict(job.params)
+    if job.task == "vqe":
+        return pool.submit(tasks.vqe_point_task, **params)
+    noisy = params.pop("noise", False)
+    if job.task == "qrng":
+        fn = tasks.qrng_task
+        params.setdefault("num_qubits", 8)
+        params.setdefault("length", 16)
+    elif job.task == "bell":
+        fn = tasks.bell_task
+        params["draw"] = False
+    else:
+        fn = tasks.hadamard_task
+        params["draw"] = False
+    return pool.submit_with_engine(fn, noisy=noisy, **params)
+
+
+def run_jobs(
+    jobs: Iterable[Job], workers: int = 1, shots: int | None = None
+) -> Iterator[dict[str, Any]]:
+    """
+    Run ``jobs`` on a ``SimulationPool`` and yield one record per job as it
+    finishes. ``workers=1`` runs on a single in-process thread, more workers
+    use worker processes. At most ``2 * workers`` jobs are in flight, so
+    large manifests are not materialized as futures up front.
+    """
+    from .config import QuantumConfig
+    from .workers import SimulationPool
+
+    config = QuantumConfig() if shots is None else QuantumConfig(shots=shots)
+    window = 2 * workers
+    # Slots are released by a done-callback that can lag behind ``wait``;
+    # the larger queue keeps those stragglers from tripping backpressure.
+    pool = SimulationPool(
+        workers=workers,
+        max_queue=2 * window,
+        config=config,
+        use_processes=workers > 1,
+    )
+    pending: dict[Future, Job] = {}
+    jobs = iter(jobs)
+    try:
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < window:
+                job = next(jobs, None)
+                if job is None:
+                    exhausted = True
+                else:
+                    pending[submit_job(pool, job)] = job
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                job = pending.pop(future)
+                record = {"id": job.id, "task": job.task, "params": job.params}
+                try:
+                    record["result"] = future.result()
+                except Exception as e:
+                    record["error"] = f"{type(e).__name__}: {e}"
+                yield record
+    finally:
+        pool.shutdown(wait=True)
+
+
+def _jobs_from_args(args: argparse.Namespace) -> list[Job]:
+    if args.command == "run":
+        return load_manifest(args.manifest)
+    if args.command == "qrng":
+        params = {"num_qubits": args.num_qubits, "length": args.length}
+        specs = [params] * args.repeat
+    elif args.command == "bell":
+        specs = [{"noise": args.noise}] * args.repeat
+    elif args.command == "sweep":
+        specs = [{"depth": d, "noise": args.noise} for d in args.depths]
+    else:
+        specs = [
+            {
+                "distance": d,
+                "max_iters": args.max_iters,
+                "basis": args.basis,
+                "mapper": args.mapper,
+                "mode": args.mode,
+                "optimizer": args.optimizer,
+            }
+            for d in args.distances
+        ]
+    return [make_job({"task": args.command, **spec}, i) for i, spec in enumerate(specs)]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="qpy",
+        description="QuantumPytho. Without a command, starts the interactive menu.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="profile the command (or each menu action) and save the profile",
+    )
+    parser.add_argument(
+        "--profile-format",
+        choices=("pstats", "collapsed"),
+        default="pstats",
+        help="cProfile stats or sampled collapsed stacks (default: pstats)",
+    )
+    sub = parser.add_subparsers(dest="command", metavar="command")
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--workers", type=int, default=1, help="parallel workers (default: 1)"
+    )
+    common.add_argument("--shots", type=int, help="shots per circuit")
+    common.add_argument(
+        "--output",
+        type=argparse.FileType("w", encoding="utf-8"),
+        default=sys.stdout,
+        help="NDJSON output file (default: stdout)",
+    )
+
+    qrng = sub.add_parser("qrng", parents=[common], help="QRNG φ-sequences")
+    qrng.add_argument("--num-qubits", type=int, default=8)
+    qrng.add_argument("--length", type=int, default=16)
+    qrng.add_argument("--repeat", type=int, default=1)
+
+    bell = sub.add_parser("bell", parents=[common], help="Bell-pair counts")
+    bell.add_argument("--noise", action="store_true")
+    bell.add_argument("--repeat", type=int, default=1)
+
+    sweep = sub.add_parser("sweep", parents=[common], help="Hadamard sweeps")
+    sweep.add_argument(
+        "--depths",
+        type=_range_arg(int),
+        default=[3],
+        help="depths, e.g. 1..500 or 1,3,5 (default: 3)",
+    )
+    sweep.add_argument("--noise", action="store_true")
+
+    from .modules.vqe_h2_exact import (
+        DEFAULT_BOND_LENGTH,
+        MAPPERS,
+        OPTIMIZERS,
+        VQE_MODES,
+    )
+
+    vqe = sub.add_parser("vqe", parents=[common], help="H₂ VQE ground states")
+    vqe.add_argument(
+        "--distances",
+        type=_range_arg(float),
+        default=[DEFAULT_BOND_LENGTH],
+        help=f"bond lengths in Å, e.g. 0.5..2.5:0.25 (default: {DEFAULT_BOND_LENGTH})",
+    )
+    vqe.add_argument("--max-iters", type=int, default=50)
+    vqe.add_argument("--basis", default="sto3g")
+    vqe.add_argument("--mapper", choices=MAPPERS, default="parity")
+    vqe.add_argument(
+        "--mode",
+        choices=VQE_MODES,
+        default="exact",
+        help="energy evaluation: exact statevector, sampled shots with "
+        "grouped Pauli terms, or the Aer estimator (default: exact)",
+    )
+    vqe.add_argument("--optimizer", choices=OPTIMIZERS, default="cobyla")
+
+    run = sub.add_parser("run", parents=[common], help="run a job manifest")
+    run.add_argument(
+        "manifest",
+        type=argparse.FileType("r", encoding="utf-8"),
+        help="JSON array or JSON Lines file of jobs ('-' for stdin)",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    profile = args.profile_format if args.profile else None
+    if profile is None and os.environ.get("QPY_PROFILE"):
+        from .profiling import parse_format
+
+        try:
+            profile = parse_format(os.environ["QPY_PROFILE"])
+        except ValueError as e:
+            parser.error(str(e))
+    if args.command is None:
+        from .menu import run_app
+
+        run_app(profile=profile)
+        return 0
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    try:
+        jobs = _jobs_from_args(args)
+    except (ValueError, TypeError) as e:
+        parser.error(str(e))
+
+    if profile is None:
+        return _run_command(args, jobs)
+    from .profiling import Profile
+
+    with Profile(profile) as prof:
+        status = _run_command(args, jobs)
+    print(f"profile written to {prof.save(f'qpy-{args.command}')}", file=sys.stderr)
+    return status
+
+
+def _run_command(args: argparse.Namespace, jobs: list[Job]) -> int:
+    from .encoding import json_default
+
+    failed = False
+    try:
+        for record in run_jobs(jobs, workers=args.workers, shots=args.shots):
+            failed = failed or "error" in record
+            args.output.write(
+                json.dumps(record, ensure_ascii=False, default=json_default) + "\n"
+            )
+            args.output.flush()
+    except BrokenPipeError:
+        # Reader went away (e.g. ``qpy sweep ... | head``); stop quietly.
+        sys.stdout = None
+        return 1
+    return 1 if failed else 0
@@ -5,3 +5,24 @@ from dataclasses import dataclass
 class QuantumConfig:
     backend_name: str = "automatic"
     shots: int = 1024
+    circuit_cache_size: int = 128
+    # Noisy runs up to this width use the exact density-matrix method; wider
+    # circuits fall back to statevector trajectory sampling.
+    density_matrix_max_qubits: int = 10
+    # Ideal circuits up to this width that only measure at the end are
+    # evaluated exactly from the statevector and sampled, skipping Aer.
+    # 0 disables the analytic fast path.
+    analytic_max_qubits: int = 12
+    # Return counts as array-backed CountsArray mappings instead of dicts.
+    compact_counts: bool = False
+    # With backend_name "automatic", ideal circuits narrower than this run as
+    # statevectors; wider ones on the stabilizer method if Clifford-only, as
+    # matrix product states if no cut between neighbouring qubits is crossed
+    # by more than mps_max_cut_gates multi-qubit gates, else as statevectors.
+    auto_method_min_qubits: int = 20
+    mps_max_cut_gates: int = 4
+    # Aer parallelism and memory limits; 0 keeps Aer's default (all cores,
+    # automatic shot-level parallelism, memory sized from the system).
+    max_parallel_threads: int = 0
+    max_parallel_shots: int = 0
+    max_memory_mb: int = 0
@@ -0,0 +1,125 @@
+"""
+Array-backed measurement counts.
+
+``CountsArray`` keeps outcomes as integer clbit values (clbit ``i`` is bit
+``i``) next to an int64 array of counts, in the order the backend
+reported them. It is a read-only ``Mapping[str, int]``, so code written
+for Qiskit count dicts keeps working; the bitstring dict is only built
+the first time it is needed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class CountsArray(Mapping):
+    """
+    Counts as parallel ``outcomes`` / ``counts`` arrays.
+
+    ``creg_sizes`` are the classical register sizes in circuit order; keys
+    are formatted like Qiskit count keys, one space-separated group per
+    register with the last register first.
+    """
+
+    __slots__ = ("outcomes", "counts", "num_clbits", "creg_sizes", "_dict")
+
+    def __init__(
+        self,
+        outcomes: np.ndarray,
+        counts: np.ndarray,
+        num_clbits: int,
+        creg_sizes: Sequence[int] | None = None,
+    ):
+        self.outcomes = outcomes
+        self.counts = counts
+        self.num_clbits = num_clbits
+        self.creg_sizes = tuple(creg_sizes or (num_clbits,))
+        self._dict: dict[str, int] | None = None
+
+    @classmethod
+    def from_hex(
+        cls,
+        data: Mapping[str, int],
+        num_clbits: int,
+        creg_sizes: Sequence[int] | None = None,
+    ) -> CountsArray:
+        """From Aer's raw experiment counts (``{"0x3": n, ...}``)."""
+        import numpy as np
+
+        dtype = np.uint64 if num_clbits <= 64 else object
+        outcomes = np.fromiter(
+            (int(key, 16) for key in data), dtype=dtype, count=len(data)
+        )
+        counts = np.fromiter(data.values(), dtype=np.int64, count=len(data))
+        return cls(outcomes, counts, num_clbits, creg_sizes)
+
+    def key(self, value: int) -> str:
+        """Qiskit count key for clbit value ``value``."""
+        bits = format(value, f"0{self.num_clbits}b")
+        if len(self.creg_sizes) == 1:
+            return bits
+        groups, end = [], len(bits)
+        for size in self.creg_sizes:
+            groups.append(bits[end - size : end])
+            end -= size
+        return " ".join(reversed(groups))
+
+    def to_dict(self) -> dict[str, int]:
+        """The ``{bitstring: count}`` dict, built once and cached."""
+        if self._dict is None:
+            self._dict = {
+                self.key(int(v)): int(n)
+                for v, n in zip(
+                    self.outcomes.tolist(), self.counts.tolist(), strict=True
+                )
+            }
+        return self._dict
+
+    def __getitem__(self, key: str) -> int:
+        return self.to_dict()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_dict())
+
+    def __len__(self) -> int:
+        return len(self.outcomes)
+
+    def __repr__(self) -> str:
+        return f"CountsArray({self.to_dict()!r})"
+
+    @property
+    def shots(self) -> int:
+        return int(self.counts.sum())
+
+    def as_json(self) -> dict[str, Any]:
+        """Columnar JSON form: integer outcomes and counts, no bitstrings."""
+        return {
+            "outcomes": self.outcomes.tolist(),
+            "counts": self.counts.tolist(),
+            "num_clbits": self.num_clbits,
+            "creg_sizes": list(self.creg_sizes),
+        }
+
+
+def merge_counts(parts: Sequence[CountsArray]) -> CountsArray:
+    """
+    Sum counts of the same circuit from several runs. Outcomes come out in
+    ascending order, so the result does not depend on the order of
+    ``parts`` or of outcomes within them.
+    """
+    import numpy as np
+
+    if not parts:
+        raise ValueError("merge_counts needs at least one CountsArray")
+    first = parts[0]
+    outcomes, inverse = np.unique(
+        np.concatenate([p.outcomes for p in parts]), return_inverse=True
+    )
+    counts = np.zeros(len(outcomes), dtype=np.int64)
+    np.add.at(counts, inverse.reshape(-1), np.concatenate([p.counts for p in parts]))
+    return CountsArray(outcomes, counts, first.num_clbits, first.creg_sizes)
@@ -0,0 +1,199 @@
+"""
+Response encodings chosen by HTTP content negotiation.
+
+Payloads are plain dicts that may hold NumPy arrays and ``CountsArray``
+counts. ``encode`` renders one in the media type picked by ``negotiate``:
+
+  - JSON (default): arrays become lists; complex arrays become
+    ``[re, im]`` pairs, as the API has always returned them.
+  - MessagePack (``application/msgpack``, needs ``msgpack``): arrays
+    become maps ``{"dtype", "shape", "data"}`` whose ``data`` is the raw
+    array buffer (NumPy dtype string such as ``"<f8"`` or ``"<c16"``), so
+    ``np.frombuffer(data, dtype).reshape(shape)`` restores them.
+  - Arrow IPC stream (``application/vnd.apache.arrow.stream``, needs
+    ``pyarrow``): one record batch with one row. Nested keys are flattened
+    to dotted column names. Each array is a ``list<...>`` column holding
+    the flattened buffer, with its ``shape`` in the field metadata. Complex
+    arrays are stored as interleaved re/im floats and marked
+    ``complex: true``. Values that are neither arrays nor scalars (e.g.
+    lists of objects) are JSON strings.
+
+Array buffers go to MessagePack and Arrow as-is, without per-element
+Python conversion.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from typing import Any
+
+from .counts import CountsArray
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+ARROW = "application/vnd.apache.arrow.stream"
+
+_ALIASES = {
+    "application/x-msgpack": MSGPACK,
+    "application/vnd.msgpack": MSGPACK,
+}
+_MODULES = {MSGPACK: "msgpack", ARROW: "pyarrow"}
+
+
+class NotAcceptable(Exception):
+    """No media type in the ``Accept`` header can be produced."""
+
+
+def _available(media: str) -> bool:
+    try:
+        __import__(_MODULES[media])
+    except ImportError:
+        return False
+    return True
+
+
+def negotiate(accept: str | None) -> str:
+    """
+    Media type to answer with for an ``Accept`` header: the acceptable type
+    with the highest ``q`` (earlier wins ties) among JSON, MessagePack and
+    Arrow. Wildcards and a missing header mean JSON. Binary types whose
+    library is not installed are skipped.
+    """
+    if not accept:
+        return JSON
+    ranked = []
+    for position, part in enumerate(accept.split(",")):
+        media, *params = (p.strip() for p in part.split(";"))
+        q = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    q = float(param[2:])
+                except ValueError:
+                    q = 0.0
+        if q > 0:
+            media = media.lower()
+            ranked.append((-q, position, _ALIASES.get(media, media)))
+    missing = []
+    for _, _, media in sorted(ranked):
+        if media in (JSON, "application/*", "*/*"):
+            return JSON
+        if media in _MODULES:
+            if _available(media):
+                return media
+            missing.append(_MODULES[media])
+    hint = f" (pip install {' '.join(missing)})" if missing else ""
+    raise NotAcceptable(
+        f"Can only produce {JSON}, {MSGPACK} or {ARROW}; got {accept!r}{hint}"
+    )
+
+
+def to_jsonable(obj: Any) -> Any:
+    """Copy of ``obj`` with arrays, NumPy scalars and counts made JSON-ready."""
+    if isinstance(obj, dict):
+        return {key: to_jsonable(value) for key, value in obj.items()}
+    if isinstance(obj, list | tuple):
+        return [to_jsonable(value) for value in obj]
+    return json_default(obj) if _is_numpy(obj) or isinstance(obj, CountsArray) else obj
+
+
+def json_default(obj: Any) -> Any:
+    """``default`` hook for ``json.dumps`` handling arrays and counts."""
+    import numpy as np
+
+    if isinstance(obj, CountsArray):
+        return obj.as_json()
+    if isinstance(obj, np.ndarray):
+        if np.iscomplexobj(obj):
+            return np.stack([obj.real, obj.imag], axis=-1).tolist()
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _is_numpy(obj: Any) -> bool:
+    return type(obj).__module__ == "numpy"
+
+
+def encode(payload: Any, media: str) -> bytes:
+    """Serialize ``payload`` as ``media`` (one of ``negotiate``'s results)."""
+    if media == MSGPACK:
+        import msgpack
+
+        return msgpack.packb(payload, default=_msgpack_default, use_bin_type=True)
+    if media == ARROW:
+        return _arrow_stream(payload)
+    return json.dumps(payload, default=json_default, ensure_ascii=False).encode()
+
+
+def _msgpack_default(obj: Any) -> Any:
+    import numpy as np
+
+    if isinstance(obj, CountsArray):
+        return {
+            "outcomes": obj.outcomes,
+            "counts": obj.counts,
+            "num_clbits": obj.num_clbits,
+            "creg_sizes": list(obj.creg_sizes),
+        }
+    if isinstance(obj, np.ndarray):
+        if obj.dtype == object:
+            return obj.tolist()
+        arr = np.ascontiguousarray(obj)
+        return {"dtype": arr.dtype.str, "shape": list(arr.shape), "data": arr.tobytes()}
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Cannot encode {type(obj).__name__} as MessagePack")
+
+
+def _flatten(obj: Any, prefix: str = "") -> Iterator[tuple[str, Any]]:
+    if isinstance(obj, CountsArray):
+        obj = {
+            "outcomes": obj.outcomes,
+            "counts": obj.counts,
+            "num_clbits": obj.num_clbits,
+            "creg_sizes": list(obj.creg_sizes),
+        }
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            yield from _flatten(value, f"{prefix}{key}.")
+    else:
+        yield prefix[:-1], obj
+
+
+def _arrow_stream(payload: Any) -> bytes:
+    import numpy as np
+    import pyarrow as pa
+
+    fields, columns = [], []
+    for name, value in _flatten(payload):
+        metadata = None
+        if isinstance(value, list | tuple) and all(
+            isinstance(v, int | float) and not isinstance(v, bool) for v in value
+        ):
+            value = np.asarray(value)
+        if isinstance(value, np.ndarray):
+            arr = np.ascontiguousarray(value)
+            metadata = {"shape": json.dumps(list(arr.shape))}
+            if np.iscomplexobj(arr):
+                arr = arr.view(arr.real.dtype)
+                metadata["complex"] = "true"
+            flat = arr.reshape(-1)
+            values = pa.array([str(v) for v in flat] if flat.dtype == object else flat)
+            offsets = pa.array([0, len(flat)], type=pa.int32())
+            column = pa.ListArray.from_arrays(offsets, values)
+        elif value is None or isinstance(value, bool | int | float | str | np.generic):
+            column = pa.array([value.item() if _is_numpy(value) else value])
+        else:
+            column = pa.array([json.dumps(value, default=json_default)])
+            metadata = {"json": "true"}
+        fields.append(pa.field(name, column.type, metadata=metadata))
+        columns.append(column)
+
+    batch = pa.RecordBatch.from_arrays(columns, schema=pa.schema(fields))
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema) as writer:
+        writer.write_batch(batch)
+    return sink.getvalue().to_pybytes()
@@ -1,39 +1,579 @@
-from dataclasses import dataclass
-from typing import Any
+from __future__ import annotations
 
-from qiskit import QuantumCircuit
-from qiskit_aer import AerSimulator
+import math
+import sys
+import time
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
+from .analytic import exact_distribution, measured_qubits, sample
+from .circuit_cache import CircuitCache
 from .config import QuantumConfig
+from .counts import CountsArray
+from .methods import CLIFFORD_GATES, NON_UNITARY_OPS, is_clifford, select_method
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+if TYPE_CHECKING:
+    import numpy as np
+    from qiskit import QuantumCircuit
+    from qiskit_aer import AerSimulator
+    from qiskit_aer.noise import NoiseModel
+
+    from .analytic import ExactDistribution
+    from .modules.decoherence_toggle import DecoherenceController
 
 
 @dataclass
 class QuantumResult:
     circuit: QuantumCircuit
-    counts: dict[str, int]
+    # A plain dict, or a ``CountsArray`` (a read-only Mapping) for compact runs.
+    counts: Mapping[str, int]
     meta: dict[str, Any]
+    memory: list[str] | None = None
+    # Exact outcome probabilities, set when the analytic fast path was used.
+    probabilities: dict[str, float] | None = None
+
+
+@dataclass
+class SweepResult:
+    """
+    Counts of one parameterized circuit over many parameter sets.
+
+    ``values[i]`` holds the values of ``parameters`` for point ``i`` and
+    ``counts[i, j]`` how often outcome ``outcomes[j]`` was measured there.
+    """
+
+    circuit: QuantumCircuit
+    parameters: tuple[str, ...]
+    values: np.ndarray
+    outcomes: tuple[str, ...]
+    counts: np.ndarray
+    meta: dict[str, Any]
+
+    def counts_dict(self, point: int) -> dict[str, int]:
+        """Counts of ``point`` in the usual ``{bitstring: count}`` form."""
+        return {
+            key: int(n)
+            for key, n in zip(self.outcomes, self.counts[point], strict=True)
+            if n
+        }
+
+    def probabilities(self) -> np.ndarray:
+        """Per-point outcome frequencies, ``counts / shots``."""
+        return self.counts / self.meta["shots"]
+
+
+def _peak_rss_mb() -> float | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
 
 
 class QuantumEngine:
     """
     Thin abstraction around Qiskit backends so modules
     don't have to care about simulator vs hardware.
+
+    Construction is cheap: Qiskit and the Aer backend are only imported
+    and built on first use (see ``backend``).
     """
 
-    def __init__(self, config: QuantumConfig | None = None):
+    def __init__(
+        self,
+        config: QuantumConfig | None = None,
+        decoherence: DecoherenceController | None = None,
+    ):
         self.config = config or QuantumConfig()
-        self._backend = AerSimulator(method=self.config.backend_name)
-
-    def run(self, circuit: QuantumCircuit, label: str = "") -> QuantumResult:
-        job = self._backend.run(circuit, shots=self.config.shots)
-        result = job.result()
-        counts = result.get_counts(circuit)
-        return QuantumResult(
-            circuit=circuit,
+        self.decoherence = decoherence
+        self._backend: AerSimulator | None = None
+        self._pass_managers: dict[tuple[int | None, str], Any] = {}
+        self._rng = None
+        self.circuit_cache = CircuitCache(self.config.circuit_cache_size)
+
+    @property
+    def backend(self) -> AerSimulator:
+        if self._backend is None:
+            from qiskit_aer import AerSimulator
+
+            limits = {
+                name: value
+                for name in (
+                    "max_parallel_threads",
+                    "max_parallel_shots",
+                    "max_memory_mb",
+                )
+                if (value := getattr(self.config, name))
+            }
+            self._backend = AerSimulator(method=self.config.backend_name, **limits)
+        return self._backend
+
+    def _pass_manager(self, optimization_level: int | None, basis: str = "target"):
+        """
+        Preset pass manager for ``optimization_level`` (Qiskit's default when
+        None), built once per engine. Building one is far more expensive than
+        running it on a small circuit: every access to ``AerSimulator.target``
+        reconstructs the target.
+
+        ``basis`` is ``"target"`` (Aer's statevector target), ``"standard"``
+        (the standard gates Aer supports, without the target's width limit;
+        for circuits that only stabilizer/MPS methods can hold) or
+        ``"clifford"`` (Clifford gates only, so a Clifford circuit stays
+        runnable on the stabilizer method).
+        """
+        key = (optimization_level, basis)
+        pm = self._pass_managers.get(key)
+        if pm is None:
+            from qiskit.transpiler import generate_preset_pass_manager
+
+            level = 2 if optimization_level is None else optimization_level
+            if basis == "target":
+                pm = generate_preset_pass_manager(level, target=self.backend.target)
+            else:
+                from qiskit.circuit import CONTROL_FLOW_OP_NAMES
+                from qiskit.circuit.library.standard_gates import (
+                    get_standard_gate_name_mapping,
+                )
+
+                known = set(get_standard_gate_name_mapping())
+                known |= set(CONTROL_FLOW_OP_NAMES)
+                if basis == "clifford":
+                    names = CLIFFORD_GATES | NON_UNITARY_OPS
+                    names |= set(CONTROL_FLOW_OP_NAMES)
+                else:
+                    names = set(self.backend.operation_names)
+                gates = sorted(n for n in names if n in known)
+                pm = generate_preset_pass_manager(level, basis_gates=gates)
+            self._pass_managers[key] = pm
+        return pm
+
+    def _compile(
+        self, circuit: QuantumCircuit, optimization_level: int | None = None
+    ) -> QuantumCircuit:
+        wide = circuit.num_qubits > self.backend.num_qubits
+        basis = "standard" if wide else "target"
+        return self._pass_manager(optimization_level, basis).run(circuit)
+
+    def _compile_noisy(self, circuit: QuantumCircuit) -> QuantumCircuit:
+        # No optimization: cancelling e.g. H·H pairs would also drop the
+        # noise those gates are supposed to accumulate.
+        return self._compile(circuit, optimization_level=0)
+
+    def _compile_automatic(self, circuit: QuantumCircuit) -> tuple[QuantumCircuit, str]:
+        """Compile an ideal circuit and pick its method (``methods``)."""
+        min_qubits = self.config.auto_method_min_qubits
+        if circuit.num_qubits >= min_qubits and is_clifford(circuit):
+            # Keep Clifford circuits in Clifford gates; the default
+            # resynthesis would turn e.g. S·H into a u2 gate.
+            compiled = self._pass_manager(None, "clifford").run(circuit)
+        else:
+            compiled = self._compile(circuit)
+        method = select_method(
+            compiled,
+            min_qubits,
+            self.config.mps_max_cut_gates,
+            self._statevector_max_qubits(),
+        )
+        return compiled, method
+
+    def _statevector_max_qubits(self) -> int:
+        """Widest statevector that fits ``config.max_memory_mb`` (or Aer's)."""
+        if self.config.max_memory_mb:
+            return int(math.log2(self.config.max_memory_mb * 2**20 / 16))
+        return self.backend.num_qubits
+
+    def _prepare(
+        self, circuit: QuantumCircuit, noisy: bool
+    ) -> tuple[QuantumCircuit, str]:
+        """
+        Compiled circuit and simulation method, cached per circuit structure.
+
+        With ``backend_name="automatic"`` ideal circuits get the cheapest
+        suitable method (see ``quantumpytho.methods``); any other backend
+        name is used as given. Noisy circuits use the density-matrix method
+        up to ``config.density_matrix_max_qubits`` (exact, one pass for all
+        shots) and per-shot statevector trajectories beyond that.
+        """
+        if noisy:
+            compiled = self.circuit_cache.get_or_compile(
+                circuit, self._compile_noisy, "noisy"
+            )
+            if circuit.num_qubits <= self.config.density_matrix_max_qubits:
+                return compiled, "density_matrix"
+            return compiled, "statevector"
+        if self.config.backend_name != "automatic":
+            compiled = self.circuit_cache.get_or_compile(circuit, self._compile)
+            return compiled, self.config.backend_name
+        return self.circuit_cache.get_or_compile(
+            circuit, self._compile_automatic, "automatic"
+        )
+
+    def _noise_model(self) -> NoiseModel | None:
+        return self.decoherence.noise_model() if self.decoherence else None
+
+    def run(
+        self,
+        circuit: QuantumCircuit,
+        label: str = "",
+        shots: int | None = None,
+        memory: bool = False,
+        timings: Mapping[str, float] | None = None,
+        compact: bool | None = None,
+        seed: int | None = None,
+    ) -> QuantumResult:
+        return self.run_batch(
+            [circuit],
+            [label],
+            shots=shots,
+            memory=memory,
+            timings=timings,
+            compact=compact,
+            seed=seed,
+        )[0]
+
+    def run_sharded(
+        self,
+        circuit: QuantumCircuit,
+        shots: int | None = None,
+        seed: int | None = None,
+        workers: int | None = None,
+        chunk_shots: int | None = None,
+        label: str = "",
+        compact: bool | None = None,
+    ) -> QuantumResult:
+        """
+        Run a large shot budget in seeded chunks on ``workers`` processes
+        with this engine's config and noise settings. The counts are
+        identical for the same ``seed`` and ``chunk_shots`` whatever the
+        worker count (see ``quantumpytho.sharding``).
+        """
+        from .sharding import DEFAULT_CHUNK_SHOTS, run_sharded
+
+        noisy = self.decoherence is not None and self.decoherence.enabled
+        return run_sharded(
+            circuit,
+            shots or self.config.shots,
+            seed=seed,
+            workers=workers,
+            chunk_shots=chunk_shots or DEFAULT_CHUNK_SHOTS,
+            config=self.config,
+            noise=self.decoherence.params if noisy else None,
+            compact=compact,
+            label=label,
+        )
+
+    def _analytic(self, circuit: QuantumCircuit) -> ExactDistribution | None:
+        """
+        Exact distribution of ``circuit`` when it qualifies for the analytic
+        fast path (see ``quantumpytho.analytic``), cached like compilations.
+        The distribution holds formatted count keys, which is safe because
+        ``circuit_key`` covers the classical register layout.
+        """
+        limit = self.config.analytic_max_qubits
+        if circuit.num_qubits > limit or measured_qubits(circuit) is None:
+            return None
+        return self.circuit_cache.get_or_compile(
+            circuit, lambda c: exact_distribution(c, limit), "analytic"
+        )
+
+    @property
+    def rng(self):
+        """NumPy generator used to sample analytic-path counts."""
+        if self._rng is None:
+            import numpy as np
+
+            self._rng = np.random.default_rng()
+        return self._rng
+
+    def run_batch(
+        self,
+        circuits: Sequence[QuantumCircuit],
+        labels: Sequence[str] | None = None,
+        shots: int | None = None,
+        memory: bool = False,
+        timings: Mapping[str, float] | None = None,
+        compact: bool | None = None,
+        seed: int | None = None,
+    ) -> list[QuantumResult]:
+        """
+        Run several circuits as a single backend job.
+
+        Aer executes every experiment of one job together, so the job
+        setup cost is paid once instead of once per circuit. Results are
+        returned in the same order as ``circuits``. Compiled circuits are
+        reused from ``circuit_cache`` when a structurally identical circuit
+        was run before.
+
+        Without noise, circuits up to ``config.analytic_max_qubits`` wide
+        that only measure at the end skip the simulator: their exact
+        distribution is computed from the statevector (and cached), counts
+        are drawn from it with a multinomial and the result carries the
+        ``probabilities``. Such results report method ``"analytic"``.
+
+        ``shots`` overrides ``config.shots`` for this job. With
+        ``memory=True`` each result also carries the per-shot bitstrings.
+        With ``compact`` (default ``config.compact_counts``) ``counts`` is a
+        ``CountsArray``: integer outcomes and counts read straight from the
+        backend, with the bitstring dict only built if a caller indexes it.
+        A ``seed`` makes the job reproducible: it seeds Aer's simulator and
+        the analytic-path sampler.
+        When the engine's decoherence controller is enabled the job runs with
+        its noise model. ``meta["method"]`` is the simulation method used
+        for each circuit (see ``_prepare``); circuits needing different
+        methods run as one Aer job per method.
+
+        ``meta["timings"]`` holds per-stage wall times in seconds: transpile
+        (compile or cache lookup, whole job), queue (job submission and
+        result overhead outside Aer, whole job), simulate (Aer time, or the
+        exact evaluation, for this experiment) and counts (count/memory
+        extraction or sampling). Stages measured by the caller, such as
+        circuit build, can be passed in ``timings`` and are included.
+        ``meta`` also records circuit width and depth and the process peak
+        RSS in MiB.
+        """
+        circuits = list(circuits)
+        labels = [""] * len(circuits) if labels is None else list(labels)
+        if len(labels) != len(circuits):
+            raise ValueError(f"Got {len(labels)} labels for {len(circuits)} circuits.")
+        if not circuits:
+            return []
+        shots = shots or self.config.shots
+        if compact is None:
+            compact = self.config.compact_counts
+
+        noise_model = self._noise_model()
+        # index -> (counts, memory, probabilities, method, stage times)
+        outputs: dict[int, tuple] = {}
+        if noise_model is None and self.config.analytic_max_qubits > 0:
+            if seed is None:
+                rng = self.rng
+            else:
+                import numpy as np
+
+                rng = np.random.default_rng(seed)
+            for i, circuit in enumerate(circuits):
+                t0 = time.perf_counter()
+                dist = self._analytic(circuit)
+                if dist is None:
+                    continue
+                t1 = time.perf_counter()
+                counts, shot_memory = sample(dist, shots, rng, memory, compact)
+                stages = {
+                    "transpile": 0.0,
+                    "queue": 0.0,
+                    "simulate": t1 - t0,
+                    "counts": time.perf_counter() - t1,
+                }
+                outputs[i] = (counts, shot_memory, dist.as_dict(), "analytic", stages)
+
+        remaining = [i for i in range(len(circuits)) if i not in outputs]
+        if remaining:
+            outputs.update(
+                self._simulate(
+                    {i: circuits[i] for i in remaining},
+                    shots,
+                    memory,
+                    noise_model,
+                    compact,
+                    seed,
+                )
+            )
+
+        peak_rss = _peak_rss_mb()
+        results = []
+        for i, (circuit, label) in enumerate(zip(circuits, labels, strict=True)):
+            counts, shot_memory, probabilities, method, stages = outputs[i]
+            stage_times = {**(timings or {}), **stages}
+            results.append(
+                QuantumResult(
+                    circuit=circuit,
+                    counts=counts,
+                    meta={
+                        "label": label,
+                        "shots": shots,
+                        "backend": self.config.backend_name,
+                        "method": method,
+                        "noisy": noise_model is not None,
+                        "width": circuit.num_qubits,
+                        "depth": circuit.depth(),
+                        "peak_rss_mb": peak_rss,
+                        "timings": stage_times,
+                    },
+                    memory=shot_memory,
+                    probabilities=probabilities,
+                )
+            )
+        return results
+
+    def run_sweep(
+        self,
+        template: QuantumCircuit,
+        values: Any,
+        shots: int | None = None,
+        label: str = "",
+        timings: Mapping[str, float] | None = None,
+    ) -> SweepResult:
+        """
+        Run a parameterized ``template`` for many parameter sets in one job.
+
+        ``values`` is either a 2-D array of shape ``(points, parameters)``
+        whose columns follow ``template.parameters`` (Qiskit orders them by
+        name), or a mapping of ``Parameter`` (or parameter name) to a 1-D
+        sequence of values. The template is compiled once (and cached like
+        ``run_batch`` compilations) and Aer binds every parameter set itself,
+        so nothing is rebuilt or re-transpiled per point.
+
+        Returns a ``SweepResult`` whose ``counts`` array has one row per
+        parameter set. ``meta`` has the same fields as ``run_batch`` meta;
+        its simulate and counts timings are totals over all points.
+        """
+        import numpy as np
+
+        names = [p.name for p in template.parameters]
+        if not names:
+            raise ValueError("template has no parameters; use run() instead.")
+        if isinstance(values, Mapping):
+            by_name = {getattr(k, "name", k): v for k, v in values.items()}
+            missing = set(names) - set(by_name)
+            if missing:
+                raise ValueError(f"No values for parameter(s) {sorted(missing)}.")
+            columns = [np.asarray(by_name[n], dtype=np.float64) for n in names]
+            table = np.stack(np.broadcast_arrays(*columns), axis=-1)
+        else:
+            table = np.asarray(values, dtype=np.float64)
+        if table.ndim == 1:
+            # One value per point for a single parameter, else one point.
+            table = table[:, None] if len(names) == 1 else table[None, :]
+        if table.ndim != 2 or table.shape[1] != len(names):
+            raise ValueError(
+                f"Expected values of shape (points, {len(names)}) for parameters "
+                f"{names}, got {table.shape}."
+            )
+        shots = shots or self.config.shots
+
+        noise_model = self._noise_model()
+        t_start = time.perf_counter()
+        compiled, method = self._prepare(template, noise_model is not None)
+        t_compiled = time.perf_counter()
+        # Bind by name: a cache hit may hold an equal template built with
+        # other Parameter objects. Parameters the transpiler removed are
+        # simply not bound.
+        by_name = {p.name: p for p in compiled.parameters}
+        binds = {
+            by_name[n]: table[:, i].tolist()
+            for i, n in enumerate(names)
+            if n in by_name
+        }
+        options: dict[str, Any] = {"method": method}
+        if noise_model is not None:
+            options["noise_model"] = noise_model
+        if len(table):
+            job = self.backend.run(
+                compiled, shots=shots, parameter_binds=[binds], **options
+            )
+            result = job.result()
+            experiments = result.results
+        else:
+            result, experiments = None, []
+        t_done = time.perf_counter()
+        simulate = sum(r.time_taken or 0.0 for r in experiments)
+
+        per_point = [result.get_counts(i) for i in range(len(experiments))]
+        outcomes = sorted({key for c in per_point for key in c})
+        column = {key: j for j, key in enumerate(outcomes)}
+        counts = np.zeros((len(per_point), len(outcomes)), dtype=np.int64)
+        for i, c in enumerate(per_point):
+            for key, n in c.items():
+                counts[i, column[key]] = n
+        stage_times = dict(timings or {})
+        stage_times.update(
+            transpile=t_compiled - t_start,
+            queue=max(0.0, (t_done - t_compiled) - simulate),
+            simulate=simulate,
+            counts=time.perf_counter() - t_done,
+        )
+        return SweepResult(
+            circuit=template,
+            parameters=tuple(names),
+            values=table,
+            outcomes=tuple(outcomes),
             counts=counts,
             meta={
                 "label": label,
-                "shots": self.config.shots,
+                "shots": shots,
                 "backend": self.config.backend_name,
+                "method": method,
+                "noisy": noise_model is not None,
+                "width": template.num_qubits,
+                "depth": template.depth(),
+                "points": len(table),
+                "peak_rss_mb": _peak_rss_mb(),
+                "timings": stage_times,
             },
         )
+
+    def _simulate(
+        self,
+        circuits: dict[int, QuantumCircuit],
+        shots: int,
+        memory: bool,
+        noise_model: NoiseModel | None,
+        compact: bool = False,
+        seed: int | None = None,
+    ) -> dict[int, tuple]:
+        """
+        Run ``circuits`` (keyed by batch index) on Aer, one job per
+        simulation method.
+        """
+        t_start = time.perf_counter()
+        prepared = {
+            index: self._prepare(circuit, noise_model is not None)
+            for index, circuit in circuits.items()
+        }
+        t_compiled = time.perf_counter()
+        groups: dict[str, list[int]] = {}
+        for index, (_, method) in prepared.items():
+            groups.setdefault(method, []).append(index)
+
+        outputs = {}
+        for method, indices in groups.items():
+            options: dict[str, Any] = {"method": method}
+            if noise_model is not None:
+                options["noise_model"] = noise_model
+            if seed is not None:
+                options["seed_simulator"] = seed
+            t_job = time.perf_counter()
+            job = self.backend.run(
+                [prepared[i][0] for i in indices],
+                shots=shots,
+                memory=memory,
+                **options,
+            )
+            result = job.result()
+            queue = max(0.0, (time.perf_counter() - t_job) - (result.time_taken or 0.0))
+            for j, index in enumerate(indices):
+                circuit = circuits[index]
+                t0 = time.perf_counter()
+                if compact:
+                    counts = CountsArray.from_hex(
+                        result.results[j].data.counts,
+                        circuit.num_clbits,
+                        [reg.size for reg in circuit.cregs],
+                    )
+                else:
+                    counts = result.get_counts(j)
+                shot_memory = result.get_memory(j) if memory else None
+                stages = {
+                    "transpile": t_compiled - t_start,
+                    "queue": queue,
+                    "simulate": result.results[j].time_taken or 0.0,
+                    "counts": time.perf_counter() - t0,
+                }
+                outputs[index] = (counts, shot_memory, None, method, stages)
+        return outputs
@@ -0,0 +1,366 @@
+"""
+Persistent simulation jobs.
+
+``JobStore`` keeps jobs and their results in SQLite, so a submission
+survives the client disconnecting (and the server restarting). Identical
+submissions (same task and parameters) are deduplicated by content hash:
+while a matching job is queued or running, submitting again returns that
+job instead of creating a new one. Finished jobs are not reused, and
+sampled tasks (``SAMPLED_TASKS``, shot-based VQE) are never deduplicated,
+since each submission should draw fresh samples.
+
+``JobRunner`` is a dispatcher thread that claims queued jobs, highest
+``priority`` first then oldest, and runs them on a ``SimulationPool``. It
+keeps at most ``concurrency`` jobs in flight overall and at most
+``limits[task]`` per task.
+
+Tasks and their parameters are those of the ``qpy`` batch CLI
+(``cli.TASK_PARAMS``): ``qrng``, ``bell``, ``sweep`` and ``vqe``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from collections import Counter
+from collections.abc import Iterator, Mapping
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .cli import make_job, submit_job
+from .encoding import json_default
+
+if TYPE_CHECKING:
+    from .workers import SimulationPool
+
+STATES = ("queued", "running", "done", "failed")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    task TEXT NOT NULL,
+    params TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    state TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    created REAL NOT NULL,
+    started REAL,
+    finished REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_digest ON jobs (digest);
+CREATE INDEX IF NOT EXISTS jobs_queue ON jobs (state, priority DESC, created);
+"""
+
+_COLUMNS = (
+    "id, task, params, priority, state, result, error, created, started, finished"
+)
+
+
+@dataclass
+class JobRecord:
+    id: str
+    task: str
+    params: dict[str, Any]
+    priority: int
+    state: str
+    result: Any = None
+    error: str | None = None
+    created: float = 0.0
+    started: float | None = None
+    finished: float | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "task": self.task,
+            "params": self.params,
+            "priority": self.priority,
+            "state": self.state,
+            "result": self.result,
+            "error": self.error,
+            "created": self.created,
+            "started": self.started,
+            "finished": self.finished,
+        }
+
+
+# Tasks whose results are random samples; see ``deduplicates``.
+SAMPLED_TASKS = frozenset({"qrng", "bell", "sweep"})
+
+
+def deduplicates(task: str, params: Mapping[str, Any]) -> bool:
+    """Whether an identical live job may stand in for this submission."""
+    if task in SAMPLED_TASKS:
+        return False
+    return not (task == "vqe" and params.get("mode") == "shots")
+
+
+def job_digest(task: str, params: Mapping[str, Any]) -> str:
+    """Content hash of a submission: task name plus sorted parameters."""
+    payload = json.dumps({"task": task, "params": params}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class JobStore:
+    """SQLite-backed job table. One ``JobRunner`` should serve each file."""
+
+    def __init__(self, path: str | Path | None = None):
+        if path is None:
+            from .modules.vqe_cache import default_cache_dir
+
+            path = default_cache_dir() / "jobs.sqlite"
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _row_to_record(row) -> JobRecord:
+        id_, task, params, priority, state, result, error, *times = row
+        return JobRecord(
+            id=id_,
+            task=task,
+            params=json.loads(params),
+            priority=priority,
+            state=state,
+            result=None if result is None else json.loads(result),
+            error=error,
+            created=times[0],
+            started=times[1],
+            finished=times[2],
+        )
+
+    def submit(
+        self, task: str, params: Mapping[str, Any], priority: int = 0
+    ) -> tuple[JobRecord, bool]:
+        """
+        Queue a job, or return the queued or running job with the same
+        content (unless ``deduplicates`` says the task must run afresh).
+
+        ``params`` are validated and typed like a CLI manifest entry
+        (``ValueError`` if invalid). Returns ``(record, created)``. A
+        duplicate submitted with a higher ``priority`` than the queued job
+        raises that job's priority.
+        """
+        job = make_job({"task": task, **params}, 0)
+        digest = job_digest(job.task, job.params)
+        with self._connect() as conn:
+            row = None
+            if deduplicates(job.task, job.params):
+                row = conn.execute(
+                    f"SELECT {_COLUMNS} FROM jobs WHERE digest = ? "
+                    "AND state IN ('queued', 'running') "
+                    "ORDER BY created DESC LIMIT 1",
+                    (digest,),
+                ).fetchone()
+            if row is not None:
+                record = self._row_to_record(row)
+                if record.state == "queued" and priority > record.priority:
+                    conn.execute(
+                        "UPDATE jobs SET priority = ? WHERE id = ?",
+                        (priority, record.id),
+                    )
+                    record.priority = priority
+                return record, False
+            record = JobRecord(
+                id=uuid.uuid4().hex,
+                task=job.task,
+                params=job.params,
+                priority=priority,
+                state="queued",
+                created=time.time(),
+            )
+            conn.execute(
+                "INSERT INTO jobs (id, digest, task, params, priority, state, "
+                "created) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    record.id,
+                    digest,
+                    record.task,
+                    json.dumps(record.params),
+                    priority,
+                    record.state,
+                    record.created,
+                ),
+            )
+        return record, True
+
+    def get(self, job_id: str) -> JobRecord | None:
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return None if row is None else self._row_to_record(row)
+
+    def claim(self, exclude_tasks: tuple[str, ...] = ()) -> JobRecord | None:
+        """Mark the next queued job (not of ``exclude_tasks``) running."""
+        where = "state = 'queued'"
+        if exclude_tasks:
+            where += f" AND task NOT IN ({', '.join('?' * len(exclude_tasks))})"
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT {_COLUMNS} FROM jobs WHERE {where} "
+                "ORDER BY priority DESC, created LIMIT 1",
+                exclude_tasks,
+            ).fetchone()
+            if row is None:
+                return None
+            record = self._row_to_record(row)
+            record.state, record.started = "running", time.time()
+            conn.execute(
+                "UPDATE jobs SET state = 'running', started = ? WHERE id = ?",
+                (record.started, record.id),
+            )
+        return record
+
+    def requeue(self, job_id: str | None = None) -> int:
+        """
+        Put a running job (or, with no ``job_id``, every running job, e.g.
+        after a restart) back in the queue. Returns the number requeued.
+        """
+        query = "UPDATE jobs SET state = 'queued', started = NULL "
+        query += "WHERE state = 'running'"
+        args: tuple = ()
+        if job_id is not None:
+            query += " AND id = ?"
+            args = (job_id,)
+        with self._connect() as conn:
+            return conn.execute(query, args).rowcount
+
+    def finish(self, job_id: str, result: Any) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET state = 'done', result = ?, finished = ? WHERE id = ?",
+                (json.dumps(result, default=json_default), time.time(), job_id),
+            )
+
+    def fail(self, job_id: str, error: str) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET state = 'failed', error = ?, finished = ? "
+                "WHERE id = ?",
+                (error, time.time(), job_id),
+            )
+
+    def counts(self) -> dict[str, int]:
+        """Number of jobs per state."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT state, COUNT(*) FROM jobs GROUP BY state"
+            ).fetchall()
+        return {state: 0 for state in STATES} | dict(rows)
+
+
+class JobRunner:
+    """
+    Dispatch queued jobs from ``store`` to ``pool``.
+
+    At most ``concurrency`` jobs run at once, and at most ``limits[task]``
+    of a given task. The dispatcher wakes on ``notify()`` (call it after
+    submitting) and otherwise polls every ``poll`` seconds, which also picks
+    up jobs queued by other processes.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        pool: SimulationPool,
+        concurrency: int = 1,
+        limits: Mapping[str, int] | None = None,
+        poll: float = 1.0,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        self.store = store
+        self.pool = pool
+        self.concurrency = concurrency
+        self.limits = dict(limits or {})
+        self.poll = poll
+        self._running: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> JobRunner:
+        """Requeue jobs left running by a previous process, then dispatch."""
+        self.store.requeue()
+        self._thread = threading.Thread(target=self._loop, name="qpy-jobs", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, wait: bool = True) -> None:
+        self._stop.set()
+        self._wake.set()
+        if wait and self._thread is not None:
+            self._thread.join()
+
+    def notify(self) -> None:
+        self._wake.set()
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            self._wake.clear()
+            self._dispatch()
+            self._wake.wait(self.poll)
+
+    def _dispatch(self) -> None:
+        from .workers import PoolSaturated
+
+        while True:
+            with self._lock:
+                if sum(self._running.values()) >= self.concurrency:
+                    return
+                full = tuple(
+                    task
+                    for task, limit in self.limits.items()
+                    if self._running[task] >= limit
+                )
+            record = self.store.claim(exclude_tasks=full)
+            if record is None:
+                return
+            job = make_job({"task": record.task, **record.params}, 0)
+            try:
+                future = submit_job(self.pool, job)
+            except PoolSaturated:
+                # The pool is busy with interactive requests; retry later.
+                self.store.requeue(record.id)
+                return
+            with self._lock:
+                self._running[record.task] += 1
+            future.add_done_callback(lambda f, record=record: self._finished(record, f))
+
+    def _finished(self, record: JobRecord, future: Future) -> None:
+        try:
+            self.store.finish(record.id, future.result())
+        except Exception as e:
+            self.store.fail(record.id, f"{type(e).__name__}: {e}")
+        with self._lock:
+            self._running[record.task] -= 1
+        self._wake.set()
@@ -1,11 +1,10 @@
+# Feature modules are imported inside their menu branches: most of them pull
+# in Qiskit, Aer or NumPy, and ``qpy`` should start without paying for that.
+import os
+
 from .config import QuantumConfig
 from .engine import QuantumEngine
-from .modules.bloch_ascii import run_bloch_ascii
-from .modules.circuit_explorer import bell_pair, hadamard_sweep
 from .modules.decoherence_toggle import DecoherenceController
-from .modules.qrng_sacred import qrng_phi_sequence
-from .modules.teleport_bridge import run_teleport_bridge
-from .modules.vqe_h2_cli import run_vqe_h2_cli
 
 
 def print_menu(deco_on: bool) -> None:
@@ -19,13 +18,23 @@ def print_menu(deco_on: bool) -> None:
     print("6) Non-local Teleportation Bridge")
     print("7) Molecular Ground-State (VQE Sim)")
     print(f"8) Toggle Quantum Decoherence [{deco_label}]")
+    print("9) H₂ Dissociation Curve (parallel VQE scan)")
     print("q) Quit")
 
 
-def run_app() -> None:
+def run_app(profile: str | None = None) -> None:
+    """
+    Interactive menu. With ``profile`` (one of ``profiling.FORMATS``) every
+    action is profiled and saved as ``menu-<choice>`` (see
+    ``quantumpytho.profiling``). Defaults to ``$QPY_PROFILE``.
+    """
+    if profile is None and os.environ.get("QPY_PROFILE"):
+        from .profiling import parse_format
+
+        profile = parse_format(os.environ["QPY_PROFILE"])
     cfg = QuantumConfig()
-    engine = QuantumEngine(cfg)
     deco_ctrl = DecoherenceController()
+    engine = QuantumEngine(cfg, decoherence=deco_ctrl)
 
     while True:
         print_menu(deco_ctrl.enabled)
@@ -35,39 +44,69 @@ def run_app() -> None:
             print("Goodbye from QuantumPytho.")
             break
 
-        elif choice == "1":
-            seq = qrng_phi_sequence(engine, num_qubits=8, length=16)
-            print("\nQRNG φ-sequence:")
-            for i, v in enumerate(seq):
-                print(f"{i:02d}: {v:.6f}")
+        if profile is None:
+            _run_action(choice, engine, deco_ctrl)
+        else:
+            from .profiling import Profile
 
-        elif choice == "2":
-            res = bell_pair(engine)
-            print("\nBell pair counts:", res.counts)
+            with Profile(profile) as prof:
+                _run_action(choice, engine, deco_ctrl)
+            print(f"\n[profile] written to {prof.save(f'menu-{choice}')}")
 
-        elif choice == "3":
-            depth_str = input("Depth (e.g. 3, 5, 7): ").strip() or "3"
-            depth = int(depth_str)
-            res = hadamard_sweep(engine, depth=depth)
-            print(f"\nH-sweep (depth={depth}) counts:", res.counts)
 
-        elif choice == "4":
-            print("\n[TMT-OS style experiment]")
-            print("Reserved: plug in your TMT-OS circuit builder here.")
+def _run_action(
+    choice: str, engine: QuantumEngine, deco_ctrl: DecoherenceController
+) -> None:
+    if choice == "1":
+        from .modules.qrng_sacred import qrng_phi_sequence
 
-        elif choice == "5":
-            theta = float(input("Theta (0 to pi) [1.0]: ").strip() or "1.0")
-            phi = float(input("Phi (0 to 2pi) [1.0]: ").strip() or "1.0")
-            run_bloch_ascii(theta, phi)
+        seq = qrng_phi_sequence(engine, num_qubits=8, length=16)
+        print("\nQRNG φ-sequence:")
+        for i, v in enumerate(seq):
+            print(f"{i:02d}: {v:.6f}")
 
-        elif choice == "6":
-            run_teleport_bridge()
+    elif choice == "2":
+        from .modules.circuit_explorer import bell_pair
 
-        elif choice == "7":
-            run_vqe_h2_cli()
+        res = bell_pair(engine)
+        print("\nBell pair counts:", res.counts)
 
-        elif choice == "8":
-            deco_ctrl.toggle()
+    elif choice == "3":
+        from .modules.circuit_explorer import hadamard_sweep
 
-        else:
-            print("Unknown option.")
+        depth_str = input("Depth (e.g. 3, 5, 7): ").strip() or "3"
+        depth = int(depth_str)
+        res = hadamard_sweep(engine, depth=depth)
+        print(f"\nH-sweep (depth={depth}) counts:", res.counts)
+
+    elif choice == "4":
+        print("\n[TMT-OS style experiment]")
+        print("Reserved: plug in your TMT-OS circuit builder here.")
+
+    elif choice == "5":
+        from .modules.bloch_ascii import run_bloch_ascii
+
+        theta = float(input("Theta (0 to pi) [1.0]: ").strip() or "1.0")
+        phi = float(input("Phi (0 to 2pi) [1.0]: ").strip() or "1.0")
+        run_bloch_ascii(theta, phi)
+
+    elif choice == "6":
+        from .modules.teleport_bridge import run_teleport_bridge
+
+        run_teleport_bridge(engine)
+
+    elif choice == "7":
+        from .modules.vqe_h2_cli import run_vqe_h2_cli
+
+        run_vqe_h2_cli()
+
+    elif choice == "8":
+        deco_ctrl.toggle()
+
+    elif choice == "9":
+        from .modules.vqe_h2_cli import run_vqe_h2_pes_cli
+
+        run_vqe_h2_pes_cli()
+
+    else:
+        print("Unknown option.")
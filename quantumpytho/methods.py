@@ -0,0 +1,82 @@
+"""
+Simulation-method selection for ideal (noise-free) circuits.
+
+Narrow circuits run as statevectors: at that size a full statevector is
+cheap and Aer samples every shot from it in one pass. Wider circuits go to
+the cheapest method that can represent them:
+
+  - ``stabilizer`` when every gate is a Clifford (e.g. wide Hadamard
+    QRNG circuits), polynomial in the width;
+  - ``matrix_product_state`` when the circuit is weakly entangling: few
+    two-qubit gates cross any cut between neighbouring qubits, which bounds
+    the MPS bond dimension (e.g. wide biased-QRNG templates, which have
+    none), or when a statevector would not fit in memory at all;
+  - ``statevector`` otherwise.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+
+# Clifford gates Aer's stabilizer method simulates.
+CLIFFORD_GATES = frozenset(
+    {"id", "x", "y", "z", "h", "s", "sdg", "sx", "sxdg", "cx", "cy", "cz", "swap"}
+    | {"ecr", "pauli"}
+)
+# Non-unitary operations every method handles.
+NON_UNITARY_OPS = frozenset({"measure", "reset", "barrier", "delay", "store"})
+
+
+def is_clifford(circuit: QuantumCircuit) -> bool:
+    """True if every gate, including inside control-flow blocks, is Clifford."""
+    for inst in circuit.data:
+        op = inst.operation
+        blocks = getattr(op, "blocks", None)
+        if blocks is not None:
+            if not all(is_clifford(block) for block in blocks):
+                return False
+        elif op.name not in CLIFFORD_GATES and op.name not in NON_UNITARY_OPS:
+            return False
+    return True
+
+
+def max_cut_crossings(circuit: QuantumCircuit) -> int:
+    """
+    Largest number of multi-qubit operations spanning any cut between
+    qubits ``i`` and ``i + 1``. Each such gate can at most multiply the bond
+    dimension at that cut by 4, so a small value means a cheap MPS.
+    Control-flow operations count as spanning all of their qubits.
+    """
+    crossings = [0] * max(circuit.num_qubits - 1, 0)
+    for inst in circuit.data:
+        if len(inst.qubits) < 2 or inst.operation.name == "barrier":
+            continue
+        indices = [circuit.find_bit(q).index for q in inst.qubits]
+        for cut in range(min(indices), max(indices)):
+            crossings[cut] += 1
+    return max(crossings, default=0)
+
+
+def select_method(
+    circuit: QuantumCircuit,
+    min_qubits: int,
+    mps_max_cut_gates: int,
+    statevector_max_qubits: int,
+) -> str:
+    """
+    Cheapest Aer method for an ideal run of ``circuit`` (already compiled):
+    statevector below ``min_qubits`` qubits, then stabilizer / MPS /
+    statevector as described in the module docstring. Circuits wider than
+    ``statevector_max_qubits`` never get the statevector method.
+    """
+    fits = circuit.num_qubits <= statevector_max_qubits
+    if circuit.num_qubits < min_qubits and fits:
+        return "statevector"
+    if is_clifford(circuit):
+        return "stabilizer"
+    if not fits or max_cut_crossings(circuit) <= mps_max_cut_gates:
+        return "matrix_product_state"
+    return "statevector"
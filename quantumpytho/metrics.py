@@ -0,0 +1,148 @@
+"""
+Minimal histogram metrics with Prometheus text exposition.
+
+Only what the server needs: labelled histograms with fixed buckets, safe
+to update from several threads, rendered in the Prometheus text format
+(version 0.0.4).
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from collections.abc import Iterable, Mapping
+
+# Seconds: 100 µs … 30 s.
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)  # fmt: skip
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # labels -> [per-bucket counts..., +Inf count], sum
+        self._series: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels.get(name, "")) for name in self.label_names)
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._series.setdefault(
+                key, ([0] * (len(self.buckets) + 1), [0.0])
+            )
+            counts[idx] += 1
+            total[0] += value
+
+    def _labels(self, key: tuple[str, ...], extra: str = "") -> str:
+        parts = [
+            f'{name}="{_escape(value)}"'
+            for name, value in zip(self.label_names, key, strict=True)
+        ]
+        if extra:
+            parts.append(extra)
+        return "{" + ",".join(parts) + "}" if parts else ""
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} histogram",
+        ]
+        with self._lock:
+            series = {k: (list(c), t[0]) for k, (c, t) in self._series.items()}
+        for key, (counts, total) in sorted(series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts, strict=False):
+                cumulative += count
+                le = f'le="{bound:g}"'
+                lines.append(f"{self.name}_bucket{self._labels(key, le)} {cumulative}")
+            cumulative += counts[-1]
+            inf = 'le="+Inf"'
+            lines.append(f"{self.name}_bucket{self._labels(key, inf)} {cumulative}")
+            lines.append(f"{self.name}_sum{self._labels(key)} {total}")
+            lines.append(f"{self.name}_count{self._labels(key)} {cumulative}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = Histogram(name, help_text, label_names, buckets)
+                self._metrics[name] = metric
+            return metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "qpy_stage_seconds",
+    "Time spent per simulation stage (build, transpile, queue, simulate, "
+    "counts, draw).",
+    ("stage", "task"),
+)
+CIRCUIT_QUBITS = REGISTRY.histogram(
+    "qpy_circuit_qubits",
+    "Width of simulated circuits.",
+    ("task",),
+    buckets=(1, 2, 4, 8, 16, 24, 32, 64),
+)
+CIRCUIT_DEPTH = REGISTRY.histogram(
+    "qpy_circuit_depth",
+    "Depth of simulated circuits.",
+    ("task",),
+    buckets=(1, 4, 16, 64, 256, 1024, 4096),
+)
+REQUEST_SECONDS = REGISTRY.histogram(
+    "qpy_http_request_seconds",
+    "End-to-end HTTP request time, including serialization.",
+    ("method", "path"),
+)
+
+
+def observe_run(meta: Mapping, task: str) -> None:
+    """
+    Record one run's ``QuantumResult.meta`` (timings, width, depth) under
+    ``task``. Keep ``task`` low-cardinality (an endpoint name, not a label
+    that embeds parameters).
+    """
+    for stage, seconds in meta.get("timings", {}).items():
+        STAGE_SECONDS.observe(seconds, stage=stage, task=task)
+    if "width" in meta:
+        CIRCUIT_QUBITS.observe(meta["width"], task=task)
+    if "depth" in meta:
+        CIRCUIT_DEPTH.observe(meta["depth"], task=task)
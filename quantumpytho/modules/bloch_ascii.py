@@ -20,6 +20,35 @@ def one_qubit_from_angles(theta: float, phi: float) -> Statevector:
     return Statevector([alpha, beta])
 
 
+def bloch_grid(thetas, phis) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized form of ``one_qubit_from_angles`` for many (θ, φ) points.
+
+    ``thetas`` and ``phis`` are broadcast against each other, so paired 1-D
+    arrays, a scalar against an array, or ``np.meshgrid`` outputs all work.
+    No ``Statevector`` objects are created.
+
+    Returns ``(amplitudes, probabilities)`` with shapes ``(..., 2)``:
+    amplitudes[..., 0] = cos(θ/2), amplitudes[..., 1] = e^{iφ} sin(θ/2),
+    and probabilities are their squared moduli |α|², |β|².
+    """
+    thetas, phis = np.broadcast_arrays(
+        np.asarray(thetas, dtype=np.float64), np.asarray(phis, dtype=np.float64)
+    )
+    half = thetas / 2.0
+    cos_half = np.cos(half)
+    sin_half = np.sin(half)
+
+    amplitudes = np.empty(thetas.shape + (2,), dtype=np.complex128)
+    amplitudes[..., 0] = cos_half
+    amplitudes[..., 1] = np.exp(1j * phis) * sin_half
+
+    probabilities = np.empty(thetas.shape + (2,), dtype=np.float64)
+    probabilities[..., 0] = cos_half * cos_half
+    probabilities[..., 1] = sin_half * sin_half
+    return amplitudes, probabilities
+
+
 def ascii_bar(prob: float, width: int = 20) -> str:
     """
     Render a probability p ∈ [0,1] as an ASCII bar of fixed width.
@@ -1,19 +1,70 @@
+import time
+from collections.abc import Iterable
+from functools import lru_cache
+
 from qiskit import QuantumCircuit
 
 from ..engine import QuantumEngine, QuantumResult
 
 
-def bell_pair(engine: QuantumEngine) -> QuantumResult:
+@lru_cache(maxsize=1)
+def build_bell_circuit() -> QuantumCircuit:
+    """
+    Bell-pair circuit. Memoized: the returned circuit is shared, do not mutate.
+    """
     qc = QuantumCircuit(2, 2)
     qc.h(0)
     qc.cx(0, 1)
     qc.measure([0, 1], [0, 1])
-    return engine.run(qc, label="bell_pair")
+    return qc
 
 
-def hadamard_sweep(engine: QuantumEngine, depth: int = 3) -> QuantumResult:
+@lru_cache(maxsize=512)
+def build_hadamard_circuit(depth: int) -> QuantumCircuit:
+    """
+    ``depth`` Hadamards on one qubit, then measure. Memoized per depth: the
+    returned circuit is shared, do not mutate.
+    """
     qc = QuantumCircuit(1, 1)
     for _ in range(depth):
         qc.h(0)
     qc.measure(0, 0)
-    return engine.run(qc, label=f"h_sweep_{depth}")
+    return qc
+
+
+def bell_pair(engine: QuantumEngine, compact: bool | None = None) -> QuantumResult:
+    t0 = time.perf_counter()
+    qc = build_bell_circuit()
+    build = time.perf_counter() - t0
+    return engine.run(qc, label="bell_pair", timings={"build": build}, compact=compact)
+
+
+def bell_pair_batch(engine: QuantumEngine, repeats: int) -> list[QuantumResult]:
+    """
+    Run ``repeats`` independent Bell-pair experiments in one backend job.
+    """
+    circuits = [build_bell_circuit() for _ in range(repeats)]
+    return engine.run_batch(circuits, [f"bell_pair_{i}" for i in range(repeats)])
+
+
+def hadamard_sweep(
+    engine: QuantumEngine, depth: int = 3, compact: bool | None = None
+) -> QuantumResult:
+    t0 = time.perf_counter()
+    qc = build_hadamard_circuit(depth)
+    build = time.perf_counter() - t0
+    return engine.run(
+        qc, label=f"h_sweep_{depth}", timings={"build": build}, compact=compact
+    )
+
+
+def hadamard_sweep_batch(
+    engine: QuantumEngine, depths: Iterable[int]
+) -> list[QuantumResult]:
+    """
+    Run a Hadamard sweep for every depth in ``depths`` as one backend job,
+    e.g. ``hadamard_sweep_batch(engine, range(1, 501))``.
+    """
+    depths = list(depths)
+    circuits = [build_hadamard_circuit(d) for d in depths]
+    return engine.run_batch(circuits, [f"h_sweep_{d}" for d in depths])
@@ -1,14 +1,120 @@
+"""
+Decoherence toggle backed by Qiskit Aer noise models.
+
+``DecoherenceController`` holds a ``NoiseParams`` set and an on/off switch.
+When enabled, ``QuantumEngine`` asks it for a ``NoiseModel`` on every run;
+models are built once per parameter set and reused.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from qiskit_aer.noise import NoiseModel
+
+ONE_QUBIT_GATES = [
+    "id", "x", "y", "z", "h", "s", "sdg", "t", "tdg", "sx", "sxdg",
+    "rx", "ry", "rz", "p", "u", "u1", "u2", "u3",
+]  # fmt: skip
+TWO_QUBIT_GATES = ["cx", "cy", "cz", "swap", "ecr", "rzz", "cp"]
+
+
+@dataclass(frozen=True)
+class NoiseParams:
+    """
+    Error probabilities per gate (and per measured bit for readout).
+
+    depolarizing_1q / depolarizing_2q: depolarizing channel strength after
+    single- and two-qubit gates. amplitude_damping / phase_damping: T1- and
+    T2-like damping after every gate (applied to each qubit of two-qubit
+    gates). readout_error: symmetric bit-flip probability on measurement.
+    """
+
+    depolarizing_1q: float = 0.001
+    depolarizing_2q: float = 0.01
+    amplitude_damping: float = 0.0
+    phase_damping: float = 0.0
+    readout_error: float = 0.02
+
+
+@lru_cache(maxsize=32)
+def build_noise_model(params: NoiseParams) -> NoiseModel:
+    """
+    Aer ``NoiseModel`` for ``params``. Memoized per parameter set: the
+    returned model is shared, do not mutate.
+    """
+    from qiskit_aer.noise import (
+        NoiseModel,
+        ReadoutError,
+        amplitude_damping_error,
+        depolarizing_error,
+        phase_damping_error,
+    )
+
+    model = NoiseModel()
+
+    error_1q = None
+    for channel, p in (
+        (lambda p: depolarizing_error(p, 1), params.depolarizing_1q),
+        (amplitude_damping_error, params.amplitude_damping),
+        (phase_damping_error, params.phase_damping),
+    ):
+        if p > 0:
+            err = channel(p)
+            error_1q = err if error_1q is None else error_1q.compose(err)
+    if error_1q is not None:
+        model.add_all_qubit_quantum_error(error_1q, ONE_QUBIT_GATES)
+
+    damping_1q = None
+    for channel, p in (
+        (amplitude_damping_error, params.amplitude_damping),
+        (phase_damping_error, params.phase_damping),
+    ):
+        if p > 0:
+            err = channel(p)
+            damping_1q = err if damping_1q is None else damping_1q.compose(err)
+    error_2q = None
+    if params.depolarizing_2q > 0:
+        error_2q = depolarizing_error(params.depolarizing_2q, 2)
+    if damping_1q is not None:
+        damping_2q = damping_1q.tensor(damping_1q)
+        error_2q = damping_2q if error_2q is None else error_2q.compose(damping_2q)
+    if error_2q is not None:
+        model.add_all_qubit_quantum_error(error_2q, TWO_QUBIT_GATES)
+
+    if params.readout_error > 0:
+        p = params.readout_error
+        model.add_all_qubit_readout_error(ReadoutError([[1 - p, p], [p, 1 - p]]))
+
+    return model
+
+
 class DecoherenceController:
     """
-    Logical decoherence toggle.
-    You can later wire this into a Qiskit Aer noise model or IBM backend selection.
+    Decoherence toggle wired into Qiskit Aer noise models.
+
+    Pass it to ``QuantumEngine(..., decoherence=controller)``; while enabled,
+    every run uses ``noise_model()``.
     """
 
-    def __init__(self):
-        self.enabled = False
+    def __init__(self, params: NoiseParams | None = None, enabled: bool = False):
+        self.params = params or NoiseParams()
+        self.enabled = enabled
 
     def toggle(self) -> bool:
         self.enabled = not self.enabled
         state = "ON" if self.enabled else "OFF"
         print(f"\nQuantum Decoherence now [{state}]")
         return self.enabled
+
+    def configure(self, **changes: float) -> NoiseParams:
+        """Update individual ``NoiseParams`` fields, e.g. ``readout_error=0.05``."""
+        self.params = replace(self.params, **changes)
+        return self.params
+
+    def noise_model(self) -> NoiseModel | None:
+        """The (cached) noise model for the current params, or None when off."""
+        return build_noise_model(self.params) if self.enabled else None
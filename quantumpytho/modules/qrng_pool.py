@@ -0,0 +1,193 @@
+"""
+Bulk quantum random numbers from a precomputed entropy pool.
+
+Each refill runs ``build_qrng_circuit`` once in memory mode, so every shot
+contributes ``num_qubits`` fresh bits (instead of reading probabilities
+back out of the counts histogram). The bits are packed into bytes and
+written to a fixed-size ring buffer. An optional background thread keeps
+the buffer above a low watermark so readers rarely wait on the simulator.
+
+Throughput is bounded by how fast Aer emits per-shot memory; widths that
+fit the statevector method (the default 16 qubits) sample fastest.
+"""
+
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+
+from ..config import QuantumConfig
+from ..engine import QuantumEngine
+from .qrng_sacred import build_qrng_circuit
+
+
+def memory_to_bytes(memory: list[str]) -> np.ndarray:
+    """
+    Pack per-shot bitstrings into a ``uint8`` array.
+
+    Bits are concatenated in shot order; a trailing partial byte is dropped
+    rather than zero-padded so every output bit is a measured bit.
+    """
+    bits = np.frombuffer("".join(memory).encode("ascii"), dtype=np.uint8) - ord("0")
+    usable = (bits.size // 8) * 8
+    return np.packbits(bits[:usable])
+
+
+class EntropyPool:
+    """
+    Ring buffer of quantum random bytes.
+
+    Reads block until enough bytes are available. Without a running
+    background thread (see ``start``) readers refill the pool inline.
+    """
+
+    def __init__(
+        self,
+        engine: QuantumEngine | None = None,
+        capacity: int = 1 << 22,
+        num_qubits: int = 16,
+        shots_per_refill: int = 16384,
+        low_watermark: float = 0.5,
+    ):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.engine = engine or QuantumEngine(QuantumConfig())
+        self.num_qubits = num_qubits
+        self.shots_per_refill = shots_per_refill
+        self.capacity = capacity
+        self._low = int(capacity * low_watermark)
+        self._buf = np.empty(capacity, dtype=np.uint8)
+        self._head = 0  # next byte to read
+        self._size = 0  # bytes available
+        self._cond = threading.Condition()
+        self._refill_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+        # Exception that killed the refill thread, re-raised to readers.
+        self._error: BaseException | None = None
+
+    @property
+    def available(self) -> int:
+        with self._cond:
+            return self._size
+
+    # --- producer side ---------------------------------------------------
+
+    def _draw(self) -> np.ndarray:
+        qc = build_qrng_circuit(self.num_qubits)
+        res = self.engine.run(
+            qc, label="qrng_pool", shots=self.shots_per_refill, memory=True
+        )
+        return memory_to_bytes(res.memory)
+
+    def _write(self, data: np.ndarray) -> int:
+        """Copy as much of ``data`` as fits; caller holds ``_cond``."""
+        n = min(data.size, self.capacity - self._size)
+        tail = (self._head + self._size) % self.capacity
+        first = min(n, self.capacity - tail)
+        self._buf[tail : tail + first] = data[:first]
+        self._buf[: n - first] = data[first:n]
+        self._size += n
+        return n
+
+    def refill_once(self) -> int:
+        """Run one QRNG job and store its bytes. Returns bytes added."""
+        with self._refill_lock:
+            data = self._draw()
+            with self._cond:
+                written = self._write(data)
+                self._cond.notify_all()
+        return written
+
+    def _refill_loop(self) -> None:
+        while not self._stopped.is_set():
+            with self._cond:
+                while self._size >= self._low and not self._stopped.is_set():
+                    self._cond.wait()
+            if self._stopped.is_set():
+                break
+            try:
+                self.refill_once()
+            except BaseException as e:
+                # Wake readers waiting for bytes so they see the error
+                # instead of blocking forever.
+                with self._cond:
+                    self._error = e
+                    self._stopped.set()
+                    self._cond.notify_all()
+                return
+
+    def start(self) -> EntropyPool:
+        """Start the background refill thread (idempotent)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped.clear()
+            self._error = None
+            self._thread = threading.Thread(
+                target=self._refill_loop, name="qrng-refill", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopped.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> EntropyPool:
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # --- consumer side ---------------------------------------------------
+
+    def _take(self, out: np.ndarray, offset: int) -> int:
+        """Move available bytes into ``out[offset:]``; caller holds ``_cond``."""
+        n = min(out.size - offset, self._size)
+        first = min(n, self.capacity - self._head)
+        out[offset : offset + first] = self._buf[self._head : self._head + first]
+        out[offset + first : offset + n] = self._buf[: n - first]
+        self._head = (self._head + n) % self.capacity
+        self._size -= n
+        return n
+
+    def read_array(self, nbytes: int) -> np.ndarray:
+        """
+        Return ``nbytes`` random bytes as a ``uint8`` array. Re-raises the
+        error that stopped the background refill thread, if any.
+        """
+        out = np.empty(nbytes, dtype=np.uint8)
+        filled = 0
+        while filled < nbytes:
+            with self._cond:
+                if self._error is not None:
+                    raise self._error
+                filled += self._take(out, filled)
+                self._cond.notify_all()
+                background = (
+                    self._thread is not None
+                    and self._thread.is_alive()
+                    and not self._stopped.is_set()
+                )
+                if filled < nbytes and background:
+                    self._cond.wait_for(
+                        lambda: self._size > 0 or self._stopped.is_set()
+                    )
+                    continue
+            if filled < nbytes:
+                self.refill_once()
+        return out
+
+    def read_bytes(self, nbytes: int) -> bytes:
+        return self.read_array(nbytes).tobytes()
+
+    def random_uint64(self, count: int) -> np.ndarray:
+        return self.read_array(count * 8).view(np.uint64)
+
+    def random_floats(self, count: int) -> np.ndarray:
+        """Uniform floats in [0, 1) with 53 random mantissa bits each."""
+        return (self.random_uint64(count) >> np.uint64(11)) * (1.0 / (1 << 53))
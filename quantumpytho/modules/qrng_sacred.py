@@ -1,11 +1,22 @@
+import time
+from collections.abc import Sequence
+from functools import lru_cache
+
+import numpy as np
 from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
 
-from ..engine import QuantumEngine, QuantumResult
+from ..engine import QuantumEngine, QuantumResult, SweepResult
 
 PHI = (1 + 5**0.5) / 2  # golden ratio
 
 
+@lru_cache(maxsize=64)
 def build_qrng_circuit(num_qubits: int) -> QuantumCircuit:
+    """
+    Hadamard-then-measure on every qubit. Memoized per width: the returned
+    circuit is shared, do not mutate.
+    """
     qc = QuantumCircuit(num_qubits, num_qubits)
     for q in range(num_qubits):
         qc.h(q)
@@ -13,19 +24,56 @@ def build_qrng_circuit(num_qubits: int) -> QuantumCircuit:
     return qc
 
 
-def qrng_phi_sequence(
+@lru_cache(maxsize=64)
+def build_qrng_template(num_qubits: int) -> QuantumCircuit:
+    """
+    Biased QRNG: ry(θ) then measure on every qubit, with one shared
+    parameter ``θ``. Each bit is 1 with probability sin²(θ/2); θ = π/2
+    gives the fair bits of ``build_qrng_circuit``. Memoized per width: the
+    returned circuit is shared, do not mutate.
+    """
+    theta = Parameter("θ")
+    qc = QuantumCircuit(num_qubits, num_qubits)
+    for q in range(num_qubits):
+        qc.ry(theta, q)
+        qc.measure(q, q)
+    return qc
+
+
+def qrng_bias_sweep(
+    engine: QuantumEngine,
+    thetas: Sequence[float],
+    num_qubits: int = 8,
+    shots: int | None = None,
+) -> SweepResult:
+    """Run the biased QRNG for every θ in ``thetas`` as one engine job."""
+    return engine.run_sweep(
+        build_qrng_template(num_qubits), thetas, shots=shots, label="qrng_bias"
+    )
+
+
+def qrng_phi_values(
     engine: QuantumEngine,
     num_qubits: int = 8,
     length: int = 16,
-) -> list[float]:
+) -> np.ndarray:
+    """``qrng_phi_sequence`` as a float64 array."""
+    t0 = time.perf_counter()
     qc = build_qrng_circuit(num_qubits)
-    result: QuantumResult = engine.run(qc, label="qrng_phi")
+    build = time.perf_counter() - t0
+    result: QuantumResult = engine.run(
+        qc, label="qrng_phi", timings={"build": build}, compact=True
+    )
 
-    bitstrings = list(result.counts.keys())
-    probs = [result.counts[b] / result.meta["shots"] for b in bitstrings]
+    # Frequencies of the first ``length`` outcomes in backend order; the
+    # compact counts avoid building a bitstring dict just to read them.
+    probs = result.counts.counts[:length] / result.meta["shots"]
+    return (probs * PHI) % PHI
 
-    sequence: list[float] = []
-    for i in range(min(length, len(bitstrings))):
-        val = (probs[i] * PHI) % PHI
-        sequence.append(val)
-    return sequence
+
+def qrng_phi_sequence(
+    engine: QuantumEngine,
+    num_qubits: int = 8,
+    length: int = 16,
+) -> list[float]:
+    return qrng_phi_values(engine, num_qubits, length).tolist()
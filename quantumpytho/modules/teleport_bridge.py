@@ -9,30 +9,44 @@ Standard protocol (Nielsen & Chuang, Qiskit labs):
      based on measurement outcomes
   5. Final state on qubit 2 equals the original unknown state on qubit 0
 
-This implementation shows the first 3 steps; conditional corrections
-can be added using qiskit's c_if() for a complete protocol.
+The corrections in step 4 are dynamic-circuit ``if_test`` blocks, so the
+circuit runs on Aer as a single mid-circuit-measurement experiment. To
+check the protocol, Bob undoes the state preparation and measures: he
+reads 0 with probability equal to the teleportation fidelity
+F = ⟨ψ|ρ_Bob|ψ⟩ (1 for an ideal run, lower with decoherence).
 """
 
-from qiskit import QuantumCircuit
-from qiskit_aer import AerSimulator
+from dataclasses import dataclass, field
+from functools import lru_cache
 
+import numpy as np
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+from qiskit.circuit import Parameter
 
-def build_teleport_circuit() -> QuantumCircuit:
-    """
-    Quantum teleportation circuit (measurement stage).
+from ..engine import QuantumEngine, QuantumResult
 
-    Qubits:
-      - q0: state to be teleported
-      - q1: Alice's half of Bell pair
-      - q2: Bob's half of Bell pair (will receive the state after corrections)
+# Default input state: ry(0.8)|0⟩, a non-trivial point on the Bloch sphere.
+DEFAULT_THETA = 0.8
+DEFAULT_PHI = 0.0
 
-    Classical bits:
-      - c0, c1: measurement results from Alice's Bell measurement
+
+@lru_cache(maxsize=1)
+def build_teleport_template() -> QuantumCircuit:
     """
-    qc = QuantumCircuit(3, 2)
+    Teleportation circuit with the input state left symbolic: parameters
+    ``θ`` and ``φ`` (in that order in ``.parameters``). See
+    ``build_teleport_circuit`` for the layout.
 
-    # Step 1: Prepare a non-trivial state on q0 (Alice's initial state)
-    qc.ry(0.8, 0)
+    Memoized: the returned circuit is shared, do not mutate.
+    """
+    theta, phi = Parameter("θ"), Parameter("φ")
+    q = QuantumRegister(3, "q")
+    c = ClassicalRegister(3, "c")
+    qc = QuantumCircuit(q, c)
+
+    # Step 1: Prepare |ψ⟩ = cos(θ/2)|0⟩ + e^{iφ} sin(θ/2)|1⟩ on q0
+    qc.ry(theta, 0)
+    qc.rz(phi, 0)
 
     # Step 2: Create shared Bell pair between q1 and q2
     qc.h(1)
@@ -41,39 +55,135 @@ def build_teleport_circuit() -> QuantumCircuit:
     # Step 3: Alice's Bell measurement on q0 and q1
     qc.cx(0, 1)
     qc.h(0)
-    qc.measure(0, 0)
-    qc.measure(1, 1)
+    qc.measure(0, c[0])
+    qc.measure(1, c[1])
+
+    # Step 4: Bob's corrections, X^{c1} then Z^{c0}
+    with qc.if_test((c[1], 1)):
+        qc.x(2)
+    with qc.if_test((c[0], 1)):
+        qc.z(2)
+
+    # Verification: undo the preparation; c2 = 0 iff Bob holds |ψ⟩
+    qc.rz(-phi, 2)
+    qc.ry(-theta, 2)
+    qc.measure(2, c[2])
+    return qc
 
-    # Step 4 (not shown here): Bob would apply conditional X/Z to q2
-    # based on the classical outcomes c0, c1, completing the protocol.
-    # This requires classical feedback which we simulate via measurement counts.
 
-    return qc
+@lru_cache(maxsize=64)
+def build_teleport_circuit(
+    theta: float = DEFAULT_THETA, phi: float = DEFAULT_PHI
+) -> QuantumCircuit:
+    """
+    Full quantum teleportation circuit for the input state ry(θ) then rz(φ)
+    applied to |0⟩.
 
+    Memoized per (θ, φ): the returned circuit is shared, do not mutate.
 
-def run_teleport_bridge() -> None:
+    Qubits:
+      - q0: state to be teleported
+      - q1: Alice's half of Bell pair
+      - q2: Bob's half of Bell pair (receives the state after corrections)
+
+    Classical bits:
+      - c0, c1: measurement results from Alice's Bell measurement
+      - c2: Bob's check after undoing the preparation (0 = state received)
+    """
+    template = build_teleport_template()
+    return template.assign_parameters([theta, phi])
+
+
+def teleport_fidelity(result: QuantumResult) -> float:
+    """Fraction of shots in which Bob's check bit c2 reads 0."""
+    zeros = sum(n for key, n in result.counts.items() if key[0] == "0")
+    return zeros / result.meta["shots"]
+
+
+@dataclass
+class TeleportSweep:
+    """
+    Fidelities of a teleportation sweep, shaped like the broadcast angles.
+
+    ``stderr`` is the binomial standard error of each fidelity estimate.
+    ``timings`` holds the job's stage times in seconds (see
+    ``QuantumEngine.run_sweep``).
     """
-    Execute the teleportation circuit and display Bell measurement outcomes.
 
-    The counts show the distribution of measurement results from Alice's
-    Bell measurement. In a full protocol with conditional corrections,
-    Bob's qubit would be projected into the original state.
+    thetas: np.ndarray
+    phis: np.ndarray
+    fidelity: np.ndarray
+    stderr: np.ndarray
+    shots: int
+    noisy: bool = False
+    timings: dict[str, float] = field(default_factory=dict)
+
+    def as_dict(self) -> dict:
+        return {
+            "thetas": self.thetas.tolist(),
+            "phis": self.phis.tolist(),
+            "fidelity": self.fidelity.tolist(),
+            "stderr": self.stderr.tolist(),
+            "shots": self.shots,
+            "noisy": self.noisy,
+        }
+
+
+def teleport_fidelity_sweep(
+    engine: QuantumEngine, thetas, phis, shots: int | None = None
+) -> TeleportSweep:
+    """
+    Teleport every input state ry(θ), rz(φ) in one engine job.
+
+    ``thetas`` and ``phis`` are broadcast against each other like
+    ``bloch_grid``; the returned arrays have the broadcast shape. The
+    template is compiled once and Aer binds each (θ, φ) pair.
+    """
+    thetas, phis = np.broadcast_arrays(
+        np.asarray(thetas, dtype=np.float64), np.asarray(phis, dtype=np.float64)
+    )
+    sweep = engine.run_sweep(
+        build_teleport_template(),
+        np.column_stack([thetas.ravel(), phis.ravel()]),
+        shots=shots,
+        label="teleport_sweep",
+    )
+    n = sweep.meta["shots"]
+    received = np.array([key[0] == "0" for key in sweep.outcomes], dtype=bool)
+    fidelity = (sweep.counts[:, received].sum(axis=1) / n).reshape(thetas.shape)
+    return TeleportSweep(
+        thetas=thetas,
+        phis=phis,
+        fidelity=fidelity,
+        stderr=np.sqrt(fidelity * (1.0 - fidelity) / n),
+        shots=n,
+        noisy=sweep.meta["noisy"],
+        timings=sweep.meta["timings"],
+    )
+
+
+def run_teleport_bridge(engine: QuantumEngine | None = None) -> None:
+    """
+    Teleport the default state through ``engine`` and display Alice's Bell
+    measurement outcomes and the fidelity of the state Bob receives.
     """
+    engine = engine or QuantumEngine()
     print("\n[Quantum State Teleportation]")
     print("Standard protocol (Nielsen & Chuang, Qiskit labs)\n")
 
-    qc = build_teleport_circuit()
-    backend = AerSimulator()
-    job = backend.run(qc, shots=1024)
-    result = job.result()
-    counts = result.get_counts(qc)
+    res = engine.run(build_teleport_circuit(), label="teleport")
+    shots = res.meta["shots"]
+    alice: dict[str, int] = {}
+    for key, n in res.counts.items():
+        alice[key[-2:]] = alice.get(key[-2:], 0) + n
 
     print("Alice's Bell Measurement Outcomes (c[1]c[0]):")
-    for bitstring in sorted(counts.keys()):
-        count = counts[bitstring]
-        prob = 100.0 * count / 1024
+    for bitstring in sorted(alice):
+        count = alice[bitstring]
+        prob = 100.0 * count / shots
         print(f"  {bitstring}: {count:4d} shots ({prob:5.1f}%)")
 
-    print("\nNote: Complete protocol requires Bob to apply")
-    print("      classically-controlled X/Z gates to q2")
-    print("      based on Alice's measurement results.")
+    fidelity = teleport_fidelity(res)
+    noise = " (decoherence ON)" if res.meta["noisy"] else ""
+    print(f"\nBob applied X^c1 Z^c0 corrections to q2{noise}.")
+    print(f"Teleportation fidelity ⟨ψ|ρ_Bob|ψ⟩ ≈ {fidelity:.4f}")
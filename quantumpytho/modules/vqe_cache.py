@@ -0,0 +1,151 @@
+"""
+Persistent cache for H₂ VQE runs.
+
+Stores, per (bond length, basis, mapper):
+  - the mapped qubit operator (so PySCF integrals and the fermion-to-qubit
+    mapping are computed once per geometry)
+  - the optimal ansatz parameters and energy of the best VQE run so far
+
+Later runs reuse the operator directly and warm-start the optimizer from
+the cached geometry nearest to the requested one. Backed by a single
+SQLite file so several worker processes can share it.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS vqe_h2 (
+    basis TEXT NOT NULL,
+    mapper TEXT NOT NULL,
+    distance REAL NOT NULL,
+    operator TEXT NOT NULL,
+    params BLOB,
+    energy REAL,
+    PRIMARY KEY (basis, mapper, distance)
+)
+"""
+
+# Bond lengths are keyed at this many decimals (Å).
+DISTANCE_DECIMALS = 6
+
+
+def default_cache_dir() -> Path:
+    """``$QPY_CACHE_DIR`` if set, else ``~/.cache/quantumpytho``."""
+    env = os.environ.get("QPY_CACHE_DIR")
+    return Path(env) if env else Path.home() / ".cache" / "quantumpytho"
+
+
+@dataclass
+class VQECacheEntry:
+    distance: float
+    operator: list[tuple[str, complex]]
+    params: np.ndarray | None
+    energy: float | None
+
+
+class VQECache:
+    """SQLite-backed store of qubit operators and optimal VQE parameters."""
+
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path) if path else default_cache_dir() / "vqe_h2.sqlite"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _row_to_entry(row) -> VQECacheEntry:
+        distance, operator, params, energy = row
+        terms = [(label, complex(re, im)) for label, re, im in json.loads(operator)]
+        return VQECacheEntry(
+            distance=distance,
+            operator=terms,
+            params=None if params is None else np.frombuffer(params, dtype="<f8"),
+            energy=energy,
+        )
+
+    def get(self, distance: float, basis: str, mapper: str) -> VQECacheEntry | None:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT distance, operator, params, energy FROM vqe_h2 "
+                "WHERE basis = ? AND mapper = ? AND distance = ?",
+                (basis, mapper, round(distance, DISTANCE_DECIMALS)),
+            ).fetchone()
+        return None if row is None else self._row_to_entry(row)
+
+    def nearest(self, distance: float, basis: str, mapper: str) -> VQECacheEntry | None:
+        """Entry with optimal parameters whose bond length is closest."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT distance, operator, params, energy FROM vqe_h2 "
+                "WHERE basis = ? AND mapper = ? AND params IS NOT NULL "
+                "ORDER BY ABS(distance - ?) LIMIT 1",
+                (basis, mapper, distance),
+            ).fetchone()
+        return None if row is None else self._row_to_entry(row)
+
+    def put_operator(
+        self,
+        distance: float,
+        basis: str,
+        mapper: str,
+        operator: list[tuple[str, complex]],
+    ) -> None:
+        payload = json.dumps([(label, c.real, c.imag) for label, c in operator])
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO vqe_h2 (basis, mapper, distance, operator) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (basis, mapper, distance) "
+                "DO UPDATE SET operator = excluded.operator",
+                (basis, mapper, round(distance, DISTANCE_DECIMALS), payload),
+            )
+
+    def put_result(
+        self,
+        distance: float,
+        basis: str,
+        mapper: str,
+        params: np.ndarray,
+        energy: float,
+    ) -> None:
+        """
+        Record optimal parameters unless a lower energy is already stored.
+        The operator row for this geometry must already exist.
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE vqe_h2 SET params = ?, energy = ? "
+                "WHERE basis = ? AND mapper = ? AND distance = ? "
+                "AND (energy IS NULL OR energy > ?)",
+                (
+                    np.asarray(params, dtype="<f8").tobytes(),
+                    float(energy),
+                    basis,
+                    mapper,
+                    round(distance, DISTANCE_DECIMALS),
+                    float(energy),
+                ),
+            )
+
+    def clear(self) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM vqe_h2")
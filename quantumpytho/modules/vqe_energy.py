@@ -0,0 +1,224 @@
+"""
+Batched energy evaluation for VQE.
+
+An evaluator maps a batch of parameter vectors (rows of a 2-D array whose
+columns follow ``ansatz.parameters``) to their energies and standard
+errors in one call:
+
+  - ``ExactEnergy``: noise-free statevectors. The Hamiltonian is applied
+    as one sparse matrix to all states, so the whole operator is evaluated
+    in one pass instead of term by term.
+  - ``ShotEnergy``: sampled on a ``QuantumEngine``. Pauli terms are
+    grouped into qubit-wise-commuting sets that share one measurement
+    basis, and each group runs as one engine sweep over every parameter
+    vector of the batch.
+
+``parameter_shift_points`` / ``parameter_shift_gradient`` turn one
+parameter vector into the batch that gives both its energy and its exact
+gradient, so an optimizer step costs one evaluator call.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+    from qiskit.quantum_info import SparsePauliOp
+
+    from ..engine import QuantumEngine
+
+# Gates exp(-iθP/2) with a Pauli-product generator P, for which the
+# two-point parameter-shift rule is exact.
+SHIFT_RULE_GATES = frozenset({"rx", "ry", "rz", "p", "rxx", "ryy", "rzz", "rzx"})
+
+
+def check_parameter_shift(circuit: QuantumCircuit) -> None:
+    """
+    Raise ``ValueError`` unless every parameter of ``circuit`` is the bare
+    angle of exactly one gate in ``SHIFT_RULE_GATES``.
+    """
+    from qiskit.circuit import Parameter
+
+    uses: dict[Parameter, int] = {}
+    for inst in circuit.data:
+        for param in inst.operation.params:
+            if not hasattr(param, "parameters"):
+                continue
+            if inst.operation.name not in SHIFT_RULE_GATES or not isinstance(
+                param, Parameter
+            ):
+                raise ValueError(
+                    f"Parameter-shift gradients need bare angles of "
+                    f"{sorted(SHIFT_RULE_GATES)} gates; got {inst.operation.name}"
+                    f"({param})."
+                )
+            uses[param] = uses.get(param, 0) + 1
+    shared = sorted(p.name for p, n in uses.items() if n > 1)
+    if shared:
+        raise ValueError(f"Parameters used by more than one gate: {shared}.")
+
+
+def parameter_shift_points(theta: np.ndarray) -> np.ndarray:
+    """
+    ``theta`` followed by ``theta ± π/2`` along each axis: shape
+    ``(2p + 1, p)``, the plus shifts before the minus shifts.
+    """
+    theta = np.asarray(theta, dtype=np.float64)
+    shifts = np.eye(len(theta)) * (np.pi / 2)
+    return np.vstack([theta, theta + shifts, theta - shifts])
+
+
+def parameter_shift_gradient(energies: np.ndarray) -> np.ndarray:
+    """Gradient at ``theta`` from the energies at ``parameter_shift_points``."""
+    p = (len(energies) - 1) // 2
+    return (energies[1 : p + 1] - energies[p + 1 :]) / 2
+
+
+class ExactEnergy:
+    """
+    Noise-free energies of ``ansatz`` states under ``operator``. All
+    statevectors of a batch come from one Aer job that binds every
+    parameter vector to the once-compiled ansatz.
+    """
+
+    def __init__(self, ansatz: QuantumCircuit, operator: SparsePauliOp):
+        from qiskit import transpile
+        from qiskit_aer import AerSimulator
+
+        self.backend = AerSimulator(method="statevector")
+        circuit = ansatz.copy()
+        circuit.save_statevector()
+        self.compiled = transpile(circuit, self.backend)
+        self.parameters = [p.name for p in ansatz.parameters]
+        self.matrix = operator.to_matrix(sparse=True)
+
+    def __call__(self, points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        by_name = {p.name: p for p in self.compiled.parameters}
+        binds = {
+            by_name[name]: points[:, i].tolist()
+            for i, name in enumerate(self.parameters)
+            if name in by_name
+        }
+        result = self.backend.run(self.compiled, parameter_binds=[binds]).result()
+        states = np.stack(
+            [np.asarray(result.data(i)["statevector"]) for i in range(len(points))]
+        )
+        energies = np.einsum("ij,ij->i", states.conj(), (self.matrix @ states.T).T)
+        return energies.real, np.zeros(len(points))
+
+
+@dataclass
+class MeasurementGroup:
+    """Qubit-wise-commuting Pauli terms measured with one circuit."""
+
+    template: QuantumCircuit  # ansatz, basis rotations, measure_all
+    support: np.ndarray  # (terms, qubits) 0/1: qubits each term acts on
+    coeffs: np.ndarray  # (terms,) real coefficients
+
+
+def measurement_groups(
+    ansatz: QuantumCircuit, operator: SparsePauliOp
+) -> list[MeasurementGroup]:
+    """
+    Split ``operator`` into qubit-wise-commuting groups, each with the
+    ansatz followed by the rotations into that group's measurement basis.
+    """
+    groups = []
+    for group in operator.group_commuting(qubit_wise=True):
+        x = group.paulis.x
+        z = group.paulis.z
+        template = ansatz.copy()
+        for q in range(ansatz.num_qubits):
+            if x[:, q].any():
+                if z[:, q].any():
+                    template.sdg(q)
+                template.h(q)
+        template.measure_all()
+        groups.append(
+            MeasurementGroup(
+                template=template,
+                support=(x | z).astype(np.int64),
+                coeffs=group.coeffs.real.copy(),
+            )
+        )
+    return groups
+
+
+class ShotEnergy:
+    """
+    Sampled energies of ``ansatz`` states under ``operator``: one
+    ``engine.run_sweep`` per qubit-wise-commuting group, ``shots`` shots
+    per parameter vector and group.
+    """
+
+    def __init__(
+        self,
+        ansatz: QuantumCircuit,
+        operator: SparsePauliOp,
+        engine: QuantumEngine,
+        shots: int | None = None,
+    ):
+        self.engine = engine
+        self.shots = shots or engine.config.shots
+        self.groups = measurement_groups(ansatz, operator)
+
+    def __call__(self, points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        energies = np.zeros(len(points))
+        variances = np.zeros(len(points))
+        for group in self.groups:
+            sweep = self.engine.run_sweep(group.template, points, shots=self.shots)
+            num_qubits = group.support.shape[1]
+            outcomes = np.array([int(key, 2) for key in sweep.outcomes], np.int64)
+            bits = (outcomes[:, None] >> np.arange(num_qubits)) & 1
+            signs = 1 - 2 * ((bits @ group.support.T) % 2)
+            values = signs @ group.coeffs  # group observable per outcome
+            probs = sweep.probabilities()
+            mean = probs @ values
+            energies += mean
+            variances += (probs @ values**2 - mean**2) / self.shots
+        return energies, np.sqrt(np.maximum(variances, 0.0))
+
+
+class BatchedObjective:
+    """
+    ``fun`` / ``jac`` pair for ``Optimizer.minimize`` backed by a batch
+    evaluator. With ``gradient`` every new point is evaluated together with
+    its parameter shifts in one batch, and the energy and gradient at the
+    last point are reused, so ``fun(x)`` followed by ``jac(x)`` costs one
+    evaluator call. ``report(eval_count, energy, std)`` is called once per
+    new point.
+    """
+
+    def __init__(self, evaluate, gradient: bool, report=None):
+        self.evaluate = evaluate
+        self.gradient = gradient
+        self.report = report
+        self.eval_count = 0
+        self._point: np.ndarray | None = None
+        self._energy = 0.0
+        self._grad: np.ndarray | None = None
+
+    def _at(self, x: np.ndarray) -> None:
+        x = np.asarray(x, dtype=np.float64)
+        if self._point is not None and np.array_equal(x, self._point):
+            return
+        points = parameter_shift_points(x) if self.gradient else x[None, :]
+        energies, stds = self.evaluate(points)
+        self._point = x.copy()
+        self._energy = float(energies[0])
+        self._grad = parameter_shift_gradient(energies) if self.gradient else None
+        self.eval_count += 1
+        if self.report is not None:
+            self.report(self.eval_count, self._energy, float(stds[0]))
+
+    def fun(self, x: np.ndarray) -> float:
+        self._at(x)
+        return self._energy
+
+    def jac(self, x: np.ndarray) -> np.ndarray:
+        self._at(x)
+        return self._grad
@@ -1,4 +1,18 @@
+from __future__ import annotations
+
 from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+
+    from ..engine import QuantumEngine, SweepResult
+
+# Batched cost: (points, dim) array of parameter vectors -> (points,) energies.
+BatchCost = Callable[[np.ndarray], np.ndarray]
 
 
 def coordinate_descent_1d(
@@ -43,6 +57,141 @@ def coordinate_descent_1d(
     return history
 
 
+@dataclass
+class MultiStartResult:
+    """
+    Outcome of ``coordinate_descent``.
+
+    ``thetas`` / ``energies`` / ``steps`` are the final state of every start
+    (shape ``(starts, dim)`` / ``(starts,)`` / ``(starts,)``); ``theta`` and
+    ``energy`` the best of them. ``history`` holds one
+    ``(iteration, thetas, energies)`` snapshot per iteration, and
+    ``evaluations`` counts cost points over all batched calls.
+    """
+
+    theta: np.ndarray
+    energy: float
+    thetas: np.ndarray
+    energies: np.ndarray
+    steps: np.ndarray
+    iterations: int
+    evaluations: int
+    history: list[tuple[int, np.ndarray, np.ndarray]] = field(repr=False)
+
+    def best_history(self) -> list[tuple[int, float, float]]:
+        """
+        ``(iteration, theta, energy)`` of the finally-best start, in the
+        format of ``coordinate_descent_1d`` (``theta`` is the first
+        parameter) for ``energy_history_ascii``.
+        """
+        best = int(np.argmin(self.energies))
+        return [(k, float(th[best, 0]), float(en[best])) for k, th, en in self.history]
+
+
+def coordinate_descent(
+    cost: BatchCost,
+    theta0: np.ndarray,
+    step: float | np.ndarray,
+    iters: int,
+    tol: float = 0.0,
+) -> MultiStartResult:
+    """
+    Multi-start, N-dimensional version of ``coordinate_descent_1d``.
+
+    ``theta0`` is a ``(starts, dim)`` array of starting points (a 1-D array
+    is a single start). At each iteration every still-active start probes
+    θ ± step·e_d along every coordinate d, and all probes of all starts are
+    evaluated in ONE call ``cost(points)`` with ``points`` of shape
+    ``(n, dim)``, so an engine-backed cost can run them as a single job.
+    Each start moves to its lowest probe if that lowers its energy (ties go
+    to the earlier coordinate and to +step), otherwise halves its step.
+
+    A start stops once its step falls below ``tol``; the search ends when
+    all starts have stopped or after ``iters`` iterations. ``step`` is a
+    scalar or one initial step per start. Energies of accepted probes are
+    reused, so each iteration costs ``2 * dim`` points per active start.
+    """
+    thetas = np.array(theta0, dtype=float)
+    if thetas.ndim == 1:
+        thetas = thetas[np.newaxis, :]
+    if thetas.ndim != 2 or thetas.size == 0:
+        raise ValueError("theta0 must be a non-empty (starts, dim) array")
+    starts, dim = thetas.shape
+    steps = np.broadcast_to(np.asarray(step, dtype=float), (starts,)).copy()
+
+    energies = _evaluate(cost, thetas)
+    evaluations = starts
+    history: list[tuple[int, np.ndarray, np.ndarray]] = []
+    # Probe offsets in (+e_0, -e_0, +e_1, -e_1, ...) order: (2*dim, dim).
+    directions = np.repeat(np.eye(dim), 2, axis=0)
+    directions[1::2] *= -1
+
+    for k in range(iters):
+        history.append((k, thetas.copy(), energies.copy()))
+        active = np.flatnonzero(steps >= tol) if tol > 0 else np.arange(starts)
+        if active.size == 0:
+            break
+
+        probes = (
+            thetas[active, np.newaxis, :]
+            + steps[active, np.newaxis, np.newaxis] * directions
+        )
+        probe_energies = _evaluate(cost, probes.reshape(-1, dim)).reshape(
+            active.size, 2 * dim
+        )
+        evaluations += probes.shape[0] * probes.shape[1]
+
+        best = np.argmin(probe_energies, axis=1)
+        best_energy = probe_energies[np.arange(active.size), best]
+        improved = best_energy < energies[active]
+
+        moved = active[improved]
+        thetas[moved] = probes[improved, best[improved]]
+        energies[moved] = best_energy[improved]
+        steps[active[~improved]] *= 0.5
+    else:
+        k = iters
+
+    i = int(np.argmin(energies))
+    return MultiStartResult(
+        theta=thetas[i].copy(),
+        energy=float(energies[i]),
+        thetas=thetas,
+        energies=energies,
+        steps=steps,
+        iterations=k,
+        evaluations=evaluations,
+        history=history,
+    )
+
+
+def _evaluate(cost: BatchCost, points: np.ndarray) -> np.ndarray:
+    energies = np.asarray(cost(points), dtype=float).reshape(-1)
+    if energies.shape != (len(points),):
+        raise ValueError(
+            f"cost returned {energies.size} energies for {len(points)} points"
+        )
+    return energies
+
+
+def sweep_cost(
+    engine: QuantumEngine,
+    template: QuantumCircuit,
+    energy: Callable[[SweepResult], np.ndarray],
+    shots: int | None = None,
+) -> BatchCost:
+    """
+    Batched cost running ``template`` once per point via
+    ``engine.run_sweep`` (columns in ``template.parameters`` order, all
+    points in one job); ``energy`` maps the sweep to one energy per point.
+    """
+
+    def cost(points: np.ndarray) -> np.ndarray:
+        return energy(engine.run_sweep(template, points, shots=shots, label="descent"))
+
+    return cost
+
+
 def energy_history_ascii(
     history: list[tuple[int, float, float]], bar_width: int = 10
 ) -> None:
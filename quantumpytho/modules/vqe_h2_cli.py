@@ -2,6 +2,7 @@
 CLI wrapper for H₂ VQE runs, supporting both generic optimizer and physical VQE.
 """
 
+from .vqe_cache import VQECache
 from .vqe_h2_ascii import energy_history_ascii
 from .vqe_h2_exact import run_vqe_h2_physical
 
@@ -15,7 +16,7 @@ def run_vqe_h2_cli() -> None:
     rather than showing fabricated energies.
     """
     try:
-        energies: list[tuple[int, float]] = run_vqe_h2_physical()
+        energies: list[tuple[int, float]] = run_vqe_h2_physical(cache=VQECache())
         print("\nRunning VQE for H₂ (Physical Hamiltonian via Qiskit-Nature)...")
 
     except RuntimeError as e:
@@ -29,3 +30,45 @@ def run_vqe_h2_cli() -> None:
     # Convert to (iter, theta_dummy, energy) for the ASCII printer
     hist_for_print = [(i, float(i) * 0.1, E) for (i, E) in energies]
     energy_history_ascii(hist_for_print, bar_width=10)
+
+
+def run_vqe_h2_pes_cli() -> None:
+    """
+    Scan the H₂ dissociation curve over a user-chosen bond-length range,
+    printing each point as soon as it is computed.
+    """
+    from .vqe_h2_pes import scan_h2_pes
+
+    try:
+        start = float(input("Start bond length Å [0.3]: ").strip() or "0.3")
+        stop = float(input("Stop bond length Å [2.5]: ").strip() or "2.5")
+        points = int(input("Number of points [12]: ").strip() or "12")
+        workers = int(input("Parallel workers [auto]: ").strip() or "0")
+    except ValueError as e:
+        print(f"\n[VQE H₂ PES] Invalid input: {e}")
+        return
+    if points < 1 or start <= 0 or stop < start or workers < 0:
+        print(
+            "\n[VQE H₂ PES] Require 0 < start <= stop, points >= 1 and "
+            "workers >= 0 (0 = auto)."
+        )
+        return
+    workers = workers or None
+
+    step = (stop - start) / max(points - 1, 1)
+    distances = [start + i * step for i in range(points)]
+
+    def show(point) -> None:
+        print(f"  R = {point.distance:6.3f} Å   E = {point.total_energy: .8f} Ha")
+
+    print("\nH₂ potential-energy surface (total energy, Hartree):")
+    try:
+        curve = scan_h2_pes(distances, workers=workers, cache=VQECache(), progress=show)
+    except RuntimeError as e:
+        print("\n[VQE H₂] Required packages not installed.")
+        print(f"  Error: {e}")
+        print("To install: pip install qiskit-algorithms qiskit-nature")
+        return
+
+    best = min(curve, key=lambda p: p.total_energy)
+    print(f"\nMinimum: R = {best.distance:.3f} Å, E = {best.total_energy:.8f} Ha")
@@ -3,8 +3,20 @@ Physically correct Variational Quantum Eigensolver for H₂ molecule.
 
 This module runs a true VQE using the standard stack:
   - qiskit_nature (for molecular Hamiltonian via PySCF)
-  - qiskit_algorithms (for VQE algorithm)
-  - qiskit.primitives (Estimator backend)
+  - qiskit_algorithms (for the optimizers and the VQE algorithm)
+  - qiskit_aer (for sampled energies)
+
+Energies are evaluated in one of ``VQE_MODES``:
+  - ``exact``: noise-free statevector expectation of the whole operator
+    at once (``vqe_energy.ExactEnergy``)
+  - ``shots``: sampled on a ``QuantumEngine``, one measurement circuit per
+    qubit-wise-commuting group of Pauli terms (``vqe_energy.ShotEnergy``)
+  - ``estimator``: qiskit_algorithms ``VQE`` on Aer's ``EstimatorV2``
+In the first two modes, optimizers that use gradients get exact
+parameter-shift gradients, computed in the same batch as the energy.
+
+Mapped qubit operators and optimal parameters can be persisted in a
+``VQECache`` so repeated runs skip integral generation and warm-start.
 
 References:
   - Qiskit textbook VQE chapter
@@ -14,13 +26,140 @@ References:
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-def run_vqe_h2_physical(
+if TYPE_CHECKING:
+    import numpy as np
+    from qiskit.quantum_info import SparsePauliOp
+    from qiskit_algorithms.optimizers import Optimizer
+
+    from ..engine import QuantumEngine
+    from .vqe_cache import VQECache
+
+DEFAULT_BOND_LENGTH = 0.735  # Å, H₂ equilibrium
+MAPPERS = ("parity", "jordan_wigner", "bravyi_kitaev")
+VQE_MODES = ("exact", "shots", "estimator")
+OPTIMIZERS = ("cobyla", "l_bfgs_b", "slsqp", "spsa", "gradient_descent")
+
+
+@dataclass
+class VQEH2Result:
+    history: list[tuple[int, float]]  # (eval_count, energy) per evaluation
+    optimal_point: np.ndarray
+    energy: float  # electronic energy (Hartree) at optimal_point
+
+
+class VQECancelled(Exception):
+    """Raised from a ``progress`` callback to abandon a running VQE."""
+
+
+def _energy_std(metadata: dict) -> float:
+    """
+    Standard error of one estimator value from its metadata: from
+    ``variance``/``shots`` when the estimator reports them, else the target
+    precision (0.0 for exact Aer estimates).
+    """
+    if "variance" in metadata and metadata.get("shots"):
+        return float(metadata["variance"] / metadata["shots"]) ** 0.5
+    return float(metadata.get("target_precision", 0.0))
+
+
+_INSTALL_HINT = "H₂ VQE requires qiskit_algorithms and qiskit_nature to be installed. "
+
+
+def make_optimizer(name: str, max_iters: int) -> Optimizer:
+    """qiskit_algorithms optimizer ``name`` (one of ``OPTIMIZERS``)."""
+    try:
+        from qiskit_algorithms import optimizers
+    except ImportError as e:
+        raise RuntimeError(f"{_INSTALL_HINT}Import error: {e}") from e
+
+    factories = {
+        "cobyla": optimizers.COBYLA,
+        "l_bfgs_b": optimizers.L_BFGS_B,
+        "slsqp": optimizers.SLSQP,
+        "spsa": optimizers.SPSA,
+        "gradient_descent": optimizers.GradientDescent,
+    }
+    if name not in factories:
+        raise ValueError(f"Unknown optimizer {name!r}; expected one of {OPTIMIZERS}.")
+    return factories[name](maxiter=max_iters)
+
+
+def _require_nature():
+    try:
+        from qiskit_nature.second_q import mappers
+        from qiskit_nature.second_q.drivers import PySCFDriver
+        from qiskit_nature.second_q.transformers import ActiveSpaceTransformer
+    except ImportError as e:
+        raise RuntimeError(f"{_INSTALL_HINT}Import error: {e}") from e
+    return mappers, PySCFDriver, ActiveSpaceTransformer
+
+
+def build_h2_qubit_operator(
+    distance: float = DEFAULT_BOND_LENGTH,
+    basis: str = "sto3g",
+    mapper: str = "parity",
+    cache: VQECache | None = None,
+) -> SparsePauliOp:
+    """
+    Electronic H₂ Hamiltonian at bond length ``distance`` (Å) as a qubit
+    operator: PySCF integrals → 2-electron/2-orbital active space →
+    ``mapper`` (one of ``MAPPERS``).
+
+    With a ``cache`` the mapped operator is read from / written to disk, so
+    PySCF only runs once per (distance, basis, mapper).
+    """
+    from qiskit.quantum_info import SparsePauliOp
+
+    if mapper not in MAPPERS:
+        raise ValueError(f"Unknown mapper {mapper!r}; expected one of {MAPPERS}.")
+
+    if cache is not None:
+        entry = cache.get(distance, basis, mapper)
+        if entry is not None:
+            return SparsePauliOp.from_list(entry.operator)
+
+    mappers, PySCFDriver, ActiveSpaceTransformer = _require_nature()
+    mapper_cls = {
+        "parity": mappers.ParityMapper,
+        "jordan_wigner": mappers.JordanWignerMapper,
+        "bravyi_kitaev": mappers.BravyiKitaevMapper,
+    }[mapper]
+
+    driver = PySCFDriver(atom=f"H 0 0 0; H 0 0 {distance}", basis=basis)
+    es_problem = driver.run()
+    es_problem = ActiveSpaceTransformer(
+        num_electrons=2, num_spatial_orbitals=2
+    ).transform(es_problem)
+    hamiltonian = es_problem.hamiltonian.second_q_op()
+    qubit_op = mapper_cls().map(hamiltonian)
+
+    if cache is not None:
+        cache.put_operator(distance, basis, mapper, qubit_op.to_list())
+    return qubit_op
+
+
+def solve_vqe_h2(
     max_iters: int = 50,
-) -> list[tuple[int, float]]:
+    distance: float = DEFAULT_BOND_LENGTH,
+    basis: str = "sto3g",
+    mapper: str = "parity",
+    cache: VQECache | None = None,
+    initial_point=None,
+    callback: Callable[[int, float], None] | None = None,
+    progress: Callable[[int, float, float], None] | None = None,
+    mode: str = "exact",
+    optimizer: Optimizer | str | None = None,
+    engine: QuantumEngine | None = None,
+    shots: int | None = None,
+) -> VQEH2Result:
     """
     Physically correct Variational Quantum Eigensolver for H₂ molecule
-    in minimal basis (STO-3G), following standard Qiskit/IBM examples.
+    in minimal basis (STO-3G) by default, following standard Qiskit/IBM
+    examples.
 
     This function REQUIRES:
       - qiskit_algorithms
@@ -28,63 +167,150 @@ def run_vqe_h2_physical(
       - pyscf (installed as dep of qiskit_nature)
 
     Structure:
-      1. Build H₂ electronic structure problem via PySCF driver
-      2. Map second-quantized Hamiltonian to qubit operator (parity mapper)
-      3. Define ansatz (TwoLocal with RY/CZ blocks)
-      4. Run VQE with Estimator primitive, collect energies via callback
-      5. Return (iteration, energy) pairs—no fabricated values
+      1. Build H₂ qubit Hamiltonian (``build_h2_qubit_operator``)
+      2. Define ansatz (TwoLocal with RY/CZ blocks)
+      3. Minimize the energy, evaluated as ``mode`` (one of ``VQE_MODES``,
+         see the module docstring), with ``optimizer``: a qiskit_algorithms
+         ``Optimizer`` or one of ``OPTIMIZERS`` run for at most
+         ``max_iters`` iterations (default COBYLA)
+      4. Return the (iteration, energy) history and the optimum—no
+         fabricated values
+
+    ``shots`` mode samples on ``engine`` (default: a fresh
+    ``QuantumEngine``) with ``shots`` shots per group of Pauli terms
+    (default: the engine's configured shots).
+
+    With a ``cache``, the qubit operator is reused and the optimizer is
+    warm-started from the optimal parameters of the nearest cached bond
+    length (unless ``initial_point`` is given); the new optimum is stored
+    back. ``callback(eval_count, energy)`` is called on every evaluation,
+    as is ``progress(eval_count, energy, std)`` with the estimate's standard
+    error; either may raise (e.g. ``VQECancelled``) to stop the run.
 
     The physical Hamiltonian, ansatz, and optimization are all from
     the standard Qiskit/Nature stack, ensuring scientific correctness.
     """
+    if mode not in VQE_MODES:
+        raise ValueError(f"Unknown mode {mode!r}; expected one of {VQE_MODES}.")
     try:
+        import numpy as np
         from qiskit.circuit.library import TwoLocal
-        from qiskit_aer.primitives import Estimator
-        from qiskit_algorithms import VQE
-        from qiskit_nature.second_q.drivers import PySCFDriver
-        from qiskit_nature.second_q.mappers import ParityMapper
-        from qiskit_nature.second_q.problems import ElectronicStructureProblem
-        from qiskit_nature.second_q.transformers import ActiveSpaceTransformer
+        from qiskit_algorithms.utils import validate_initial_point
     except ImportError as e:
-        raise RuntimeError(
-            "H₂ VQE requires qiskit_algorithms and qiskit_nature to be installed. "
-            f"Import error: {e}"
-        ) from e
-
-    # 1. Build electronic structure problem for H₂
-    driver = PySCFDriver(atom="H 0 0 0; H 0 0 0.735", basis="sto3g")
-    es_problem = ElectronicStructureProblem(driver)
-    es_problem = ActiveSpaceTransformer(
-        num_electrons=2, num_spatial_orbitals=2
-    ).transform(es_problem)
+        raise RuntimeError(f"{_INSTALL_HINT}Import error: {e}") from e
 
-    # 2. Extract second-quantized Hamiltonian and map to qubits
-    second_q_ops = es_problem.second_q_ops()
-    hamiltonian = second_q_ops[0]
+    if optimizer is None or isinstance(optimizer, str):
+        optimizer = make_optimizer(optimizer or "cobyla", max_iters)
 
-    mapper = ParityMapper()
-    qubit_op = mapper.map(hamiltonian)
+    # 1. Qubit Hamiltonian (from cache when available)
+    qubit_op = build_h2_qubit_operator(distance, basis, mapper, cache=cache)
 
-    # 3. Define ansatz (hardware-efficient)
+    # 2. Define ansatz (hardware-efficient), decomposed so Aer can run it
     ansatz = TwoLocal(
+        qubit_op.num_qubits,
         rotation_blocks="ry",
         entanglement_blocks="cz",
         entanglement="full",
-    )
+    ).decompose()
 
-    # 4. Run VQE with Estimator, collect energies
-    estimator = Estimator()
-    vqe = VQE(estimator, ansatz=ansatz)
+    if initial_point is None and cache is not None:
+        nearest = cache.nearest(distance, basis, mapper)
+        if nearest is not None and nearest.params.size == ansatz.num_parameters:
+            initial_point = nearest.params
 
+    # 3. Minimize, collecting the energy of every evaluation
     energies: list[tuple[int, float]] = []
 
-    def callback(eval_count, parameters, mean, std):
-        """Collect energy at each VQE iteration."""
-        energies.append((eval_count, mean))
+    def record(eval_count: int, energy: float, std: float) -> None:
+        energies.append((eval_count, energy))
+        if callback is not None:
+            callback(eval_count, energy)
+        if progress is not None:
+            progress(eval_count, energy, std)
+
+    if mode == "estimator":
+        optimal_point, energy = _minimize_estimator(
+            ansatz, qubit_op, optimizer, initial_point, record
+        )
+    else:
+        from .vqe_energy import (
+            BatchedObjective,
+            ExactEnergy,
+            ShotEnergy,
+            check_parameter_shift,
+        )
+
+        if mode == "exact":
+            evaluate = ExactEnergy(ansatz, qubit_op)
+        else:
+            if engine is None:
+                from ..config import QuantumConfig
+                from ..engine import QuantumEngine
+
+                engine = QuantumEngine(QuantumConfig())
+            evaluate = ShotEnergy(ansatz, qubit_op, engine, shots)
+        from qiskit_algorithms.optimizers import OptimizerSupportLevel
+
+        gradient = optimizer.gradient_support_level >= OptimizerSupportLevel.supported
+        if gradient:
+            check_parameter_shift(ansatz)
+        objective = BatchedObjective(evaluate, gradient, record)
+        result = optimizer.minimize(
+            objective.fun,
+            validate_initial_point(initial_point, ansatz),
+            jac=objective.jac if gradient else None,
+        )
+        optimal_point, energy = np.asarray(result.x), float(result.fun)
+
+    if cache is not None:
+        cache.put_result(distance, basis, mapper, optimal_point, energy)
+
+    return VQEH2Result(history=energies, optimal_point=optimal_point, energy=energy)
+
 
-    vqe.callback = callback
+def _minimize_estimator(ansatz, qubit_op, optimizer, initial_point, record):
+    """qiskit_algorithms ``VQE`` on Aer's ``EstimatorV2``, term by term."""
+    import numpy as np
+    from qiskit_aer.primitives import EstimatorV2
+    from qiskit_algorithms import VQE
 
-    # Solve for ground state
-    _result = vqe.compute_minimum_eigenvalue(qubit_op)
+    def _callback(eval_count, parameters, mean, metadata):
+        record(eval_count, float(mean), _energy_std(metadata or {}))
 
-    return energies
+    vqe = VQE(
+        EstimatorV2(),
+        ansatz=ansatz,
+        optimizer=optimizer,
+        initial_point=None if initial_point is None else np.asarray(initial_point),
+        callback=_callback,
+    )
+    result = vqe.compute_minimum_eigenvalue(qubit_op)
+    return np.asarray(result.optimal_point), float(result.eigenvalue.real)
+
+
+def run_vqe_h2_physical(
+    max_iters: int = 50,
+    distance: float = DEFAULT_BOND_LENGTH,
+    basis: str = "sto3g",
+    mapper: str = "parity",
+    cache: VQECache | None = None,
+    initial_point=None,
+    callback: Callable[[int, float], None] | None = None,
+    mode: str = "exact",
+    optimizer: Optimizer | str | None = None,
+) -> list[tuple[int, float]]:
+    """
+    Run the physical H₂ VQE (see ``solve_vqe_h2``) and return its
+    (iteration, energy) convergence history.
+    """
+    return solve_vqe_h2(
+        max_iters=max_iters,
+        distance=distance,
+        basis=basis,
+        mapper=mapper,
+        cache=cache,
+        initial_point=initial_point,
+        callback=callback,
+        mode=mode,
+        optimizer=optimizer,
+    ).history
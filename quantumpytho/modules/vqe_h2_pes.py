@@ -0,0 +1,201 @@
+"""
+Parallel H₂ potential-energy-surface (dissociation curve) scan.
+
+The requested bond lengths are sorted and split into ``workers`` contiguous
+chains. Chains run in parallel; within a chain each point is submitted only
+after its neighbour finishes, and is warm-started from that neighbour's
+optimal VQE parameters (nearby geometries have nearby optima). Points are
+yielded as soon as they complete, so callers can stream progress.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+import numpy as np
+
+from ..workers import process_context
+from .vqe_cache import VQECache
+from .vqe_h2_exact import solve_vqe_h2
+
+BOHR_IN_ANGSTROM = 0.529177210903
+# Seconds between checks of ``iter_h2_pes``'s ``cancel`` event.
+CANCEL_POLL = 0.1
+
+
+class _Submitter(Protocol):
+    def submit(
+        self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+    ) -> Future: ...
+
+
+@dataclass
+class PESPoint:
+    distance: float  # Å
+    electronic_energy: float  # Hartree
+    total_energy: float  # electronic + nuclear repulsion, Hartree
+    evaluations: int
+    optimal_point: np.ndarray
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "distance": self.distance,
+            "electronic_energy": self.electronic_energy,
+            "total_energy": self.total_energy,
+            "evaluations": self.evaluations,
+        }
+
+
+def nuclear_repulsion_h2(distance: float) -> float:
+    """Proton–proton Coulomb energy 1/R (Hartree) at R = ``distance`` Å."""
+    return BOHR_IN_ANGSTROM / distance
+
+
+def _solve_point(
+    distance: float,
+    basis: str,
+    mapper: str,
+    max_iters: int,
+    initial_point: np.ndarray | None,
+    cache: VQECache | None,
+) -> PESPoint:
+    res = solve_vqe_h2(
+        max_iters=max_iters,
+        distance=distance,
+        basis=basis,
+        mapper=mapper,
+        cache=cache,
+        initial_point=initial_point,
+    )
+    return PESPoint(
+        distance=distance,
+        electronic_energy=res.energy,
+        total_energy=res.energy + nuclear_repulsion_h2(distance),
+        evaluations=len(res.history),
+        optimal_point=res.optimal_point,
+    )
+
+
+def _chains(distances: list[float], n: int) -> list[list[float]]:
+    size, extra = divmod(len(distances), n)
+    chains, start = [], 0
+    for i in range(n):
+        end = start + size + (1 if i < extra else 0)
+        if end > start:
+            chains.append(distances[start:end])
+        start = end
+    return chains
+
+
+def iter_h2_pes(
+    distances: Iterable[float],
+    workers: int | None = None,
+    basis: str = "sto3g",
+    mapper: str = "parity",
+    max_iters: int = 50,
+    cache: VQECache | None = None,
+    executor: _Submitter | None = None,
+    cancel: threading.Event | None = None,
+) -> Iterator[PESPoint]:
+    """
+    Yield a ``PESPoint`` per bond length, in completion order.
+
+    ``workers`` sets the number of parallel chains (default: CPU count).
+    By default a ``ProcessPoolExecutor`` of that size is created; pass any
+    object with a ``submit`` method (e.g. a ``SimulationPool``) as
+    ``executor`` to run on an existing pool instead. ``workers=1`` without an
+    executor runs serially in-process.
+
+    Setting ``cancel`` (checked every ``CANCEL_POLL`` seconds while waiting)
+    or closing the generator ends the scan. Points not yet started are
+    cancelled; points already running finish but start no successor.
+    """
+    points = sorted({float(d) for d in distances})
+    if not points:
+        return
+    n_chains = max(1, min(workers or os.cpu_count() or 1, len(points)))
+    chains = _chains(points, n_chains)
+
+    if executor is None and n_chains == 1:
+        previous = None
+        for d in chains[0]:
+            point = _solve_point(d, basis, mapper, max_iters, previous, cache)
+            previous = point.optimal_point
+            yield point
+        return
+
+    own_pool = executor is None
+    pool = (
+        ProcessPoolExecutor(max_workers=n_chains, mp_context=process_context())
+        if own_pool
+        else executor
+    )
+    # future -> (chain, index of the point being solved)
+    pending: dict[Future, tuple[list[float], int]] = {}
+    try:
+        for chain in chains:
+            fut = pool.submit(
+                _solve_point, chain[0], basis, mapper, max_iters, None, cache
+            )
+            pending[fut] = (chain, 0)
+
+        while pending:
+            timeout = None if cancel is None else CANCEL_POLL
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if cancel is not None and cancel.is_set():
+                return
+            for fut in done:
+                chain, idx = pending.pop(fut)
+                point = fut.result()
+                if idx + 1 < len(chain):
+                    nxt = pool.submit(
+                        _solve_point,
+                        chain[idx + 1],
+                        basis,
+                        mapper,
+                        max_iters,
+                        point.optimal_point,
+                        cache,
+                    )
+                    pending[nxt] = (chain, idx + 1)
+                yield point
+    finally:
+        for fut in pending:
+            fut.cancel()
+        if own_pool:
+            pool.shutdown(cancel_futures=True)
+
+
+def scan_h2_pes(
+    distances: Iterable[float],
+    workers: int | None = None,
+    basis: str = "sto3g",
+    mapper: str = "parity",
+    max_iters: int = 50,
+    cache: VQECache | None = None,
+    progress: Callable[[PESPoint], None] | None = None,
+) -> list[PESPoint]:
+    """
+    Evaluate the H₂ dissociation curve at ``distances`` (Å) in parallel.
+
+    ``progress`` is called with each point as it completes. Returns all
+    points sorted by bond length.
+    """
+    results: list[PESPoint] = []
+    for point in iter_h2_pes(
+        distances,
+        workers=workers,
+        basis=basis,
+        mapper=mapper,
+        max_iters=max_iters,
+        cache=cache,
+    ):
+        if progress is not None:
+            progress(point)
+        results.append(point)
+    return sorted(results, key=lambda p: p.distance)
@@ -0,0 +1,275 @@
+"""
+Opt-in profiling of single actions: a ``qpy`` command or menu choice, or
+one API request.
+
+``Profile`` profiles the calling thread while it is active. Tasks
+submitted to a ``SimulationPool`` in the meantime (from the same thread
+or async context) are profiled in their worker, and those profiles are
+merged into it when the tasks finish. So the saved profile of a
+``/hadamard`` request also covers the simulation that ran in a worker
+process. Two formats are supported:
+
+  - ``pstats``: deterministic ``cProfile`` statistics, saved as ``.prof``
+    (``python -m pstats``, snakeviz, ...);
+  - ``collapsed``: stacks sampled every ``interval`` seconds, saved as
+    ``.folded`` lines ``frame;frame;... count`` (flamegraph.pl,
+    speedscope, ...).
+
+Profiles are written to ``$QPY_PROFILE_DIR`` (default: ``profiles`` in the
+cache directory). Only stdlib is imported here, so the CLI can use it
+without slowing its startup.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import cProfile
+import marshal
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any
+
+FORMATS = ("pstats", "collapsed")
+EXTENSIONS = {"pstats": ".prof", "collapsed": ".folded"}
+# Newest profiles kept in the directory; older ones are deleted on save.
+DEFAULT_KEEP = 200
+
+_current: contextvars.ContextVar[Profile | None] = contextvars.ContextVar(
+    "qpy_profile", default=None
+)
+# Threads with a local profiler running (one per thread at a time).
+_busy = threading.local()
+
+
+def parse_format(value: str | None) -> str | None:
+    """
+    Profile format requested by an env var, header or query value: ``None``
+    for empty/``0``/``off``, ``pstats`` for ``1``/``true``/``on``.
+    """
+    value = (value or "").strip().lower()
+    if value in ("", "0", "false", "off", "no"):
+        return None
+    if value in ("1", "true", "on", "yes"):
+        return "pstats"
+    if value not in FORMATS:
+        raise ValueError(
+            f"Unknown profile format {value!r}; expected one of {FORMATS}."
+        )
+    return value
+
+
+def profile_dir() -> Path:
+    """``$QPY_PROFILE_DIR`` if set, else ``profiles`` in the cache directory."""
+    env = os.environ.get("QPY_PROFILE_DIR")
+    if env:
+        return Path(env)
+    from .modules.vqe_cache import default_cache_dir
+
+    return default_cache_dir() / "profiles"
+
+
+def current() -> Profile | None:
+    """The ``Profile`` active in this context, if any."""
+    return _current.get()
+
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}.{getattr(code, 'co_qualname', code.co_name)}"
+
+
+class _StackSampler:
+    """Counts the stacks of thread ``ident`` every ``interval`` seconds."""
+
+    def __init__(self, ident: int, interval: float):
+        self.ident = ident
+        self.interval = interval
+        self.counts: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="qpy-profile", daemon=True
+        )
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.ident)
+            names = []
+            while frame is not None:
+                names.append(_frame_name(frame))
+                frame = frame.f_back
+            if names:
+                self.counts[";".join(reversed(names))] += 1
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+class Profile:
+    """
+    Context manager profiling one action in format ``fmt`` (see module
+    docstring). If this thread is already being profiled (e.g. by an
+    overlapping request on the same event loop), only the pool tasks of
+    this action are recorded.
+    """
+
+    def __init__(self, fmt: str = "pstats", interval: float = 0.001):
+        if fmt not in FORMATS:
+            raise ValueError(
+                f"Unknown profile format {fmt!r}; expected one of {FORMATS}."
+            )
+        self.format = fmt
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._parts: list[bytes] = []
+        self._profiler: Any = None
+        self._token: contextvars.Token | None = None
+
+    def __enter__(self) -> Profile:
+        self._token = _current.set(self)
+        if not getattr(_busy, "active", False):
+            _busy.active = True
+            if self.format == "pstats":
+                self._profiler = cProfile.Profile()
+                self._profiler.enable()
+            else:
+                self._profiler = _StackSampler(threading.get_ident(), self.interval)
+                self._profiler.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        _current.reset(self._token)
+        if self._profiler is None:
+            return
+        if self.format == "pstats":
+            self._profiler.disable()
+            self.add(marshal.dumps(pstats.Stats(self._profiler).stats))
+        else:
+            self._profiler.stop()
+            self.add(_dump_counts(self._profiler.counts))
+        self._profiler = None
+        _busy.active = False
+
+    def add(self, data: bytes) -> None:
+        """Merge a serialized profile of the same format (from a worker)."""
+        with self._lock:
+            self._parts.append(data)
+
+    def wrap(self, future: Future) -> Future:
+        """
+        Future of a ``profiled_call`` task resolving to the task's own
+        result, after adding its profile here.
+        """
+        outer: Future = Future()
+
+        def done(inner: Future) -> None:
+            if inner.cancelled():
+                outer.cancel()
+                return
+            error = inner.exception()
+            if error is not None:
+                outer.set_exception(error)
+                return
+            result, data = inner.result()
+            self.add(data)
+            outer.set_result(result)
+
+        future.add_done_callback(done)
+        return outer
+
+    def data(self) -> bytes:
+        """All parts merged, in the format's own serialization."""
+        with self._lock:
+            parts = list(self._parts)
+        if self.format == "pstats":
+            if not parts:
+                return marshal.dumps({})
+            stats = _load_stats(parts[0])
+            for part in parts[1:]:
+                stats.add(_load_stats(part))
+            return marshal.dumps(stats.stats)
+        counts: Counter[str] = Counter()
+        for part in parts:
+            counts.update(_load_counts(part))
+        return _dump_counts(counts)
+
+    def save(
+        self, name: str, directory: str | Path | None = None, keep: int = DEFAULT_KEEP
+    ) -> Path:
+        """
+        Write the merged profile as ``<time>-<id>-<name><ext>`` and delete
+        all but the newest ``keep`` profiles. Returns the file's path.
+        """
+        directory = Path(directory) if directory is not None else profile_dir()
+        directory.mkdir(parents=True, exist_ok=True)
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("_") or "profile"
+        stamp = time.strftime("%Y%m%dT%H%M%S")
+        path = directory / f"{stamp}-{uuid.uuid4().hex[:8]}-{slug}"
+        path = path.with_name(path.name + EXTENSIONS[self.format])
+        path.write_bytes(self.data())
+        for old in list_profiles(directory)[keep:]:
+            (directory / old["name"]).unlink(missing_ok=True)
+        return path
+
+
+def _load_stats(data: bytes) -> pstats.Stats:
+    stats = pstats.Stats()
+    stats.stats = marshal.loads(data)
+    stats.get_top_level_stats()
+    return stats
+
+
+def _dump_counts(counts: Counter[str]) -> bytes:
+    return "".join(f"{stack} {n}\n" for stack, n in counts.most_common()).encode()
+
+
+def _load_counts(data: bytes) -> Counter[str]:
+    counts: Counter[str] = Counter()
+    for line in data.decode().splitlines():
+        stack, _, n = line.rpartition(" ")
+        counts[stack] += int(n)
+    return counts
+
+
+def profiled_call(
+    fmt: str, fn: Callable[..., Any], *args: Any, **kwargs: Any
+) -> tuple[Any, bytes]:
+    """Run ``fn(*args, **kwargs)`` under a ``Profile``; return (result, data)."""
+    with Profile(fmt) as profile:
+        result = fn(*args, **kwargs)
+    return result, profile.data()
+
+
+def list_profiles(directory: str | Path | None = None) -> list[dict[str, Any]]:
+    """Saved profiles, newest first: ``name``, ``format``, ``bytes``, ``created``."""
+    directory = Path(directory) if directory is not None else profile_dir()
+    if not directory.is_dir():
+        return []
+    formats = {ext: fmt for fmt, ext in EXTENSIONS.items()}
+    found = []
+    for path in directory.iterdir():
+        if path.suffix in formats and path.is_file():
+            stat = path.stat()
+            found.append(
+                {
+                    "name": path.name,
+                    "format": formats[path.suffix],
+                    "bytes": stat.st_size,
+                    "created": stat.st_mtime,
+                }
+            )
+    found.sort(key=lambda p: (p["created"], p["name"]), reverse=True)
+    return found
@@ -0,0 +1,347 @@
+"""
+HTTP response cache for endpoints whose output depends only on the request.
+
+``ResponseCacheMiddleware`` is an ASGI middleware. For each configured path
+it keys the request by method, path, query string, ``Accept`` header and
+body. Successful (200) responses are stored for that path's TTL in a
+pluggable backend, unless the endpoint marks them ``Cache-Control:
+no-store`` (e.g. a 200 reporting that an optional dependency is missing):
+
+  - ``MemoryBackend``: per-process LRU (default)
+  - ``DiskBackend``: SQLite file shared by several server processes
+  - ``RedisBackend``: any Redis-protocol server (needs the ``redis``
+    package)
+
+Every cached-path response carries a strong ``ETag`` (hash of the body)
+and ``Cache-Control: max-age``. Requests whose ``If-None-Match`` matches
+get ``304 Not Modified`` without a body. ``X-Cache`` tells whether the
+response was a HIT or a MISS.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Protocol
+from urllib.parse import parse_qs
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    expires REAL NOT NULL,
+    value BLOB NOT NULL
+)
+"""
+
+
+class CacheBackend(Protocol):
+    # True if get/set do I/O and should run off the event loop.
+    blocking: bool
+
+    def get(self, key: str) -> bytes | None: ...
+
+    def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class MemoryBackend:
+    """In-process LRU of at most ``maxsize`` entries, with per-entry expiry."""
+
+    blocking = False
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskBackend:
+    """SQLite-backed store; expired rows are dropped lazily on write."""
+
+    blocking = True
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> bytes | None:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value FROM responses WHERE key = ? AND expires > ?",
+                (key, time.time()),
+            ).fetchone()
+        return bytes(row[0]) if row else None
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses WHERE expires <= ?", (now,))
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, expires, value) "
+                "VALUES (?, ?, ?)",
+                (key, now + ttl, value),
+            )
+
+    def clear(self) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+
+
+class RedisBackend:
+    """Entries under ``prefix`` in a Redis-compatible server, expired by it."""
+
+    blocking = True
+
+    def __init__(self, url: str = "redis://localhost:6379/0", prefix: str = "qpy:"):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError(
+                "RedisBackend requires the redis package (pip install redis)."
+            ) from e
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> bytes | None:
+        return self._client.get(self.prefix + key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._client.set(self.prefix + key, value, px=max(1, int(ttl * 1000)))
+
+    def clear(self) -> None:
+        keys = list(self._client.scan_iter(self.prefix + "*"))
+        if keys:
+            self._client.delete(*keys)
+
+
+def backend_from_spec(spec: str) -> CacheBackend | None:
+    """
+    Backend for a spec string: ``memory`` (or ``memory:<maxsize>``),
+    ``disk`` (or ``disk:<path>``), a ``redis://`` / ``rediss://`` URL, or
+    ``off`` (None). ``disk`` alone uses ``responses.sqlite`` in the
+    QuantumPytho cache directory.
+    """
+    if spec in ("", "off", "none"):
+        return None
+    if spec == "memory" or spec.startswith("memory:"):
+        _, _, size = spec.partition(":")
+        return MemoryBackend(int(size) if size else 1024)
+    if spec == "disk" or spec.startswith("disk:"):
+        _, _, path = spec.partition(":")
+        if not path:
+            from .modules.vqe_cache import default_cache_dir
+
+            path = default_cache_dir() / "responses.sqlite"
+        return DiskBackend(path)
+    if spec.startswith(("redis://", "rediss://", "unix://")):
+        return RedisBackend(spec)
+    raise ValueError(f"Unknown response cache backend: {spec!r}")
+
+
+def _encode(status: int, headers: list[tuple[bytes, bytes]], body: bytes) -> bytes:
+    head = {"status": status, "headers": [[k.decode(), v.decode()] for k, v in headers]}
+    return json.dumps(head).encode() + b"\n" + body
+
+
+def _decode(value: bytes) -> tuple[int, list[tuple[bytes, bytes]], bytes]:
+    head, _, body = value.partition(b"\n")
+    meta = json.loads(head)
+    headers = [(k.encode(), v.encode()) for k, v in meta["headers"]]
+    return meta["status"], headers, body
+
+
+def _etag(body: bytes) -> bytes:
+    return b'"' + hashlib.sha256(body).hexdigest()[:32].encode() + b'"'
+
+
+def _etag_matches(if_none_match: bytes | None, etag: bytes) -> bool:
+    if not if_none_match:
+        return False
+    tags = {t.strip().removeprefix(b"W/") for t in if_none_match.split(b",")}
+    return etag in tags or b"*" in tags
+
+
+def _profiled(scope) -> bool:
+    if any(k.lower() == b"x-profile" for k, _ in scope.get("headers", [])):
+        return True
+    query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+    return "profile" in query
+
+
+class ResponseCacheMiddleware:
+    """
+    Cache responses of the paths in ``ttls`` (path -> seconds to live).
+
+    Only GET and POST requests to those exact paths are cached; everything
+    else passes straight through, as do profiled requests (``X-Profile``
+    header or ``profile`` query parameter, see ``quantumpytho.profiling``),
+    whose profile should show the endpoint's work rather than a cache hit. With ``backend=None`` nothing is stored
+    but ETags and conditional requests still work.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        ttls: Mapping[str, float],
+        backend: CacheBackend | None = None,
+    ):
+        self.app = app
+        self.ttls = dict(ttls)
+        self.backend = backend
+
+    async def _call(self, fn, *args):
+        if self.backend is not None and self.backend.blocking:
+            return await asyncio.to_thread(fn, *args)
+        return fn(*args)
+
+    async def __call__(self, scope, receive, send) -> None:
+        ttl = self.ttls.get(scope.get("path", ""))
+        if (
+            scope["type"] != "http"
+            or ttl is None
+            or scope["method"] not in ("GET", "POST")
+            or _profiled(scope)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        body = b""
+        more = True
+        while more:
+            message = await receive()
+            body += message.get("body", b"")
+            more = message.get("more_body", False)
+        replayed = False
+
+        async def replay():
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        headers = dict(scope["headers"])
+        digest = hashlib.sha256()
+        for part in (
+            scope["method"].encode(),
+            scope["path"].encode(),
+            scope.get("query_string", b""),
+            headers.get(b"accept", b""),
+            body,
+        ):
+            digest.update(part + b"\0")
+        key = digest.hexdigest()
+        if_none_match = headers.get(b"if-none-match")
+
+        cached = None
+        if self.backend is not None:
+            cached = await self._call(self.backend.get, key)
+        if cached is not None:
+            status, stored_headers, payload = _decode(cached)
+            await self._respond(
+                send, status, stored_headers, payload, b"HIT", if_none_match
+            )
+            return
+
+        start: dict[str, Any] = {}
+        chunks: list[bytes] = []
+
+        async def capture(message):
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, replay, capture)
+        payload = b"".join(chunks)
+        status = start.get("status", 500)
+        app_cache_control = next(
+            (v for k, v in start.get("headers", []) if k.lower() == b"cache-control"),
+            b"",
+        )
+        if b"no-store" in app_cache_control.lower():
+            headers = [
+                (k, v)
+                for k, v in start.get("headers", [])
+                if k.lower() != b"content-length"  # _respond sets it
+            ]
+            await self._respond(send, status, headers, payload, b"MISS", None)
+            return
+        stored_headers = [
+            (k, v)
+            for k, v in start.get("headers", [])
+            if k.lower() not in (b"content-length", b"etag", b"cache-control")
+        ]
+        if status == 200:
+            stored_headers += [
+                (b"etag", _etag(payload)),
+                (b"cache-control", f"max-age={int(ttl)}".encode()),
+            ]
+            if self.backend is not None:
+                await self._call(
+                    self.backend.set, key, _encode(status, stored_headers, payload), ttl
+                )
+        await self._respond(
+            send, status, stored_headers, payload, b"MISS", if_none_match
+        )
+
+    @staticmethod
+    async def _respond(send, status, headers, payload, cache_state, if_none_match):
+        etag = next((v for k, v in headers if k == b"etag"), None)
+        if status == 200 and etag is not None and _etag_matches(if_none_match, etag):
+            status, payload = 304, b""
+            headers = [(k, v) for k, v in headers if k != b"content-type"]
+        headers = headers + [
+            (b"content-length", str(len(payload)).encode()),
+            (b"x-cache", cache_state),
+        ]
+        await send(
+            {"type": "http.response.start", "status": status, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": payload})
@@ -0,0 +1,157 @@
+"""
+Shot-sharded execution across worker processes.
+
+``run_sharded`` splits a shot budget into chunks of ``chunk_shots`` shots
+(the last one smaller). Chunk ``k`` is simulated with a seed derived from
+the master seed and ``k`` (``numpy.random.SeedSequence.spawn``), and the
+chunk counts are summed. The merged counts therefore depend only on the
+circuit, the shot count, the master seed and the chunk size. They do not
+depend on how many workers ran the chunks or in what order they finished,
+so a run can be repeated bit for bit from its ``meta``.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any
+
+from .config import QuantumConfig
+from .counts import CountsArray, merge_counts
+from .engine import QuantumEngine, QuantumResult, _peak_rss_mb
+
+if TYPE_CHECKING:
+    import numpy as np
+    from qiskit import QuantumCircuit
+
+    from .modules.decoherence_toggle import NoiseParams
+    from .workers import SimulationPool
+
+DEFAULT_CHUNK_SHOTS = 1_000_000
+
+
+def chunk_plan(shots: int, chunk_shots: int = DEFAULT_CHUNK_SHOTS) -> list[int]:
+    """Shots per chunk: ``chunk_shots`` each, the remainder in the last."""
+    if shots < 1 or chunk_shots < 1:
+        raise ValueError("shots and chunk_shots must be positive")
+    full, rest = divmod(shots, chunk_shots)
+    return [chunk_shots] * full + ([rest] if rest else [])
+
+
+def chunk_seeds(seed: int, chunks: int) -> list[int]:
+    """Independent 32-bit simulator seeds for ``chunks`` chunks of one run."""
+    import numpy as np
+
+    children = np.random.SeedSequence(seed).spawn(chunks)
+    return [int(child.generate_state(1, np.uint32)[0]) for child in children]
+
+
+def run_chunk(
+    engine: QuantumEngine,
+    circuit: QuantumCircuit,
+    shots: int,
+    seed: int,
+    noise: NoiseParams | None = None,
+) -> tuple[np.ndarray, np.ndarray, str]:
+    """
+    Run one chunk on ``engine`` (a worker engine, noisy when ``noise`` is
+    set) and return its outcome values, counts and simulation method. The
+    engine's own noise parameters are restored afterwards, since later
+    tasks on the same worker share it.
+    """
+    if noise is None:
+        res = engine.run(circuit, shots=shots, compact=True, seed=seed)
+    else:
+        previous = engine.decoherence.params
+        engine.decoherence.params = noise
+        try:
+            res = engine.run(circuit, shots=shots, compact=True, seed=seed)
+        finally:
+            engine.decoherence.params = previous
+    return res.counts.outcomes, res.counts.counts, res.meta["method"]
+
+
+def run_sharded(
+    circuit: QuantumCircuit,
+    shots: int,
+    seed: int | None = None,
+    workers: int | None = None,
+    chunk_shots: int = DEFAULT_CHUNK_SHOTS,
+    config: QuantumConfig | None = None,
+    noise: NoiseParams | None = None,
+    compact: bool | None = None,
+    label: str = "",
+    pool: SimulationPool | None = None,
+) -> QuantumResult:
+    """
+    Run ``shots`` shots of ``circuit`` in seeded chunks and merge the counts.
+
+    ``workers`` worker processes (default: CPU count) run the chunks; with
+    ``workers=1`` they run in this process. An existing ``pool`` can be
+    passed instead. Without a ``seed`` a fresh master seed is drawn from OS
+    entropy. Either way it is reported in ``meta["seed"]``, together with
+    ``chunk_shots``, so the run can be repeated exactly. ``noise`` runs
+    every chunk with that noise model.
+    """
+    import numpy as np
+
+    config = config or QuantumConfig()
+    if seed is None:
+        seed = int(np.random.SeedSequence().entropy)
+    sizes = chunk_plan(shots, chunk_shots)
+    seeds = chunk_seeds(seed, len(sizes))
+    chunks = list(zip(sizes, seeds, strict=True))
+
+    t0 = time.perf_counter()
+    if pool is None and workers == 1:
+        from .modules.decoherence_toggle import DecoherenceController
+
+        engine = QuantumEngine(
+            config, decoherence=DecoherenceController(enabled=noise is not None)
+        )
+        parts = [run_chunk(engine, circuit, n, s, noise) for n, s in chunks]
+        used_workers = 1
+    else:
+        from .workers import SimulationPool
+
+        own_pool = pool is None
+        if own_pool:
+            pool = SimulationPool(workers=workers, max_queue=len(chunks), config=config)
+        try:
+            futures = [
+                pool.submit_with_engine(
+                    run_chunk, circuit, n, s, noise, noisy=noise is not None
+                )
+                for n, s in chunks
+            ]
+            parts = [future.result() for future in futures]
+        finally:
+            if own_pool:
+                pool.shutdown()
+        used_workers = pool.workers
+    t1 = time.perf_counter()
+
+    creg_sizes = [reg.size for reg in circuit.cregs]
+    counts: Any = merge_counts(
+        [CountsArray(o, c, circuit.num_clbits, creg_sizes) for o, c, _ in parts]
+    )
+    if not (config.compact_counts if compact is None else compact):
+        counts = counts.to_dict()
+    return QuantumResult(
+        circuit=circuit,
+        counts=counts,
+        meta={
+            "label": label,
+            "shots": shots,
+            "backend": config.backend_name,
+            "method": parts[0][2],
+            "noisy": noise is not None,
+            "width": circuit.num_qubits,
+            "depth": circuit.depth(),
+            "seed": seed,
+            "chunk_shots": chunk_shots,
+            "chunks": len(chunks),
+            "workers": used_workers,
+            "peak_rss_mb": _peak_rss_mb(),
+            "timings": {"simulate": t1 - t0, "counts": time.perf_counter() - t1},
+        },
+    )
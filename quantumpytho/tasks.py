@@ -0,0 +1,184 @@
+"""
+Picklable simulation tasks returning response payloads.
+
+These are the units of work the web server hands to ``SimulationPool``.
+Engine-backed tasks take the worker's ``QuantumEngine`` as first argument.
+Payloads are dicts that keep numeric results as NumPy arrays and compact
+counts as ``CountsArray``, so binary encodings can ship the buffers as they
+are; ``encoding.to_jsonable`` (or ``json_default``) gives the JSON form.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from .circuit_cache import CircuitCache
+from .engine import QuantumEngine, QuantumResult
+from .modules.circuit_explorer import bell_pair, hadamard_sweep
+from .modules.qrng_sacred import qrng_phi_values
+
+
+def qrng_task(engine: QuantumEngine, num_qubits: int, length: int) -> dict[str, Any]:
+    seq = qrng_phi_values(engine, num_qubits=num_qubits, length=length)
+    return {"sequence": seq, "num_qubits": num_qubits, "length": length}
+
+
+# Text diagrams per circuit structure; drawing a deep circuit costs far more
+# than hashing it, and the same few circuits are drawn on every request.
+_DIAGRAMS = CircuitCache(256)
+
+
+def _draw(res: QuantumResult) -> tuple[str, dict[str, Any]]:
+    """
+    Text diagram of ``res.circuit`` (memoized per circuit structure) plus the
+    run's timings (with the draw time added), width and depth for the
+    response's ``meta`` field.
+    """
+    t0 = time.perf_counter()
+    diagram = _DIAGRAMS.get_or_compile(
+        res.circuit, lambda qc: qc.draw("text").__str__(), "text"
+    )
+    timings = {**res.meta["timings"], "draw": time.perf_counter() - t0}
+    return diagram, {
+        "timings": timings,
+        "width": res.meta["width"],
+        "depth": res.meta["depth"],
+    }
+
+
+def _counts_payload(res: QuantumResult, draw: bool) -> dict[str, Any]:
+    """
+    Counts, shots and noise flag of ``res``; with ``draw`` also the circuit
+    diagram (batch callers skip it, it dominates for deep circuits), and the
+    exact probabilities when the engine computed them. Compact counts stay
+    a ``CountsArray`` (columnar in every encoding, see ``CountsArray.as_json``).
+    """
+    payload: dict[str, Any] = {"counts": res.counts}
+    if draw:
+        payload["circuit"], run_meta = _draw(res)
+    else:
+        run_meta = {key: res.meta[key] for key in ("timings", "width", "depth")}
+    payload.update(shots=res.meta["shots"], noisy=res.meta["noisy"], meta=run_meta)
+    if res.probabilities is not None:
+        payload["probabilities"] = res.probabilities
+    return payload
+
+
+def bell_task(
+    engine: QuantumEngine, draw: bool = True, compact: bool = False
+) -> dict[str, Any]:
+    return _counts_payload(bell_pair(engine, compact=compact), draw)
+
+
+def hadamard_task(
+    engine: QuantumEngine, depth: int, draw: bool = True, compact: bool = False
+) -> dict[str, Any]:
+    res = hadamard_sweep(engine, depth=depth, compact=compact)
+    payload = _counts_payload(res, draw)
+    payload["depth"] = depth
+    return payload
+
+
+def teleport_sweep_task(
+    engine: QuantumEngine, thetas: list[float], phis: list[float]
+) -> dict[str, Any]:
+    from .modules.teleport_bridge import teleport_fidelity_sweep
+
+    sweep = teleport_fidelity_sweep(engine, thetas, phis)
+    return {
+        "thetas": sweep.thetas,
+        "phis": sweep.phis,
+        "fidelity": sweep.fidelity,
+        "stderr": sweep.stderr,
+        "shots": sweep.shots,
+        "noisy": sweep.noisy,
+        "meta": {"timings": sweep.timings, "width": 3},
+    }
+
+
+def vqe_h2_task() -> dict[str, Any]:
+    from .modules.vqe_cache import VQECache
+    from .modules.vqe_h2_exact import run_vqe_h2_physical
+
+    history = run_vqe_h2_physical(cache=VQECache())
+    energies = [{"iteration": i, "energy": float(E)} for i, E in history]
+    return {"energies": energies, "molecule": "H₂", "basis": "STO-3G"}
+
+
+def vqe_h2_stream_task(
+    progress: Any,
+    cancel: Any,
+    distance: float = 0.735,
+    max_iters: int = 50,
+    basis: str = "sto3g",
+    mapper: str = "parity",
+    mode: str = "exact",
+    optimizer: str = "cobyla",
+) -> dict[str, Any]:
+    """
+    H₂ VQE that puts ``{"eval_count", "energy", "std"}`` on the ``progress``
+    queue after every evaluation and stops with ``VQECancelled`` once the
+    ``cancel`` event is set (see ``SimulationPool.channel``). Returns the
+    final energy and evaluation count.
+    """
+    from .modules.vqe_cache import VQECache
+    from .modules.vqe_h2_exact import VQECancelled, solve_vqe_h2
+
+    def report(eval_count: int, energy: float, std: float) -> None:
+        if cancel.is_set():
+            raise VQECancelled(f"Cancelled after {eval_count - 1} evaluations.")
+        progress.put({"eval_count": eval_count, "energy": energy, "std": std})
+
+    res = solve_vqe_h2(
+        max_iters=max_iters,
+        distance=distance,
+        basis=basis,
+        mapper=mapper,
+        cache=VQECache(),
+        progress=report,
+        mode=mode,
+        optimizer=optimizer,
+    )
+    return {
+        "energy": res.energy,
+        "evaluations": len(res.history),
+        "distance": distance,
+        "molecule": "H₂",
+        "basis": basis,
+        "mapper": mapper,
+        "mode": mode,
+    }
+
+
+def vqe_point_task(
+    distance: float,
+    max_iters: int = 50,
+    basis: str = "sto3g",
+    mapper: str = "parity",
+    mode: str = "exact",
+    optimizer: str = "cobyla",
+) -> dict[str, Any]:
+    """H₂ ground-state energy at one bond length (Å), via the VQE cache."""
+    from .modules.vqe_cache import VQECache
+    from .modules.vqe_h2_exact import solve_vqe_h2
+    from .modules.vqe_h2_pes import nuclear_repulsion_h2
+
+    res = solve_vqe_h2(
+        max_iters=max_iters,
+        distance=distance,
+        basis=basis,
+        mapper=mapper,
+        cache=VQECache(),
+        mode=mode,
+        optimizer=optimizer,
+    )
+    return {
+        "distance": distance,
+        "electronic_energy": float(res.energy),
+        "total_energy": float(res.energy) + nuclear_repulsion_h2(distance),
+        "evaluations": len(res.history),
+        "basis": basis,
+        "mapper": mapper,
+        "mode": mode,
+    }
@@ -0,0 +1,175 @@
+"""
+Bounded simulation worker pool.
+
+Each worker (process or thread) owns one ``QuantumEngine`` built on first
+use, so workers never share backend state. ``SimulationPool`` bounds the
+number of in-flight tasks: once ``workers + max_queue`` tasks are pending,
+``submit`` raises ``PoolSaturated`` instead of queueing without limit.
+Tasks submitted while a ``profiling.Profile`` is active are profiled in
+their worker (see ``quantumpytho.profiling``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import queue
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from . import profiling
+from .config import QuantumConfig
+from .engine import QuantumEngine
+
+T = TypeVar("T")
+
+_local = threading.local()
+
+
+class PoolSaturated(Exception):
+    """Raised when the pool already holds its maximum number of pending tasks."""
+
+
+def process_context() -> multiprocessing.context.BaseContext:
+    """
+    Start method for simulation worker processes.
+
+    Plain ``fork`` is unsafe once Aer's OpenMP threads are running in the
+    parent (children can deadlock), so prefer ``forkserver`` and fall back to
+    ``spawn`` where it is unavailable.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
+    )
+
+
+def _init_worker(config: QuantumConfig | None) -> None:
+    _local.config = config
+    _local.engines = {}
+
+
+def worker_engine(noisy: bool = False) -> QuantumEngine:
+    """
+    Return the calling worker's engine, building it on first use.
+
+    ``noisy=True`` selects a second engine whose decoherence controller is
+    enabled with the default ``NoiseParams``.
+    """
+    engines = getattr(_local, "engines", None)
+    if engines is None:
+        engines = _local.engines = {}
+    engine = engines.get(noisy)
+    if engine is None:
+        from .modules.decoherence_toggle import DecoherenceController
+
+        engine = QuantumEngine(
+            getattr(_local, "config", None),
+            decoherence=DecoherenceController(enabled=noisy),
+        )
+        engines[noisy] = engine
+    return engine
+
+
+def call_with_engine(
+    fn: Callable[..., T], *args: Any, noisy: bool = False, **kwargs: Any
+) -> T:
+    """Call ``fn(engine, *args, **kwargs)`` with the worker's (noisy) engine."""
+    return fn(worker_engine(noisy), *args, **kwargs)
+
+
+class SimulationPool:
+    """
+    Executor of simulation tasks with backpressure.
+
+    ``workers`` defaults to ``os.cpu_count()``. With ``use_processes=False``
+    a thread pool is used instead, which is cheaper to start and convenient
+    for tests.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        max_queue: int = 64,
+        config: QuantumConfig | None = None,
+        use_processes: bool = True,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self._executor: Executor
+        if use_processes:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=process_context(),
+                initializer=_init_worker,
+                initargs=(config,),
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(config,),
+            )
+        self._slots = threading.BoundedSemaphore(self.workers + max_queue)
+        self._use_processes = use_processes
+        self._manager: Any = None
+        self._manager_lock = threading.Lock()
+
+    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> Future[T]:
+        profile = profiling.current()
+        if profile is not None:
+            fn, args = profiling.profiled_call, (profile.format, fn, *args)
+        if not self._slots.acquire(blocking=False):
+            raise PoolSaturated(
+                f"Simulation queue is full ({self.workers} running, "
+                f"{self.max_queue} queued)."
+            )
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future if profile is None else profile.wrap(future)
+
+    def submit_with_engine(
+        self, fn: Callable[..., T], *args: Any, noisy: bool = False, **kwargs: Any
+    ) -> Future[T]:
+        """
+        Submit ``fn(engine, *args, **kwargs)`` to run on a worker's engine,
+        the noisy one if ``noisy`` is set.
+        """
+        return self.submit(call_with_engine, fn, *args, noisy=noisy, **kwargs)
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    async def run_with_engine(
+        self, fn: Callable[..., T], *args: Any, noisy: bool = False, **kwargs: Any
+    ) -> T:
+        return await asyncio.wrap_future(
+            self.submit_with_engine(fn, *args, noisy=noisy, **kwargs)
+        )
+
+    def channel(self) -> tuple[Any, Any]:
+        """
+        A ``(queue, event)`` pair that can be passed to a task on this pool:
+        the task reports progress on the queue and the caller sets the event
+        to ask it to stop. Process pools get proxies from a manager process
+        started on first use.
+        """
+        if not self._use_processes:
+            return queue.Queue(), threading.Event()
+        with self._manager_lock:
+            if self._manager is None:
+                self._manager = process_context().Manager()
+        return self._manager.Queue(), self._manager.Event()
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
@@ -3,23 +3,125 @@ FastAPI server wrapping QuantumPytho modules for web UI.
 Provides REST API endpoints for all quantum features.
 """
 
-from fastapi import FastAPI, HTTPException
+import asyncio
+import json
+import os
+import queue
+import secrets
+import threading
+import time
+from contextlib import asynccontextmanager
+
+import numpy as np
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import (
+    FileResponse,
+    JSONResponse,
+    PlainTextResponse,
+    Response,
+    StreamingResponse,
+)
 from pydantic import BaseModel
-import os
 
 from quantumpytho.config import QuantumConfig
-from quantumpytho.engine import QuantumEngine
-from quantumpytho.modules.bloch_ascii import one_qubit_from_angles
-from quantumpytho.modules.qrng_sacred import qrng_phi_sequence
-from quantumpytho.modules.circuit_explorer import bell_pair, hadamard_sweep
+from quantumpytho.encoding import NotAcceptable, encode, negotiate, to_jsonable
+from quantumpytho.jobs import JobRunner, JobStore
+from quantumpytho.metrics import REGISTRY, REQUEST_SECONDS, observe_run
+from quantumpytho.modules.bloch_ascii import bloch_grid, one_qubit_from_angles
+from quantumpytho.modules.qrng_pool import EntropyPool
 from quantumpytho.modules.teleport_bridge import build_teleport_circuit
+from quantumpytho.modules.vqe_cache import VQECache
+from quantumpytho.modules.vqe_h2_exact import OPTIMIZERS, VQE_MODES
+from quantumpytho.modules.vqe_h2_pes import iter_h2_pes
+from quantumpytho.profiling import (
+    Profile,
+    list_profiles,
+    parse_format,
+    profile_dir,
+    profiled_call,
+)
+from quantumpytho.profiling import current as current_profile
+from quantumpytho.response_cache import ResponseCacheMiddleware, backend_from_spec
+from quantumpytho.tasks import (
+    bell_task,
+    hadamard_task,
+    qrng_task,
+    teleport_sweep_task,
+    vqe_h2_stream_task,
+    vqe_h2_task,
+)
+from quantumpytho.workers import PoolSaturated, SimulationPool
+
+# Simulation worker pool: one QuantumEngine per worker process.
+# QPY_WORKERS defaults to the CPU count; QPY_MAX_QUEUE bounds the number of
+# requests waiting for a worker before the server answers 503.
+pool = SimulationPool(
+    workers=int(os.environ.get("QPY_WORKERS", "0")) or None,
+    max_queue=int(os.environ.get("QPY_MAX_QUEUE", "64")),
+    config=QuantumConfig(),
+)
+
+# Shared QRNG entropy pool for /qrng/stream, started on first use.
+entropy_pool: EntropyPool | None = None
+
+# Persistent job queue for /jobs, opened at startup. QPY_JOBS_DB is the
+# SQLite file (default jobs.sqlite in the cache directory). At most
+# QPY_JOB_CONCURRENCY jobs (default half the workers) occupy the simulation
+# pool at once, leaving room for interactive requests, and at most
+# JOB_TASK_LIMITS[task] of one task.
+JOB_TASK_LIMITS = {"vqe": 1}
+job_store: JobStore | None = None
+job_runner: JobRunner | None = None
+
+
+def get_entropy_pool() -> EntropyPool:
+    global entropy_pool
+    if entropy_pool is None:
+        entropy_pool = EntropyPool().start()
+    return entropy_pool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global job_store, job_runner
+    job_store = JobStore(os.environ.get("QPY_JOBS_DB") or None)
+    job_runner = JobRunner(
+        job_store,
+        pool,
+        concurrency=int(os.environ.get("QPY_JOB_CONCURRENCY", "0"))
+        or max(1, pool.workers // 2),
+        limits=JOB_TASK_LIMITS,
+    ).start()
+    yield
+    job_runner.stop(wait=False)
+    pool.shutdown(wait=False)
+    if entropy_pool is not None:
+        entropy_pool.stop()
+
 
 app = FastAPI(
     title="QuantumPytho API",
     description="REST API for quantum computing education modules",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan,
+)
+
+# Response cache for endpoints whose output depends only on the request
+# (seconds to live per path). Sampled endpoints (/bell, /hadamard) are not
+# cached whole; their circuit diagrams are memoized in the workers instead.
+# QPY_RESPONSE_CACHE picks the store: memory (default), disk[:path],
+# redis://host:port/db or off. QPY_RESPONSE_CACHE_TTLS is a JSON object
+# overriding the per-path TTLs.
+RESPONSE_CACHE_TTLS = {
+    "/bloch": 3600,
+    "/teleport": 86400,
+    "/vqe_h2": 3600,
+    **json.loads(os.environ.get("QPY_RESPONSE_CACHE_TTLS", "{}")),
+}
+response_cache = backend_from_spec(os.environ.get("QPY_RESPONSE_CACHE", "memory"))
+app.add_middleware(
+    ResponseCacheMiddleware, ttls=RESPONSE_CACHE_TTLS, backend=response_cache
 )
 
 # CORS middleware for frontend
@@ -31,8 +133,95 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize quantum engine
-engine = QuantumEngine(QuantumConfig())
+
+@app.middleware("http")
+async def record_request_time(request: Request, call_next):
+    t0 = time.perf_counter()
+    response = await call_next(request)
+    route = request.scope.get("route")
+    if route is None and response.headers.get("x-cache") == "HIT":
+        path = request.url.path  # answered from cache, never reached the router
+    else:
+        path = getattr(route, "path", "unmatched")
+    REQUEST_SECONDS.observe(time.perf_counter() - t0, method=request.method, path=path)
+    return response
+
+
+# Per-request profiling: with QPY_PROFILE_REQUESTS=1 a request carrying an
+# ``X-Profile: pstats|collapsed`` header (or ``?profile=...``) is profiled,
+# including the worker task it runs, and the saved profile's name is returned
+# in the ``X-Profile`` response header. Saved profiles are listed at
+# /admin/profiles. If QPY_ADMIN_TOKEN is set, both need a matching
+# ``X-Admin-Token`` header. Profiled requests bypass the response cache.
+# Streaming responses are profiled up to their headers only.
+PROFILE_REQUESTS = os.environ.get("QPY_PROFILE_REQUESTS", "0") not in ("", "0")
+ADMIN_TOKEN = os.environ.get("QPY_ADMIN_TOKEN") or None
+
+
+def _admin_allowed(request: Request) -> bool:
+    if ADMIN_TOKEN is None:
+        return True
+    return secrets.compare_digest(request.headers.get("x-admin-token", ""), ADMIN_TOKEN)
+
+
+@app.middleware("http")
+async def profile_request(request: Request, call_next):
+    requested = request.headers.get("x-profile") or request.query_params.get("profile")
+    if not requested or not PROFILE_REQUESTS:
+        return await call_next(request)
+    if not _admin_allowed(request):
+        return JSONResponse(
+            {"detail": "Profiling requires a valid X-Admin-Token"}, status_code=403
+        )
+    try:
+        fmt = parse_format(requested)
+    except ValueError as e:
+        return JSONResponse({"detail": str(e)}, status_code=400)
+    if fmt is None:
+        return await call_next(request)
+    with Profile(fmt) as profile:
+        response = await call_next(request)
+    path = await asyncio.to_thread(profile.save, f"{request.method}-{request.url.path}")
+    response.headers["X-Profile"] = path.name
+    return response
+
+
+def _busy(e: PoolSaturated) -> HTTPException:
+    return HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+
+
+async def _off_loop(fn, *args):
+    """
+    Run blocking ``fn(*args)`` in a thread so the event loop keeps serving
+    other requests and streams. In a profiled request the thread is
+    profiled too and merged into the request's profile.
+    """
+    profile = current_profile()
+    if profile is None:
+        return await asyncio.to_thread(fn, *args)
+    result, data = await asyncio.to_thread(profiled_call, profile.format, fn, *args)
+    profile.add(data)
+    return result
+
+
+def _respond(request: Request, payload: dict, cache: bool = True) -> Response:
+    """
+    Encode ``payload`` in the type the ``Accept`` header asks for: JSON by
+    default, or MessagePack / Arrow IPC with NumPy arrays as packed buffers
+    (see ``quantumpytho.encoding``). 406 if none can be produced. Without
+    ``cache`` the response is marked ``no-store`` so the response cache
+    skips it.
+    """
+    try:
+        media = negotiate(request.headers.get("accept"))
+    except NotAcceptable as e:
+        raise HTTPException(status_code=406, detail=str(e)) from e
+    headers = {"Vary": "Accept"}
+    if not cache:
+        headers["Cache-Control"] = "no-store"
+    if media == "application/json":
+        return JSONResponse(to_jsonable(payload), headers=headers)
+    return Response(content=encode(payload, media), media_type=media, headers=headers)
 
 
 class BlochRequest(BaseModel):
@@ -41,144 +230,490 @@ class BlochRequest(BaseModel):
     shots: int = 1024
 
 
+class BlochBatchRequest(BaseModel):
+    thetas: list[float]
+    phis: list[float]
+
+
 class HadamardRequest(BaseModel):
     depth: int = 3
+    noise: bool = False
+    compact: bool = False
+
+
+class TeleportSweepRequest(BaseModel):
+    thetas: list[float]
+    phis: list[float]
+    noise: bool = False
+
+
+class JobRequest(BaseModel):
+    task: str
+    params: dict = {}
+    priority: int = 0
+
+
+# Upper bound on input states per /teleport/sweep request (one Aer job).
+TELEPORT_SWEEP_MAX = 4096
 
 
 @app.get("/")
-def root():
+async def root():
     return {
         "name": "QuantumPytho API",
         "version": "0.1.0",
         "endpoints": [
             "/bloch",
+            "/bloch/batch",
             "/qrng",
+            "/qrng/stream",
             "/bell",
             "/hadamard",
             "/teleport",
-            "/vqe_h2"
-        ]
+            "/teleport/sweep",
+            "/vqe_h2",
+            "/vqe_h2/scan",
+            "/vqe_h2/stream",
+            "/jobs",
+            "/metrics",
+            "/admin/profiles",
+        ],
     }
 
 
 @app.post("/bloch")
-def bloch_endpoint(req: BlochRequest):
+async def bloch_endpoint(req: BlochRequest, request: Request):
     """
     Compute Bloch sphere state vector and probabilities.
-    
+
     Returns exact Born-rule probabilities from the canonical parametrization:
     |ψ⟩ = cos(θ/2)|0⟩ + e^{iφ} sin(θ/2)|1⟩
+    The statevector is sent as [re, im] pairs in JSON.
     """
     try:
-        sv = one_qubit_from_angles(req.theta, req.phi)
-        probs = sv.probabilities().tolist()
-        
-        # Convert statevector to serializable format
-        sv_data = [[c.real, c.imag] for c in sv.data]
-        
-        return {
-            "statevector": sv_data,
-            "probabilities": probs,
+        sv = await _off_loop(one_qubit_from_angles, req.theta, req.phi)
+        body = {
+            "statevector": sv.data,
+            "probabilities": sv.probabilities(),
             "shots": req.shots,
             "theta": req.theta,
             "phi": req.phi,
         }
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
+    return _respond(request, body)
+
+
+BLOCH_COLUMNS = ["alpha_re", "alpha_im", "beta_re", "beta_im", "p0", "p1"]
+
+
+@app.post("/bloch/batch")
+async def bloch_batch_endpoint(req: BlochBatchRequest, request: Request):
+    """
+    Evaluate many Bloch-sphere points at once (vectorized, no Statevectors).
+
+    Returns columnar JSON by default, or MessagePack / Arrow IPC columns when
+    asked for. With ``Accept: application/octet-stream`` the body is the
+    columns in ``BLOCH_COLUMNS`` order, each ``n`` little-endian float64
+    values, concatenated.
+    """
+    if len(req.thetas) != len(req.phis):
+        raise HTTPException(
+            status_code=400, detail="thetas and phis must have equal length"
+        )
+    try:
+        amps, probs = await _off_loop(bloch_grid, req.thetas, req.phis)
+        columns = np.stack(
+            [
+                amps[:, 0].real,
+                amps[:, 0].imag,
+                amps[:, 1].real,
+                amps[:, 1].imag,
+                probs[:, 0],
+                probs[:, 1],
+            ]
+        )
+        if "application/octet-stream" in request.headers.get("accept", ""):
+            return Response(
+                content=columns.astype("<f8").tobytes(),
+                media_type="application/octet-stream",
+                headers={
+                    "X-Columns": ",".join(BLOCH_COLUMNS),
+                    "X-Count": str(len(req.thetas)),
+                },
+            )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+    body = {"count": len(req.thetas), **dict(zip(BLOCH_COLUMNS, columns, strict=True))}
+    return _respond(request, body)
 
 
 @app.get("/qrng")
-def qrng_endpoint(num_qubits: int = 8, length: int = 16):
+async def qrng_endpoint(request: Request, num_qubits: int = 8, length: int = 16):
     """
     Generate sacred-geometry QRNG sequence with golden ratio scaling.
     """
     try:
-        seq = qrng_phi_sequence(engine, num_qubits=num_qubits, length=length)
-        return {
-            "sequence": seq,
-            "num_qubits": num_qubits,
-            "length": length
-        }
+        body = await pool.run_with_engine(qrng_task, num_qubits, length)
+    except PoolSaturated as e:
+        raise _busy(e) from e
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
+    return _respond(request, body)
+
+
+@app.get("/qrng/stream")
+async def qrng_stream_endpoint(nbytes: int = 1 << 20, chunk_size: int = 1 << 16):
+    """
+    Stream raw quantum random bytes from the entropy pool as chunked binary.
+    """
+    if nbytes <= 0 or chunk_size <= 0:
+        raise HTTPException(
+            status_code=400, detail="nbytes and chunk_size must be positive"
+        )
+    entropy = get_entropy_pool()
+
+    async def chunks():
+        remaining = nbytes
+        while remaining > 0:
+            n = min(chunk_size, remaining)
+            yield await asyncio.to_thread(entropy.read_bytes, n)
+            remaining -= n
+
+    return StreamingResponse(
+        chunks(),
+        media_type="application/octet-stream",
+        headers={"Content-Length": str(nbytes)},
+    )
 
 
 @app.get("/bell")
-def bell_endpoint():
+async def bell_endpoint(request: Request, noise: bool = False, compact: bool = False):
     """
     Run Bell pair circuit and return measurement statistics.
+    With ``noise=true`` the run uses the default Aer noise model. With
+    ``compact=true`` counts are returned as integer ``outcomes``/``counts``
+    columns instead of a bitstring object.
     """
     try:
-        res = bell_pair(engine)
-        return {
-            "counts": res.counts,
-            "circuit": res.circuit.draw("text").__str__(),
-            "shots": res.meta["shots"],
-        }
+        body = await pool.run_with_engine(bell_task, compact=compact, noisy=noise)
+        observe_run(body["meta"], task="bell")
+    except PoolSaturated as e:
+        raise _busy(e) from e
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
+    return _respond(request, body)
 
 
 @app.post("/hadamard")
-def hadamard_endpoint(req: HadamardRequest):
+async def hadamard_endpoint(req: HadamardRequest, request: Request):
     """
-    Run Hadamard sweep circuit with specified depth.
+    Run Hadamard sweep circuit with specified depth (noisy if ``noise``,
+    columnar counts if ``compact``).
     """
     try:
-        res = hadamard_sweep(engine, depth=req.depth)
-        return {
-            "counts": res.counts,
-            "depth": req.depth,
-            "circuit": res.circuit.draw("text").__str__(),
-            "shots": res.meta["shots"],
-        }
+        body = await pool.run_with_engine(
+            hadamard_task, req.depth, compact=req.compact, noisy=req.noise
+        )
+        observe_run(body["meta"], task="hadamard")
+    except PoolSaturated as e:
+        raise _busy(e) from e
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
+    return _respond(request, body)
+
+
+def _teleport_diagram() -> str:
+    return build_teleport_circuit().draw("text").__str__()
 
 
 @app.get("/teleport")
-def teleport_endpoint():
+async def teleport_endpoint():
     """
-    Build quantum teleportation circuit (Nielsen & Chuang protocol).
+    Build quantum teleportation circuit (Nielsen & Chuang protocol),
+    including Bob's classically-controlled X/Z corrections.
     """
     try:
-        qc = build_teleport_circuit()
         return {
-            "circuit": qc.draw("text").__str__(),
-            "description": "Standard quantum teleportation protocol"
+            "circuit": await _off_loop(_teleport_diagram),
+            "description": "Standard quantum teleportation protocol",
         }
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@app.post("/teleport/sweep")
+async def teleport_sweep_endpoint(req: TeleportSweepRequest, request: Request):
+    """
+    Teleport the states ry(θ)|0⟩ followed by rz(φ) for paired ``thetas`` and
+    ``phis`` in one batched job and return the per-state fidelity arrays.
+    """
+    if len(req.thetas) != len(req.phis):
+        raise HTTPException(
+            status_code=400, detail="thetas and phis must have equal length"
+        )
+    if len(req.thetas) > TELEPORT_SWEEP_MAX:
+        raise HTTPException(
+            status_code=400, detail=f"At most {TELEPORT_SWEEP_MAX} states per sweep"
+        )
+    try:
+        body = await pool.run_with_engine(
+            teleport_sweep_task, req.thetas, req.phis, noisy=req.noise
+        )
+        observe_run(body["meta"], task="teleport_sweep")
+    except PoolSaturated as e:
+        raise _busy(e) from e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+    return _respond(request, body)
 
 
 @app.get("/vqe_h2")
-def vqe_h2_endpoint():
+async def vqe_h2_endpoint(request: Request):
     """
     Run physically correct H₂ VQE simulation.
-    
+
     Returns convergence trace if qiskit-nature/qiskit-algorithms are installed.
     No fabricated energies—either real simulation or graceful error.
     """
     try:
-        from quantumpytho.modules.vqe_h2_exact import run_vqe_h2_physical
-        
-        history = run_vqe_h2_physical()
-        energies = [{"iteration": i, "energy": float(E)} for i, E in history]
-        
-        return {
-            "energies": energies,
-            "molecule": "H₂",
-            "basis": "STO-3G"
-        }
+        body = await pool.run(vqe_h2_task)
+    except PoolSaturated as e:
+        raise _busy(e) from e
     except RuntimeError as e:
-        return {
+        # Not cached: the dependencies may be installed before the TTL ends.
+        body = {
             "error": str(e),
-            "install_command": "pip install qiskit-algorithms qiskit-nature"
+            "install_command": "pip install qiskit-algorithms qiskit-nature",
         }
+        return _respond(request, body, cache=False)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
+    return _respond(request, body)
+
+
+@app.get("/vqe_h2/scan")
+async def vqe_h2_scan_endpoint(start: float = 0.3, stop: float = 2.5, points: int = 12):
+    """
+    Scan the H₂ dissociation curve in parallel on the worker pool.
+
+    Streams one NDJSON line per bond length as each VQE point completes
+    (completion order, not distance order). If the pool is saturated or a
+    point fails, the stream ends with an ``{"error": ...}`` line. Points
+    still queued are cancelled when the client disconnects.
+    """
+    if points < 1 or start <= 0 or stop < start:
+        raise HTTPException(
+            status_code=400, detail="Require 0 < start <= stop and points >= 1"
+        )
+    try:
+        import qiskit_algorithms  # noqa: F401
+        import qiskit_nature  # noqa: F401
+    except ImportError as e:
+        return {
+            "error": f"H₂ VQE requires qiskit_algorithms and qiskit_nature. Import error: {e}",
+            "install_command": "pip install qiskit-algorithms qiskit-nature",
+        }
+
+    distances = np.linspace(start, stop, points).tolist()
+    cancel = threading.Event()
+    scan = iter_h2_pes(
+        distances,
+        workers=pool.workers,
+        cache=VQECache(),
+        executor=pool,
+        cancel=cancel,
+    )
+
+    async def lines():
+        try:
+            while True:
+                point = await asyncio.to_thread(next, scan, None)
+                if point is None:
+                    break
+                yield json.dumps(point.as_dict()) + "\n"
+        except PoolSaturated as e:
+            yield json.dumps({"error": str(e), "retry_after": 1}) + "\n"
+        except Exception as e:
+            yield json.dumps({"error": str(e)}) + "\n"
+        finally:
+            # Client gone or scan over: stop submitting points and cancel
+            # the queued ones.
+            cancel.set()
+            try:
+                scan.close()
+            except ValueError:
+                # Mid-``next`` in its thread; it sees ``cancel`` within
+                # CANCEL_POLL seconds and cancels its pending points itself.
+                pass
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+# Seconds between SSE keep-alive comments while the optimizer is silent.
+SSE_KEEPALIVE = 15.0
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.get("/vqe_h2/stream")
+async def vqe_h2_stream_endpoint(
+    distance: float = 0.735,
+    max_iters: int = 50,
+    basis: str = "sto3g",
+    mapper: str = "parity",
+    mode: str = "exact",
+    optimizer: str = "cobyla",
+):
+    """
+    Run the H₂ VQE and stream its convergence as Server-Sent Events.
+
+    Sends one ``iteration`` event per energy evaluation with
+    ``{"eval_count", "energy", "std"}``, then a final ``result`` event (or
+    ``error``). If the client disconnects the run is cancelled at its next
+    evaluation, freeing the worker. ``mode`` and ``optimizer`` are those of
+    ``solve_vqe_h2``.
+    """
+    if distance <= 0 or max_iters < 1:
+        raise HTTPException(
+            status_code=400, detail="Require distance > 0 and max_iters >= 1"
+        )
+    if mode not in VQE_MODES or optimizer not in OPTIMIZERS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"mode must be one of {VQE_MODES}, optimizer one of {OPTIMIZERS}",
+        )
+    progress, cancel = pool.channel()
+    try:
+        future = pool.submit(
+            vqe_h2_stream_task,
+            progress,
+            cancel,
+            distance,
+            max_iters,
+            basis,
+            mapper,
+            mode,
+            optimizer,
+        )
+    except PoolSaturated as e:
+        raise _busy(e) from e
+
+    async def events():
+        last = time.monotonic()
+        try:
+            while True:
+                try:
+                    point = await asyncio.to_thread(progress.get, True, 0.25)
+                except queue.Empty:
+                    # Every put happens before the task returns, so an empty
+                    # queue after completion means everything was sent.
+                    if future.done():
+                        break
+                    if time.monotonic() - last > SSE_KEEPALIVE:
+                        last = time.monotonic()
+                        yield ": keep-alive\n\n"
+                    continue
+                last = time.monotonic()
+                yield _sse("iteration", point)
+            try:
+                yield _sse("result", future.result())
+            except RuntimeError as e:
+                yield _sse(
+                    "error",
+                    {
+                        "error": str(e),
+                        "install_command": "pip install qiskit-algorithms qiskit-nature",
+                    },
+                )
+            except Exception as e:
+                yield _sse("error", {"error": str(e)})
+        finally:
+            cancel.set()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/jobs", status_code=202)
+async def submit_job_endpoint(req: JobRequest):
+    """
+    Queue a long-running simulation and return its job record immediately.
+
+    ``task`` is one of ``qrng``, ``bell``, ``sweep`` or ``vqe`` with the
+    parameters of the ``qpy`` batch CLI. Higher ``priority`` runs first. An
+    identical submission returns the existing job (``deduplicated: true``)
+    while that job is queued or running, except for sampled tasks, which
+    always run afresh. Poll ``GET /jobs/{id}`` for the result.
+    """
+    try:
+        record, created = await asyncio.to_thread(
+            job_store.submit, req.task, req.params, req.priority
+        )
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    if created:
+        job_runner.notify()
+    return {**record.as_dict(), "deduplicated": not created}
+
+
+@app.get("/jobs/{job_id}")
+async def get_job_endpoint(job_id: str):
+    """
+    State of a job (``queued``, ``running``, ``done`` or ``failed``) with its
+    ``result`` or ``error`` once finished.
+    """
+    record = await asyncio.to_thread(job_store.get, job_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"No job {job_id}")
+    return record.as_dict()
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint():
+    """
+    Prometheus text-format histograms: per-stage simulation time
+    (build/transpile/queue/simulate/counts/draw), circuit width and depth,
+    and end-to-end request time per route.
+    """
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+
+def _require_admin(request: Request) -> None:
+    if not PROFILE_REQUESTS:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not _admin_allowed(request):
+        raise HTTPException(status_code=403, detail="Requires a valid X-Admin-Token")
+
+
+@app.get("/admin/profiles")
+async def list_profiles_endpoint(request: Request):
+    """
+    Profiles captured from requests (and CLI runs sharing the profile
+    directory), newest first.
+    """
+    _require_admin(request)
+    return {"directory": str(profile_dir()), "profiles": list_profiles()}
+
+
+@app.get("/admin/profiles/{name}")
+async def get_profile_endpoint(name: str, request: Request):
+    """Download one profile: ``.prof`` (pstats) or ``.folded`` (collapsed stacks)."""
+    _require_admin(request)
+    if name not in {p["name"] for p in list_profiles()}:
+        raise HTTPException(status_code=404, detail=f"No profile {name!r}")
+    media_type = (
+        "text/plain" if name.endswith(".folded") else "application/octet-stream"
+    )
+    return FileResponse(profile_dir() / name, media_type=media_type, filename=name)
 
 
 if __name__ == "__main__":
     import uvicorn
+
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,17 @@
+from benchmarks.run import compare
+
+
+def test_compare_flags_only_real_regressions():
+    baseline = {
+        "a": {"cold": {"median": 1.0, "min": 1.0}},
+        "b": {"warm": {"median": 0.0001, "min": 0.0001}},
+    }
+    results = {
+        "a": {"cold": {"median": 1.5, "min": 1.4}},
+        "b": {"warm": {"median": 0.0003, "min": 0.0003}},
+        "new": {"cold": {"median": 9.0, "min": 9.0}},
+    }
+
+    regressions = compare(results, baseline, threshold=0.25, min_delta=0.001)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("a [cold]")
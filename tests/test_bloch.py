@@ -0,0 +1,20 @@
+import numpy as np
+
+from quantumpytho.modules.bloch_ascii import bloch_grid, one_qubit_from_angles
+
+
+def test_bloch_grid_matches_statevector():
+    thetas, phis = np.meshgrid(np.linspace(0, np.pi, 5), np.linspace(0, 2 * np.pi, 4))
+    amps, probs = bloch_grid(thetas, phis)
+
+    assert amps.shape == probs.shape == (4, 5, 2)
+    for idx in np.ndindex(thetas.shape):
+        sv = one_qubit_from_angles(thetas[idx], phis[idx])
+        np.testing.assert_allclose(amps[idx], sv.data, atol=1e-12)
+        np.testing.assert_allclose(probs[idx], sv.probabilities(), atol=1e-12)
+
+
+def test_bloch_grid_broadcasts_scalar():
+    amps, probs = bloch_grid(np.pi / 2, [0.0, np.pi])
+    assert amps.shape == (2, 2)
+    np.testing.assert_allclose(probs.sum(axis=-1), 1.0)
@@ -0,0 +1,72 @@
+import io
+import json
+
+import pytest
+
+from quantumpytho.cli import load_manifest, main, make_job, parse_range
+
+
+def test_parse_range():
+    assert parse_range("1..5") == [1, 2, 3, 4, 5]
+    assert parse_range("1,3,7..9") == [1, 3, 7, 8, 9]
+    assert parse_range("0.5..1.0:0.25", float) == [0.5, 0.75, 1.0]
+    with pytest.raises(ValueError):
+        parse_range("1..5:0")
+    with pytest.raises(ValueError, match="below its start"):
+        parse_range("500..1")
+    with pytest.raises(SystemExit):  # argparse usage error, not empty output
+        main(["sweep", "--depths", "500..1"])
+
+
+def test_load_manifest_json_lines_and_array():
+    lines = '{"task": "bell"}\n\n{"id": "x", "task": "sweep", "depth": 4}\n'
+    jobs = load_manifest(io.StringIO(lines))
+    assert [(j.id, j.task, j.params) for j in jobs] == [
+        (0, "bell", {}),
+        ("x", "sweep", {"depth": 4}),
+    ]
+    array = load_manifest(io.StringIO(json.dumps([{"task": "qrng"}])))
+    assert array[0].task == "qrng"
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        {"task": "nope"},
+        {"task": "bell", "depth": 3},
+        {"task": "sweep"},
+        {"task": "bell", "noise": "false"},
+        [1],
+    ],
+)
+def test_make_job_rejects_invalid(spec):
+    with pytest.raises(ValueError):
+        make_job(spec, 0)
+
+
+def test_sweep_streams_ndjson(capsys):
+    assert main(["sweep", "--depths", "1..4", "--shots", "64"]) == 0
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert sorted(r["params"]["depth"] for r in records) == [1, 2, 3, 4]
+    for r in records:
+        assert sum(r["result"]["counts"].values()) == 64
+        assert "circuit" not in r["result"]
+    even = next(r for r in records if r["params"]["depth"] == 2)
+    assert even["result"]["counts"] == {"0": 64}
+
+
+def test_run_manifest_records_failures(tmp_path, capsys, monkeypatch):
+    from quantumpytho import tasks
+
+    def broken(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(tasks, "qrng_task", broken)
+    manifest = tmp_path / "jobs.jsonl"
+    manifest.write_text('{"task": "bell"}\n{"id": "q", "task": "qrng"}\n')
+    assert main(["run", str(manifest), "--shots", "32"]) == 1
+    records = {
+        r["id"]: r for r in map(json.loads, capsys.readouterr().out.splitlines())
+    }
+    assert records["q"]["error"] == "RuntimeError: boom"
+    assert sum(records[0]["result"]["counts"].values()) == 32
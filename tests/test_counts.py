@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from quantumpytho.config import QuantumConfig
+from quantumpytho.counts import CountsArray
+from quantumpytho.engine import QuantumEngine
+from quantumpytho.modules.circuit_explorer import build_bell_circuit
+
+
+def test_counts_array_formats_keys_lazily():
+    counts = CountsArray.from_hex({"0x5": 3, "0x0": 1}, num_clbits=3, creg_sizes=(1, 2))
+    assert counts.outcomes.tolist() == [5, 0]
+    assert counts._dict is None
+    assert len(counts) == 2 and counts.shots == 4
+    # Register 0 holds clbit 0, register 1 clbits 1-2 (printed first).
+    assert counts == {"10 1": 3, "00 0": 1}
+    assert counts.as_json() == {
+        "outcomes": [5, 0],
+        "counts": [3, 1],
+        "num_clbits": 3,
+        "creg_sizes": [1, 2],
+    }
+
+
+@pytest.mark.parametrize("analytic_max_qubits", [0, 12])
+def test_compact_run_matches_dict_counts(analytic_max_qubits):
+    engine = QuantumEngine(
+        QuantumConfig(shots=128, analytic_max_qubits=analytic_max_qubits)
+    )
+    res = engine.run(build_bell_circuit(), compact=True)
+    assert isinstance(res.counts, CountsArray)
+    assert set(res.counts) <= {"00", "11"}
+    assert res.counts.counts.sum() == 128
+    assert np.all(np.isin(res.counts.outcomes, [0, 3]))
+    assert isinstance(engine.run(build_bell_circuit()).counts, dict)
@@ -0,0 +1,39 @@
+from quantumpytho.config import QuantumConfig
+from quantumpytho.engine import QuantumEngine
+from quantumpytho.modules.circuit_explorer import bell_pair, build_hadamard_circuit
+from quantumpytho.modules.decoherence_toggle import DecoherenceController, NoiseParams
+from quantumpytho.modules.qrng_sacred import build_qrng_circuit
+
+
+def test_noise_model_is_cached_per_params():
+    ctrl = DecoherenceController()
+    assert ctrl.noise_model() is None
+
+    ctrl.enabled = True
+    first = ctrl.noise_model()
+    assert first is ctrl.noise_model()
+
+    ctrl.configure(readout_error=0.1)
+    assert ctrl.noise_model() is not first
+    assert ctrl.params == NoiseParams(readout_error=0.1)
+
+
+def test_noisy_bell_pair_breaks_correlation():
+    ctrl = DecoherenceController(NoiseParams(readout_error=0.2), enabled=True)
+    engine = QuantumEngine(QuantumConfig(shots=512), decoherence=ctrl)
+    res = bell_pair(engine)
+
+    assert res.meta["noisy"] and res.meta["method"] == "density_matrix"
+    assert set(res.counts) & {"01", "10"}
+
+
+def test_method_follows_circuit_width():
+    ctrl = DecoherenceController(enabled=True)
+    engine = QuantumEngine(
+        QuantumConfig(shots=8, density_matrix_max_qubits=2), decoherence=ctrl
+    )
+    narrow, wide = engine.run_batch([build_hadamard_circuit(2), build_qrng_circuit(3)])
+    # Each circuit gets its own method; the batch splits into one job each.
+    assert narrow.meta["method"] == "density_matrix"
+    assert wide.meta["method"] == "statevector"
+    assert engine.run(build_hadamard_circuit(2)).meta["method"] == "density_matrix"
@@ -0,0 +1,76 @@
+import json
+
+import numpy as np
+import pytest
+
+from quantumpytho.counts import CountsArray
+from quantumpytho.encoding import (
+    ARROW,
+    JSON,
+    MSGPACK,
+    NotAcceptable,
+    encode,
+    negotiate,
+    to_jsonable,
+)
+
+PAYLOAD = {
+    "statevector": np.array([1 + 0j, 0.5j]),
+    "probabilities": np.array([0.8, 0.2]),
+    "counts": CountsArray(np.array([0, 3], np.uint64), np.array([5, 7]), 2),
+    "meta": {"shots": 12, "timings": {"simulate": np.float64(0.25)}},
+}
+
+
+def test_negotiate_defaults_and_preferences(monkeypatch):
+    assert negotiate(None) == JSON
+    assert negotiate("text/html, */*;q=0.8") == JSON
+    assert negotiate("application/x-msgpack;q=0.5, application/json") == JSON
+    with pytest.raises(NotAcceptable):
+        negotiate("text/html")
+
+    import quantumpytho.encoding as encoding
+
+    monkeypatch.setattr(encoding, "_available", lambda media: False)
+    assert negotiate("application/msgpack, application/json;q=0.1") == JSON
+    with pytest.raises(NotAcceptable, match="pip install msgpack"):
+        negotiate("application/msgpack")
+
+
+def test_json_form_matches_list_payloads():
+    body = json.loads(encode(PAYLOAD, JSON))
+    assert body == to_jsonable(PAYLOAD)
+    assert body["statevector"] == [[1.0, 0.0], [0.0, 0.5]]
+    assert body["counts"] == {
+        "outcomes": [0, 3],
+        "counts": [5, 7],
+        "num_clbits": 2,
+        "creg_sizes": [2],
+    }
+    assert body["meta"]["timings"]["simulate"] == 0.25
+
+
+def test_msgpack_ships_raw_buffers():
+    msgpack = pytest.importorskip("msgpack")
+    assert negotiate("application/msgpack") == MSGPACK
+
+    body = msgpack.unpackb(encode(PAYLOAD, MSGPACK))
+    sv = body["statevector"]
+    restored = np.frombuffer(sv["data"], sv["dtype"]).reshape(sv["shape"])
+    np.testing.assert_array_equal(restored, PAYLOAD["statevector"])
+    counts = body["counts"]["counts"]
+    assert np.frombuffer(counts["data"], counts["dtype"]).tolist() == [5, 7]
+
+
+def test_arrow_one_row_batch():
+    pa = pytest.importorskip("pyarrow")
+    assert negotiate("application/vnd.apache.arrow.stream") == ARROW
+
+    table = pa.ipc.open_stream(encode(PAYLOAD, ARROW)).read_all()
+    assert table.num_rows == 1
+    field = table.schema.field("statevector")
+    assert field.metadata == {b"shape": b"[2]", b"complex": b"true"}
+    amps = np.asarray(table.column("statevector")[0].values).view(complex)
+    np.testing.assert_array_equal(amps, PAYLOAD["statevector"])
+    assert table.column("counts.outcomes")[0].as_py() == [0, 3]
+    assert table.column("meta.timings.simulate")[0].as_py() == 0.25
@@ -0,0 +1,232 @@
+import pytest
+
+from quantumpytho.config import QuantumConfig
+from quantumpytho.engine import QuantumEngine
+from quantumpytho.modules.circuit_explorer import (
+    bell_pair_batch,
+    build_bell_circuit,
+    hadamard_sweep_batch,
+)
+
+
+def test_run_batch_preserves_order_and_labels():
+    engine = QuantumEngine(QuantumConfig(shots=64))
+    results = hadamard_sweep_batch(engine, [1, 2, 3])
+
+    assert [r.meta["label"] for r in results] == ["h_sweep_1", "h_sweep_2", "h_sweep_3"]
+    # An even number of Hadamards is the identity.
+    assert results[1].counts == {"0": 64}
+    assert all(sum(r.counts.values()) == 64 for r in results)
+
+
+def test_run_batch_label_mismatch():
+    engine = QuantumEngine()
+    with pytest.raises(ValueError):
+        engine.run_batch([build_bell_circuit()], ["a", "b"])
+
+
+def test_bell_pair_batch_is_correlated():
+    engine = QuantumEngine(QuantumConfig(shots=32))
+    results = bell_pair_batch(engine, 4)
+
+    assert len(results) == 4
+    for r in results:
+        assert set(r.counts) <= {"00", "11"}
+
+
+def test_circuit_cache_hits_on_identical_structure():
+    from qiskit import QuantumCircuit
+
+    engine = QuantumEngine(QuantumConfig(shots=16))
+
+    def build():
+        qc = QuantumCircuit(1, 1)
+        qc.x(0)
+        qc.measure(0, 0)
+        return qc
+
+    engine.run(build())
+    engine.run(build())
+    assert engine.circuit_cache.hits == 1
+    assert engine.circuit_cache.misses == 1
+
+    engine.circuit_cache.clear()
+    assert len(engine.circuit_cache) == 0
+    assert engine.circuit_cache.stats()["hits"] == 0
+
+
+def test_circuit_cache_lru_eviction():
+    from quantumpytho.circuit_cache import CircuitCache, circuit_key
+    from quantumpytho.modules.circuit_explorer import build_hadamard_circuit
+
+    cache = CircuitCache(maxsize=2)
+    for depth in (1, 2, 3):
+        cache.get_or_compile(build_hadamard_circuit(depth), lambda c: c)
+
+    assert len(cache) == 2
+    assert f":{circuit_key(build_hadamard_circuit(1))}" not in cache._entries
+    assert circuit_key(build_hadamard_circuit(1)) != circuit_key(
+        build_hadamard_circuit(2)
+    )
+
+
+def _two_bit_layouts():
+    from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+
+    one = QuantumCircuit(QuantumRegister(2, "q"), ClassicalRegister(2, "c"))
+    two = QuantumCircuit(
+        QuantumRegister(2, "q"), ClassicalRegister(1, "a"), ClassicalRegister(1, "b")
+    )
+    for qc in (one, two):
+        qc.x([0, 1])
+        qc.measure([0, 1], [0, 1])
+    return one, two
+
+
+def test_circuit_cache_separates_register_layouts():
+    from quantumpytho.circuit_cache import circuit_key
+    from quantumpytho.tasks import _DIAGRAMS
+
+    one, two = _two_bit_layouts()
+    assert circuit_key(one) != circuit_key(two)
+
+    engine = QuantumEngine(QuantumConfig(shots=16, analytic_max_qubits=0))
+    assert engine.run(one).counts == {"11": 16}
+    assert engine.run(two).counts == {"1 1": 16}
+    assert engine.circuit_cache.misses == 2
+
+    draw = _DIAGRAMS.get_or_compile
+    assert draw(one, lambda qc: str(qc.draw("text")), "text") != draw(
+        two, lambda qc: str(qc.draw("text")), "text"
+    )
+
+
+def test_analytic_fast_path_matches_exact_distribution():
+    from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+
+    engine = QuantumEngine(QuantumConfig(shots=256))
+    qc = QuantumCircuit(QuantumRegister(2), ClassicalRegister(1, "a"))
+    qc.add_register(ClassicalRegister(1, "b"))
+    qc.x(0)
+    qc.h(1)
+    qc.measure(0, 1)
+    qc.measure(1, 0)
+
+    res = engine.run(qc, memory=True)
+    assert res.meta["method"] == "analytic"
+    assert res.probabilities == pytest.approx({"1 0": 0.5, "1 1": 0.5})
+    assert set(res.counts) <= {"1 0", "1 1"}
+    assert sum(res.counts.values()) == len(res.memory) == 256
+    assert res.counts == {k: res.memory.count(k) for k in res.counts}
+
+
+def test_analytic_fast_path_keys_follow_register_layout():
+    engine = QuantumEngine(QuantumConfig(shots=16))
+    one, two = _two_bit_layouts()
+    for _ in range(2):
+        first, second = engine.run(one), engine.run(two)
+        assert first.meta["method"] == second.meta["method"] == "analytic"
+        assert first.probabilities == {"11": 1.0}
+        assert second.probabilities == {"1 1": 1.0}
+        assert second.counts == {"1 1": 16}
+
+
+def test_analytic_fast_path_skips_mid_circuit_measurement():
+    from qiskit import QuantumCircuit
+
+    engine = QuantumEngine(QuantumConfig(shots=32))
+    mid = QuantumCircuit(1, 2)
+    mid.h(0)
+    mid.measure(0, 0)
+    mid.h(0)
+    mid.measure(0, 1)
+
+    results = engine.run_batch([build_bell_circuit(), mid])
+    assert [r.meta["method"] for r in results] == ["analytic", "statevector"]
+    assert results[1].probabilities is None
+    assert sum(results[1].counts.values()) == 32
+
+    off = QuantumEngine(QuantumConfig(analytic_max_qubits=0))
+    assert off.run(build_bell_circuit()).meta["method"] == "statevector"
+
+
+def test_run_sweep_binds_parameter_table():
+    import numpy as np
+    from qiskit import QuantumCircuit
+    from qiskit.circuit import Parameter
+
+    a, b = Parameter("a"), Parameter("b")
+    qc = QuantumCircuit(2, 2)
+    qc.ry(a, 0)
+    qc.ry(b, 1)
+    qc.measure([0, 1], [0, 1])
+
+    engine = QuantumEngine(QuantumConfig(shots=128))
+    res = engine.run_sweep(qc, [[0.0, 0.0], [np.pi, 0.0], [np.pi, np.pi]])
+    assert res.parameters == ("a", "b")
+    assert res.counts.shape == (3, len(res.outcomes))
+    assert [res.counts_dict(i) for i in range(3)] == [
+        {"00": 128},
+        {"01": 128},
+        {"11": 128},
+    ]
+    assert res.meta["points"] == 3
+
+    # Mapping form, broadcast against a scalar; the compiled template is
+    # reused even though the Parameter objects are new.
+    rebuilt = qc.assign_parameters({a: Parameter("a"), b: Parameter("b")})
+    again = engine.run_sweep(rebuilt, {"a": [0.0, np.pi], "b": 0.0})
+    assert again.counts_dict(1) == {"01": 128}
+    assert engine.circuit_cache.hits == 1
+
+    with pytest.raises(ValueError):
+        engine.run_sweep(qc, [[0.0, 0.0, 0.0]])
+
+
+def test_automatic_method_per_circuit():
+    from qiskit import QuantumCircuit
+
+    from quantumpytho.modules.qrng_sacred import build_qrng_circuit, build_qrng_template
+
+    engine = QuantumEngine(QuantumConfig(shots=16, analytic_max_qubits=0))
+    clifford = QuantumCircuit(24, 24)
+    clifford.h(range(24))
+    clifford.s(0)
+    clifford.h(0)  # S·H must stay Clifford through compilation
+    clifford.measure(range(24), range(24))
+    entangled = QuantumCircuit(20, 20)
+    for layer in range(6):
+        entangled.ry(0.1 * (layer + 1), range(20))
+        entangled.cx(range(19), range(1, 20))
+    entangled.measure(range(20), range(20))
+
+    results = engine.run_batch(
+        [
+            build_qrng_circuit(4),
+            clifford,
+            build_qrng_template(40).assign_parameters([0.7]),
+            entangled,
+        ]
+    )
+    assert [r.meta["method"] for r in results] == [
+        "statevector",
+        "stabilizer",
+        "matrix_product_state",
+        "statevector",
+    ]
+    assert all(sum(r.counts.values()) == 16 for r in results)
+
+    fixed = QuantumEngine(
+        QuantumConfig(backend_name="statevector", analytic_max_qubits=0)
+    )
+    assert fixed.run(build_qrng_circuit(4)).meta["method"] == "statevector"
+
+
+def test_aer_limits_from_config():
+    engine = QuantumEngine(
+        QuantumConfig(max_parallel_threads=1, max_parallel_shots=1, max_memory_mb=64)
+    )
+    options = engine.backend.options
+    assert options.max_parallel_threads == 1
+    assert options.max_parallel_shots == 1
+    assert engine._statevector_max_qubits() == 22
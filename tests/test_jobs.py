@@ -0,0 +1,80 @@
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+from quantumpytho.jobs import JobRunner, JobStore
+
+
+def test_store_dedup_priority_and_claim_order(tmp_path):
+    store = JobStore(tmp_path / "jobs.sqlite")
+    low, created = store.submit("vqe", {"distance": 0.7})
+    assert created
+    high, _ = store.submit("vqe", {"distance": 0.9}, priority=5)
+    same, created = store.submit("vqe", {"distance": "0.7"})  # coerced to float
+    assert not created and same.id == low.id
+
+    assert store.claim().id == high.id
+    assert store.claim(exclude_tasks=("vqe",)) is None
+    claimed = store.claim()
+    assert claimed.id == low.id and claimed.state == "running"
+
+    store.fail(low.id, "boom")
+    retry, created = store.submit("vqe", {"distance": 0.7})
+    assert created and retry.id != low.id
+    assert store.requeue() == 1  # the distance 0.9 job left running
+    assert store.counts() == {"queued": 2, "running": 0, "done": 0, "failed": 1}
+
+    with pytest.raises(ValueError):
+        store.submit("sweep", {"width": 3})
+
+
+def test_store_reruns_finished_and_sampled_jobs(tmp_path):
+    store = JobStore(tmp_path / "jobs.sqlite")
+    exact, _ = store.submit("vqe", {"distance": 0.7})
+    store.finish(store.claim().id, {"energy": -1.1})
+    again, created = store.submit("vqe", {"distance": 0.7})
+    assert created and again.id != exact.id
+
+    for task, params in [("qrng", {}), ("vqe", {"distance": 0.7, "mode": "shots"})]:
+        first, _ = store.submit(task, params)
+        second, created = store.submit(task, params)
+        assert created and second.id != first.id
+
+
+class FakePool:
+    def __init__(self):
+        self.futures = []
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        self.futures.append((kwargs, future))
+        return future
+
+    submit_with_engine = submit
+
+
+def test_runner_respects_concurrency_and_task_limits(tmp_path):
+    store = JobStore(tmp_path / "jobs.sqlite")
+    ids = [store.submit("vqe", {"distance": d})[0].id for d in (0.5, 0.7)]
+    ids += [store.submit("sweep", {"depth": d})[0].id for d in (1, 2, 3)]
+    pool = FakePool()
+    runner = JobRunner(store, pool, concurrency=3, limits={"vqe": 1})
+
+    runner._dispatch()
+    assert len(pool.futures) == 3
+    assert store.counts()["running"] == 3
+    assert store.get(ids[1]).state == "queued"  # second vqe held back
+
+    done = threading.Event()
+    pool.futures[0][1].add_done_callback(lambda _: done.set())
+    pool.futures[0][1].set_result({"energy": -1.1})
+    assert done.wait(1)
+    assert store.get(ids[0]).state == "done"
+    assert store.get(ids[0]).result == {"energy": -1.1}
+
+    pool.futures[1][1].set_exception(RuntimeError("bad"))
+    assert store.get(ids[2]).error == "RuntimeError: bad"
+
+    runner._dispatch()
+    assert store.get(ids[1]).state == "running"
@@ -0,0 +1,15 @@
+from quantumpytho.metrics import MetricsRegistry
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    hist = registry.histogram("t_seconds", "test", ("stage",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 5.0):
+        hist.observe(value, stage="sim")
+
+    lines = registry.render().splitlines()
+    assert 't_seconds_bucket{stage="sim",le="0.1"} 1' in lines
+    assert 't_seconds_bucket{stage="sim",le="1"} 3' in lines
+    assert 't_seconds_bucket{stage="sim",le="+Inf"} 4' in lines
+    assert 't_seconds_count{stage="sim"} 4' in lines
+    assert 't_seconds_sum{stage="sim"} 6.05' in lines
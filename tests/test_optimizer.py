@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from quantumpytho.modules.vqe_h2_ascii import (
+    coordinate_descent,
+    coordinate_descent_1d,
+    sweep_cost,
+)
+
+
+def test_coordinate_descent_batches_all_starts():
+    calls = []
+
+    def cost(points):
+        calls.append(points.shape)
+        return ((points - [1.0, -2.0]) ** 2).sum(axis=1)
+
+    starts = np.array([[0.0, 0.0], [3.0, 3.0], [-4.0, 1.0]])
+    res = coordinate_descent(cost, starts, step=1.0, iters=100, tol=1e-6)
+
+    assert res.theta == pytest.approx([1.0, -2.0], abs=1e-6)
+    assert res.energy == pytest.approx(0.0, abs=1e-10)
+    assert res.iterations < 100  # stopped on tolerance
+    # One initial evaluation, then one call per iteration with 4 probes
+    # (±step on 2 coordinates) per active start.
+    assert calls[0] == (3, 2)
+    assert all(shape[0] % 4 == 0 and shape[1] == 2 for shape in calls[1:])
+    assert len(calls) == res.iterations + 1
+    assert res.evaluations == sum(shape[0] for shape in calls)
+
+
+def test_coordinate_descent_matches_1d_trajectory():
+    def f(t):
+        return np.cos(t) + 0.1 * t * t
+
+    ref = coordinate_descent_1d(f, 0.3, 0.5, 20)
+    res = coordinate_descent(lambda p: f(p[:, 0]), np.array([0.3]), 0.5, 20)
+    assert res.best_history() == pytest.approx(ref)
+
+
+def test_coordinate_descent_rejects_wrong_cost_shape():
+    with pytest.raises(ValueError):
+        coordinate_descent(lambda p: np.zeros(1), np.zeros((2, 1)), 0.1, 3)
+
+
+def test_sweep_cost_runs_candidates_as_one_job():
+    from qiskit import QuantumCircuit
+    from qiskit.circuit import Parameter
+
+    from quantumpytho.config import QuantumConfig
+    from quantumpytho.engine import QuantumEngine
+
+    engine = QuantumEngine(QuantumConfig(shots=4096))
+    theta = Parameter("θ")
+    template = QuantumCircuit(1, 1)
+    template.ry(theta, 0)
+    template.measure(0, 0)
+
+    def p1(sweep):
+        column = sweep.outcomes.index("1") if "1" in sweep.outcomes else None
+        probs = sweep.probabilities()
+        return probs[:, column] if column is not None else np.zeros(len(probs))
+
+    res = coordinate_descent(
+        sweep_cost(engine, template, p1), np.array([[1.0], [2.5]]), 0.5, 8
+    )
+    assert abs(res.theta[0]) < 0.3
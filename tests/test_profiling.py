@@ -0,0 +1,55 @@
+import time
+
+import pytest
+
+from quantumpytho.cli import main
+from quantumpytho.profiling import Profile, list_profiles, parse_format
+from quantumpytho.workers import SimulationPool
+
+
+def _busy_wait(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+    return "done"
+
+
+def test_parse_format():
+    assert parse_format(None) is None
+    assert parse_format("off") is None
+    assert parse_format("1") == "pstats"
+    assert parse_format("Collapsed") == "collapsed"
+    with pytest.raises(ValueError):
+        parse_format("flame")
+
+
+def test_profile_merges_pool_tasks_and_prunes(tmp_path):
+    pool = SimulationPool(workers=1, max_queue=2, use_processes=False)
+    try:
+        with Profile("collapsed") as profile:
+            assert pool.submit(_busy_wait, 0.05).result() == "done"
+        assert pool.submit(_busy_wait, 0).result() == "done"  # not profiled
+    finally:
+        pool.shutdown()
+
+    stacks = profile.data().decode().splitlines()
+    assert any("test_profiling._busy_wait" in line for line in stacks)
+    for i in range(3):
+        profile.save(f"run {i}", tmp_path, keep=2)
+    saved = list_profiles(tmp_path)
+    assert len(saved) == 2 and all(p["format"] == "collapsed" for p in saved)
+    assert saved[0]["name"].endswith("-run_2.folded")
+
+
+def test_cli_profile_flag(tmp_path, monkeypatch, capsys):
+    import pstats
+
+    monkeypatch.setenv("QPY_PROFILE_DIR", str(tmp_path))
+    assert main(["--profile", "bell", "--shots", "16"]) == 0
+    assert "profile written to" in capsys.readouterr().err
+    (saved,) = list_profiles(tmp_path)
+    assert saved["name"].endswith("-qpy-bell.prof")
+    functions = {
+        func for _, _, func in pstats.Stats(str(tmp_path / saved["name"])).stats
+    }
+    assert "bell_task" in functions
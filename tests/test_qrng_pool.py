@@ -0,0 +1,72 @@
+import threading
+
+import numpy as np
+import pytest
+
+from quantumpytho.config import QuantumConfig
+from quantumpytho.engine import QuantumEngine
+from quantumpytho.modules.qrng_pool import EntropyPool, memory_to_bytes
+
+
+def small_pool(**kwargs) -> EntropyPool:
+    engine = QuantumEngine(QuantumConfig())
+    return EntropyPool(engine, num_qubits=8, shots_per_refill=64, **kwargs)
+
+
+def test_memory_to_bytes_packs_in_shot_order():
+    out = memory_to_bytes(["10000000", "00000001", "111"])
+    assert out.tolist() == [0x80, 0x01]
+
+
+def test_inline_reads_wrap_the_ring_buffer():
+    pool = small_pool(capacity=48)
+    data = pool.read_bytes(200)
+    assert len(data) == 200
+    assert pool.available <= pool.capacity
+
+
+def test_background_refill_and_typed_views():
+    with small_pool(capacity=256) as pool:
+        words = pool.random_uint64(40)
+        floats = pool.random_floats(40)
+
+    assert words.dtype == np.uint64 and words.size == 40
+    assert floats.dtype == np.float64
+    assert np.all((floats >= 0.0) & (floats < 1.0))
+
+
+def test_failed_background_refill_reaches_waiting_readers():
+    release = threading.Event()
+
+    class BrokenEngine:
+        def run(self, *args, **kwargs):
+            release.wait(5)
+            raise RuntimeError("backend down")
+
+    errors = []
+
+    def read():
+        try:
+            pool.read_bytes(16)
+        except RuntimeError as e:
+            errors.append(e)
+
+    with EntropyPool(BrokenEngine(), num_qubits=8, capacity=64) as pool:
+        reader = threading.Thread(target=read)
+        reader.start()
+        release.set()  # fail while the reader waits on the refill thread
+        reader.join(5)
+        assert not reader.is_alive()
+        assert [str(e) for e in errors] == ["backend down"]
+        with pytest.raises(RuntimeError, match="backend down"):
+            pool.read_bytes(1)
+
+
+def test_qrng_bias_sweep():
+    from quantumpytho.modules.qrng_sacred import qrng_bias_sweep
+
+    res = qrng_bias_sweep(
+        QuantumEngine(QuantumConfig(shots=64)), [0.0, np.pi], num_qubits=3
+    )
+    assert res.counts_dict(0) == {"000": 64}
+    assert res.counts_dict(1) == {"111": 64}
@@ -0,0 +1,109 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from quantumpytho.response_cache import (  # noqa: E402
+    DiskBackend,
+    MemoryBackend,
+    ResponseCacheMiddleware,
+    backend_from_spec,
+)
+
+
+def make_client(backend, ttls=None):
+    app = FastAPI()
+    calls = {"n": 0}
+
+    @app.post("/echo")
+    async def echo(payload: dict):
+        calls["n"] += 1
+        return {"payload": payload, "call": calls["n"]}
+
+    @app.get("/fragile")
+    async def fragile():
+        calls["n"] += 1
+        return JSONResponse({"error": "missing"}, headers={"Cache-Control": "no-store"})
+
+    @app.get("/other")
+    async def other():
+        calls["n"] += 1
+        return {"call": calls["n"]}
+
+    app.add_middleware(
+        ResponseCacheMiddleware, ttls=ttls or {"/echo": 60}, backend=backend
+    )
+    return TestClient(app), calls
+
+
+def test_hit_miss_and_conditional_request():
+    client, calls = make_client(MemoryBackend())
+    first = client.post("/echo", json={"x": 1})
+    second = client.post("/echo", json={"x": 1})
+    other_body = client.post("/echo", json={"x": 2})
+
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert second.json() == first.json()
+    assert other_body.headers["x-cache"] == "MISS"
+    assert calls["n"] == 2
+    assert first.headers["cache-control"] == "max-age=60"
+
+    resp = client.post(
+        "/echo", json={"x": 1}, headers={"If-None-Match": first.headers["etag"]}
+    )
+    assert resp.status_code == 304 and resp.content == b""
+    # Paths without a TTL are passed through untouched.
+    assert "x-cache" not in client.get("/other").headers
+
+
+def test_no_store_responses_are_not_cached():
+    client, calls = make_client(MemoryBackend(), {"/fragile": 60})
+    for _ in range(2):
+        resp = client.get("/fragile")
+        assert resp.headers["x-cache"] == "MISS"
+        assert resp.headers["cache-control"] == "no-store"
+        assert "etag" not in resp.headers
+        lengths = [v for k, v in resp.headers.raw if k.lower() == b"content-length"]
+        assert lengths == [str(len(resp.content)).encode()]
+    assert calls["n"] == 2
+
+
+def test_memory_backend_expiry_and_lru(monkeypatch):
+    import quantumpytho.response_cache as rc
+
+    now = [1000.0]
+    monkeypatch.setattr(rc.time, "time", lambda: now[0])
+    cache = MemoryBackend(maxsize=2)
+    cache.set("a", b"1", ttl=10)
+    cache.set("b", b"2", ttl=10)
+    assert cache.get("a") == b"1"
+    cache.set("c", b"3", ttl=10)  # evicts "b", the least recently used
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    now[0] += 11
+    assert cache.get("a") is None
+
+
+def test_disk_backend_shared_between_instances(tmp_path):
+    path = tmp_path / "responses.sqlite"
+    client, calls = make_client(DiskBackend(path))
+    client.post("/echo", json={"x": 1})
+
+    client2, calls2 = make_client(DiskBackend(path))
+    resp = client2.post("/echo", json={"x": 1})
+    assert resp.headers["x-cache"] == "HIT"
+    assert calls2["n"] == 0
+
+
+def test_backend_from_spec(tmp_path):
+    assert backend_from_spec("off") is None
+    assert backend_from_spec("memory:8").maxsize == 8
+    assert isinstance(backend_from_spec(f"disk:{tmp_path / 'r.sqlite'}"), DiskBackend)
+    with pytest.raises(ValueError):
+        backend_from_spec("bogus")
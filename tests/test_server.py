@@ -0,0 +1,320 @@
+import json
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import server  # noqa: E402
+from quantumpytho.config import QuantumConfig  # noqa: E402
+from quantumpytho.workers import SimulationPool  # noqa: E402
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    monkeypatch.setenv("QPY_CACHE_DIR", str(tmp_path))
+    pool = SimulationPool(
+        workers=2, max_queue=4, config=QuantumConfig(shots=64), use_processes=False
+    )
+    monkeypatch.setattr(server, "pool", pool)
+    with TestClient(server.app) as c:
+        yield c
+    pool.shutdown()
+
+
+def test_bell_endpoint(client):
+    body = client.get("/bell").json()
+    assert body["shots"] == 64
+    assert set(body["counts"]) <= {"00", "11"}
+
+
+def test_hadamard_endpoint(client):
+    body = client.post("/hadamard", json={"depth": 2}).json()
+    assert body["counts"] == {"0": 64}
+
+
+def test_bloch_endpoint(client):
+    body = client.post("/bloch", json={"theta": 0.0, "phi": 0.0}).json()
+    assert body["probabilities"] == pytest.approx([1.0, 0.0])
+
+
+def test_saturated_pool_returns_503(client, monkeypatch):
+    from quantumpytho.workers import PoolSaturated
+
+    def full(*args, **kwargs):
+        raise PoolSaturated("full")
+
+    monkeypatch.setattr(server.pool, "submit", full)
+    resp = client.get("/bell")
+    assert resp.status_code == 503
+    assert resp.headers["retry-after"] == "1"
+
+
+def test_qrng_stream_endpoint(client, monkeypatch):
+    from quantumpytho.modules.qrng_pool import EntropyPool
+
+    entropy = EntropyPool(num_qubits=8, shots_per_refill=64, capacity=128)
+    monkeypatch.setattr(server, "entropy_pool", entropy)
+    resp = client.get("/qrng/stream", params={"nbytes": 300, "chunk_size": 100})
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/octet-stream"
+    assert len(resp.content) == 300
+
+
+def test_bloch_batch_columnar_and_binary(client):
+    import numpy as np
+
+    payload = {"thetas": [0.0, np.pi], "phis": [0.0, 0.5]}
+    body = client.post("/bloch/batch", json=payload).json()
+    assert body["count"] == 2
+    assert body["p0"] == pytest.approx([1.0, 0.0], abs=1e-12)
+
+    resp = client.post(
+        "/bloch/batch", json=payload, headers={"Accept": "application/octet-stream"}
+    )
+    cols = np.frombuffer(resp.content, dtype="<f8").reshape(6, 2)
+    assert resp.headers["x-columns"].split(",")[4] == "p0"
+    assert cols[4] == pytest.approx([1.0, 0.0], abs=1e-12)
+
+
+def test_metrics_exposes_stage_histograms(client):
+    body = client.post("/hadamard", json={"depth": 3}).json()
+    assert set(body["meta"]["timings"]) >= {"build", "transpile", "simulate", "draw"}
+
+    text = client.get("/metrics").text
+    assert "# TYPE qpy_stage_seconds histogram" in text
+    assert 'qpy_stage_seconds_count{stage="simulate",task="hadamard"}' in text
+    assert 'qpy_http_request_seconds_count{method="POST",path="/hadamard"}' in text
+
+
+def test_teleport_sweep_endpoint(client):
+    body = client.post(
+        "/teleport/sweep", json={"thetas": [0.1, 1.2], "phis": [0.0, 0.5]}
+    ).json()
+    assert body["fidelity"] == [1.0, 1.0]
+    assert body["shots"] == 64
+    bad = client.post("/teleport/sweep", json={"thetas": [0.1], "phis": []})
+    assert bad.status_code == 400
+
+
+def test_compact_counts(client):
+    body = client.post("/hadamard", json={"depth": 2, "compact": True}).json()
+    assert body["counts"]["outcomes"] == [0]
+    assert body["counts"]["counts"] == [64]
+
+
+def test_bloch_response_cached_with_etag(client):
+    server.response_cache.clear()
+    payload = {"theta": 0.3, "phi": 0.1}
+    first = client.post("/bloch", json=payload)
+    second = client.post("/bloch", json=payload)
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert second.json() == first.json()
+
+    etag = first.headers["etag"]
+    resp = client.post("/bloch", json=payload, headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert client.get("/bell").headers.get("x-cache") is None
+
+
+def _sse_events(text):
+    events = []
+    for block in text.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        if "event" in lines:
+            events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_vqe_stream_sends_iterations_then_result(client, monkeypatch, tmp_path):
+    pytest.importorskip("qiskit_nature")
+    pytest.importorskip("qiskit_algorithms")
+    monkeypatch.setenv("QPY_CACHE_DIR", str(tmp_path))
+
+    resp = client.get("/vqe_h2/stream", params={"max_iters": 5})
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    events = _sse_events(resp.text)
+    kinds = [kind for kind, _ in events]
+    assert kinds[-1] == "result" and set(kinds[:-1]) == {"iteration"}
+    first = events[0][1]
+    assert first["eval_count"] == 1 and first["std"] >= 0.0
+    assert events[-1][1]["evaluations"] == len(events) - 1
+
+
+def test_vqe_stream_task_stops_when_cancelled(monkeypatch, tmp_path):
+    pytest.importorskip("qiskit_nature")
+    pytest.importorskip("qiskit_algorithms")
+    import queue
+    import threading
+
+    from quantumpytho.modules.vqe_h2_exact import VQECancelled
+    from quantumpytho.tasks import vqe_h2_stream_task
+
+    monkeypatch.setenv("QPY_CACHE_DIR", str(tmp_path))
+    cancel = threading.Event()
+
+    class CancelAfterFirst(queue.Queue):
+        def put(self, item, *args, **kwargs):
+            super().put(item, *args, **kwargs)
+            cancel.set()
+
+    progress = CancelAfterFirst()
+    with pytest.raises(VQECancelled):
+        vqe_h2_stream_task(progress, cancel, max_iters=50)
+    assert progress.qsize() == 1
+
+
+def test_jobs_run_in_background_and_rerun_sampled_tasks(client):
+    import time
+
+    resp = client.post("/jobs", json={"task": "sweep", "params": {"depth": 2}})
+    assert resp.status_code == 202
+    job = resp.json()
+    assert job["state"] in ("queued", "running") and not job["deduplicated"]
+
+    for _ in range(200):
+        record = client.get(f"/jobs/{job['id']}").json()
+        if record["state"] == "done":
+            break
+        time.sleep(0.05)
+    assert record["result"]["counts"] == {"0": 64}
+
+    # Sampled tasks always run afresh.
+    again = client.post("/jobs", json={"task": "sweep", "params": {"depth": 2}})
+    assert again.json()["id"] != job["id"] and not again.json()["deduplicated"]
+    assert client.post("/jobs", json={"task": "nope"}).status_code == 400
+    assert client.get("/jobs/missing").status_code == 404
+
+
+def test_bloch_content_negotiation(client, monkeypatch):
+    import quantumpytho.encoding as encoding
+
+    body = {"theta": 3.14159265, "phi": 0.0}
+    plain = client.post("/bloch", json=body)
+    assert "Accept" in plain.headers["vary"]
+    assert len(plain.json()["statevector"][1]) == 2  # [re, im]
+
+    monkeypatch.setattr(encoding, "_available", lambda media: False)
+    resp = client.post("/bloch", json=body, headers={"Accept": "application/msgpack"})
+    assert resp.status_code == 406
+
+    msgpack = pytest.importorskip("msgpack")
+    monkeypatch.undo()
+    resp = client.post("/bloch", json=body, headers={"Accept": "application/msgpack"})
+    assert resp.headers["content-type"] == "application/msgpack"
+    probs = msgpack.unpackb(resp.content)["probabilities"]
+    assert probs["dtype"] == "<f8" and probs["shape"] == [2]
+
+
+def test_compute_endpoints_run_off_the_event_loop(client, monkeypatch):
+    import asyncio
+
+    def off_loop(fn):
+        def wrapper(*args):
+            with pytest.raises(RuntimeError):
+                asyncio.get_running_loop()
+            return fn(*args)
+
+        return wrapper
+
+    for name in ("one_qubit_from_angles", "bloch_grid", "_teleport_diagram"):
+        monkeypatch.setattr(server, name, off_loop(getattr(server, name)))
+    server.response_cache.clear()
+    assert client.post("/bloch", json={"theta": 0.0, "phi": 0.0}).status_code == 200
+    batch = {"thetas": [0.0], "phis": [0.0]}
+    assert client.post("/bloch/batch", json=batch).status_code == 200
+    assert client.get("/teleport").status_code == 200
+
+
+def test_profiled_request_lists_and_serves_profile(client, monkeypatch, tmp_path):
+    import pstats
+
+    monkeypatch.setenv("QPY_PROFILE_DIR", str(tmp_path / "profiles"))
+    assert client.get("/admin/profiles").status_code == 404  # disabled
+    monkeypatch.setattr(server, "PROFILE_REQUESTS", True)
+
+    resp = client.post("/hadamard", json={"depth": 2}, headers={"X-Profile": "pstats"})
+    assert resp.json()["counts"] == {"0": 64}
+    name = resp.headers["x-profile"]
+    listed = client.get("/admin/profiles").json()["profiles"]
+    assert [(p["name"], p["format"]) for p in listed] == [(name, "pstats")]
+
+    path = tmp_path / "saved.prof"
+    path.write_bytes(client.get(f"/admin/profiles/{name}").content)
+    functions = {func for _, _, func in pstats.Stats(str(path)).stats}
+    assert "hadamard_task" in functions  # ran in a pool worker
+    assert client.get("/admin/profiles/nope.prof").status_code == 404
+
+    monkeypatch.setattr(server, "ADMIN_TOKEN", "s3cret")
+    assert client.get("/bell", params={"profile": "collapsed"}).status_code == 403
+    assert client.get("/admin/profiles").status_code == 403
+    resp = client.get(
+        "/bell", params={"profile": "collapsed"}, headers={"X-Admin-Token": "s3cret"}
+    )
+    assert resp.headers["x-profile"].endswith(".folded")
+
+
+def test_profiled_request_bypasses_response_cache(client, monkeypatch, tmp_path):
+    import pstats
+
+    monkeypatch.setenv("QPY_PROFILE_DIR", str(tmp_path / "profiles"))
+    monkeypatch.setattr(server, "PROFILE_REQUESTS", True)
+    server.response_cache.clear()
+    body = {"theta": 0.4, "phi": 0.2}
+    assert client.post("/bloch", json=body).headers["x-cache"] == "MISS"
+
+    for kwargs in ({"headers": {"X-Profile": "1"}}, {"params": {"profile": "1"}}):
+        for _ in range(2):
+            resp = client.post("/bloch", json=body, **kwargs)
+            assert "x-cache" not in resp.headers
+            path = tmp_path / "profiles" / resp.headers["x-profile"]
+            functions = {func for _, _, func in pstats.Stats(str(path)).stats}
+            assert "one_qubit_from_angles" in functions
+
+
+def test_vqe_h2_missing_dependencies_is_not_cached(client, monkeypatch):
+    def missing():
+        raise RuntimeError("qiskit-nature is not installed")
+
+    monkeypatch.setattr(server, "vqe_h2_task", missing)
+    server.response_cache.clear()
+    for _ in range(2):
+        resp = client.get("/vqe_h2")
+        assert resp.json()["error"] == "qiskit-nature is not installed"
+        assert resp.headers["x-cache"] == "MISS"
+
+
+def test_vqe_h2_scan_reports_saturation_mid_scan(client, monkeypatch):
+    from concurrent.futures import Future
+
+    import numpy as np
+
+    from quantumpytho.modules import vqe_h2_pes
+    from quantumpytho.workers import PoolSaturated
+
+    class OneSlotPool:
+        workers = 2
+
+        def __init__(self):
+            self.futures = []
+
+        def submit(self, fn, *args):
+            if self.futures:
+                raise PoolSaturated("Simulation queue is full")
+            fut = Future()
+            fut.set_result(vqe_h2_pes.PESPoint(args[0], -1.0, -1.0, 1, np.zeros(1)))
+            self.futures.append(fut)
+            return fut
+
+        def shutdown(self, wait=True):
+            pass
+
+    monkeypatch.setattr(server, "pool", OneSlotPool())
+    resp = client.get("/vqe_h2/scan", params={"points": 4})
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert lines == [{"error": "Simulation queue is full", "retry_after": 1}]
@@ -0,0 +1,78 @@
+import pytest
+
+from quantumpytho.config import QuantumConfig
+from quantumpytho.counts import CountsArray, merge_counts
+from quantumpytho.engine import QuantumEngine
+from quantumpytho.modules.circuit_explorer import build_bell_circuit
+from quantumpytho.sharding import chunk_plan, chunk_seeds
+
+
+def _mid_measure_circuit():
+    from qiskit import QuantumCircuit
+
+    # Mid-circuit measurement keeps the run on Aer (no analytic path).
+    qc = QuantumCircuit(2, 3)
+    qc.h(0)
+    qc.measure(0, 0)
+    qc.ry(0.7, 0)
+    qc.cx(0, 1)
+    qc.measure([0, 1], [1, 2])
+    return qc
+
+
+def test_chunk_plan_and_seeds():
+    assert chunk_plan(10, 4) == [4, 4, 2]
+    assert chunk_plan(8, 4) == [4, 4]
+    assert chunk_seeds(7, 3) == chunk_seeds(7, 3)
+    assert len(set(chunk_seeds(7, 3))) == 3
+    with pytest.raises(ValueError):
+        chunk_plan(0, 4)
+
+
+def test_merge_counts_sums_in_outcome_order():
+    import numpy as np
+
+    a = CountsArray(np.array([3, 0], dtype=np.uint64), np.array([2, 1]), 2)
+    b = CountsArray(np.array([0, 1], dtype=np.uint64), np.array([5, 4]), 2)
+    merged = merge_counts([a, b])
+    assert merged.outcomes.tolist() == [0, 1, 3]
+    assert merged.counts.tolist() == [6, 4, 2]
+
+
+def test_seeded_run_is_reproducible():
+    engine = QuantumEngine(QuantumConfig(shots=256))
+    for circuit in (build_bell_circuit(), _mid_measure_circuit()):
+        first = engine.run(circuit, seed=11).counts
+        assert engine.run(circuit, seed=11).counts == first
+
+
+@pytest.mark.parametrize("circuit", [build_bell_circuit(), _mid_measure_circuit()])
+def test_sharded_counts_independent_of_worker_count(circuit):
+    engine = QuantumEngine(QuantumConfig())
+    serial = engine.run_sharded(
+        circuit, shots=5000, seed=42, workers=1, chunk_shots=999
+    )
+    parallel = engine.run_sharded(
+        circuit, shots=5000, seed=42, workers=2, chunk_shots=999
+    )
+    assert serial.counts == parallel.counts
+    assert sum(serial.counts.values()) == 5000
+    assert serial.meta["chunks"] == 6 and parallel.meta["workers"] == 2
+    assert parallel.meta["seed"] == 42
+
+    other = engine.run_sharded(circuit, shots=5000, seed=43, workers=1, chunk_shots=999)
+    assert other.counts != serial.counts
+
+
+def test_run_chunk_restores_worker_noise_params():
+    from quantumpytho.modules.decoherence_toggle import (
+        DecoherenceController,
+        NoiseParams,
+    )
+    from quantumpytho.sharding import run_chunk
+
+    engine = QuantumEngine(decoherence=DecoherenceController(enabled=True))
+    default = engine.decoherence.params
+    circuit = _mid_measure_circuit()
+    run_chunk(engine, circuit, 16, 1, noise=NoiseParams(readout_error=0.2))
+    assert engine.decoherence.params is default
@@ -0,0 +1,47 @@
+import subprocess
+import sys
+
+# Cumulative import time budget for ``python -m quantumpytho`` (seconds).
+# Generous enough for slow CI machines; pulling in Qiskit alone costs ~1 s.
+IMPORT_BUDGET_S = 0.3
+HEAVY_MODULES = ("qiskit", "qiskit_aer", "numpy")
+
+
+def _importtime(stdin: str) -> dict[str, int]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "quantumpytho"],
+        input=stdin,
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=True,
+    )
+    cumulative: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cum_us, name = line[len("import time:") :].split("|")
+        cumulative[name.strip()] = int(cum_us)
+    return cumulative
+
+
+def test_cli_startup_skips_heavy_imports():
+    modules = _importtime("q\n")
+    heavy = [m for m in modules if m.split(".")[0] in HEAVY_MODULES]
+    assert heavy == []
+
+
+def test_cli_startup_within_budget():
+    modules = _importtime("q\n")
+    assert modules["quantumpytho.menu"] / 1e6 < IMPORT_BUDGET_S
+
+
+def test_engine_builds_backend_on_first_run():
+    from quantumpytho.config import QuantumConfig
+    from quantumpytho.engine import QuantumEngine
+    from quantumpytho.modules.circuit_explorer import build_bell_circuit
+
+    engine = QuantumEngine(QuantumConfig(analytic_max_qubits=0))
+    assert engine._backend is None
+    engine.run(build_bell_circuit())
+    assert engine._backend is engine.backend
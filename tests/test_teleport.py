@@ -0,0 +1,42 @@
+import numpy as np
+
+from quantumpytho.config import QuantumConfig
+from quantumpytho.engine import QuantumEngine
+from quantumpytho.modules.decoherence_toggle import DecoherenceController
+from quantumpytho.modules.teleport_bridge import (
+    build_teleport_circuit,
+    run_teleport_bridge,
+    teleport_fidelity,
+    teleport_fidelity_sweep,
+)
+
+
+def test_teleport_applies_corrections():
+    engine = QuantumEngine(QuantumConfig(shots=256))
+    res = engine.run(build_teleport_circuit(1.3, 0.4))
+    # Every Bell outcome occurs, and Bob always holds the input state.
+    assert {key[-2:] for key in res.counts} == {"00", "01", "10", "11"}
+    assert teleport_fidelity(res) == 1.0
+
+
+def test_fidelity_sweep_shapes_and_noise():
+    thetas = np.linspace(0, np.pi, 3)[:, None]
+    phis = np.array([0.0, 1.0])
+    ideal = teleport_fidelity_sweep(
+        QuantumEngine(QuantumConfig(shots=64)), thetas, phis
+    )
+    assert ideal.fidelity.shape == ideal.stderr.shape == (3, 2)
+    assert np.all(ideal.fidelity == 1.0)
+
+    noisy_engine = QuantumEngine(
+        QuantumConfig(shots=2048), decoherence=DecoherenceController(enabled=True)
+    )
+    noisy = teleport_fidelity_sweep(noisy_engine, [0.5, 2.0], 0.0)
+    assert noisy.noisy
+    assert np.all(noisy.fidelity < 1.0) and np.all(noisy.fidelity > 0.8)
+
+
+def test_run_teleport_bridge_uses_engine(capsys):
+    run_teleport_bridge(QuantumEngine(QuantumConfig(shots=32)))
+    out = capsys.readouterr().out
+    assert "fidelity ⟨ψ|ρ_Bob|ψ⟩ ≈ 1.0000" in out
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from quantumpytho.modules.vqe_cache import VQECache
+
+OPERATOR = [("II", complex(-1.0, 0.0)), ("ZZ", complex(0.5, 0.0))]
+
+
+def test_operator_roundtrip_and_nearest(tmp_path):
+    cache = VQECache(tmp_path / "vqe.sqlite")
+    for d in (0.5, 0.735, 1.2):
+        cache.put_operator(d, "sto3g", "parity", OPERATOR)
+    cache.put_result(0.5, "sto3g", "parity", np.array([0.1, 0.2]), -1.0)
+    cache.put_result(1.2, "sto3g", "parity", np.array([0.3, 0.4]), -0.9)
+
+    entry = cache.get(0.735, "sto3g", "parity")
+    assert entry.operator == OPERATOR
+    assert entry.params is None
+
+    nearest = cache.nearest(1.0, "sto3g", "parity")
+    assert nearest.distance == pytest.approx(1.2)
+    np.testing.assert_array_equal(nearest.params, [0.3, 0.4])
+    assert cache.nearest(1.0, "sto3g", "jordan_wigner") is None
+
+
+def test_put_result_keeps_lowest_energy(tmp_path):
+    cache = VQECache(tmp_path / "vqe.sqlite")
+    cache.put_operator(0.735, "sto3g", "parity", OPERATOR)
+    cache.put_result(0.735, "sto3g", "parity", np.array([1.0]), -1.5)
+    cache.put_result(0.735, "sto3g", "parity", np.array([2.0]), -1.2)
+
+    entry = cache.get(0.735, "sto3g", "parity")
+    assert entry.energy == -1.5
+    np.testing.assert_array_equal(entry.params, [1.0])
+
+
+def test_vqe_reuses_cached_operator(tmp_path):
+    pytest.importorskip("qiskit_nature")
+    pytest.importorskip("qiskit_algorithms")
+    from quantumpytho.modules.vqe_h2_exact import run_vqe_h2_physical
+
+    cache = VQECache(tmp_path / "vqe.sqlite")
+    first = run_vqe_h2_physical(max_iters=5, cache=cache)
+    entry = cache.get(0.735, "sto3g", "parity")
+    assert entry is not None and entry.params is not None
+
+    # Warm start: the first evaluation of the next run is the cached optimum.
+    second = run_vqe_h2_physical(max_iters=5, cache=cache)
+    assert second[0][1] == pytest.approx(min(e for _, e in first), abs=1e-9)
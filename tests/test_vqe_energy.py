@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter, ParameterVector
+from qiskit.quantum_info import SparsePauliOp
+
+from quantumpytho.config import QuantumConfig
+from quantumpytho.engine import QuantumEngine
+from quantumpytho.modules.vqe_energy import (
+    BatchedObjective,
+    ExactEnergy,
+    ShotEnergy,
+    check_parameter_shift,
+    measurement_groups,
+    parameter_shift_gradient,
+    parameter_shift_points,
+)
+
+OPERATOR = SparsePauliOp.from_list(
+    [("II", -0.5), ("ZI", 0.3), ("IZ", -0.2), ("XX", 0.4), ("YY", 0.25), ("XY", 0.1)]
+)
+
+
+def _ansatz() -> QuantumCircuit:
+    theta = ParameterVector("θ", 4)
+    qc = QuantumCircuit(2)
+    qc.ry(theta[0], 0)
+    qc.ry(theta[1], 1)
+    qc.cz(0, 1)
+    qc.ry(theta[2], 0)
+    qc.rx(theta[3], 1)
+    return qc
+
+
+POINTS = np.array([[0.1, -0.7, 1.3, 0.4], [2.0, 0.5, -1.0, -2.2]])
+
+
+def test_exact_energy_matches_dense_expectation():
+    from qiskit.quantum_info import Statevector
+
+    energies, stds = ExactEnergy(_ansatz(), OPERATOR)(POINTS)
+    for point, energy in zip(POINTS, energies, strict=True):
+        state = Statevector(_ansatz().assign_parameters(point))
+        assert energy == pytest.approx(state.expectation_value(OPERATOR).real)
+    assert not stds.any()
+
+
+def test_shot_energy_groups_terms_and_agrees_with_exact():
+    groups = measurement_groups(_ansatz(), OPERATOR)
+    assert len(groups) < len(OPERATOR)
+    assert sum(len(g.coeffs) for g in groups) == len(OPERATOR)
+
+    engine = QuantumEngine(QuantumConfig())
+    sampled, stds = ShotEnergy(_ansatz(), OPERATOR, engine, shots=20000)(POINTS)
+    exact, _ = ExactEnergy(_ansatz(), OPERATOR)(POINTS)
+    assert (stds > 0).all()
+    assert np.abs(sampled - exact).max() < 5 * stds.max()
+
+
+def test_parameter_shift_gradient_is_exact():
+    evaluate = ExactEnergy(_ansatz(), OPERATOR)
+    theta = POINTS[0]
+    gradient = parameter_shift_gradient(evaluate(parameter_shift_points(theta))[0])
+    h = 1e-6
+    steps = np.eye(len(theta)) * h
+    numeric = (evaluate(theta + steps)[0] - evaluate(theta - steps)[0]) / (2 * h)
+    assert gradient == pytest.approx(numeric, abs=1e-7)
+
+
+def test_parameter_shift_rejects_shared_and_scaled_parameters():
+    check_parameter_shift(_ansatz())
+    a = Parameter("a")
+    shared = QuantumCircuit(1)
+    shared.ry(a, 0)
+    shared.rz(a, 0)
+    with pytest.raises(ValueError, match="more than one gate"):
+        check_parameter_shift(shared)
+    scaled = QuantumCircuit(1)
+    scaled.ry(2 * a, 0)
+    with pytest.raises(ValueError, match="bare angles"):
+        check_parameter_shift(scaled)
+
+
+def test_objective_evaluates_energy_and_gradient_in_one_batch():
+    calls, reports = [], []
+
+    def evaluate(points):
+        calls.append(len(points))
+        return (points**2).sum(axis=1), np.zeros(len(points))
+
+    objective = BatchedObjective(
+        evaluate, gradient=True, report=lambda *r: reports.append(r)
+    )
+    x = np.array([1.0, -2.0, 0.5])
+    assert objective.fun(x) == pytest.approx(5.25)
+    # Not a rotation energy: the shift rule gives ((x+π/2)² - (x-π/2)²)/2 = πx.
+    assert objective.jac(x) == pytest.approx(np.pi * x)
+    assert calls == [7]
+    assert reports == [(1, 5.25, 0.0)]
+
+    objective.jac(x + 1)
+    assert calls == [7, 7] and reports[-1][0] == 2
+
+
+def test_vqe_modes_physical():
+    pytest.importorskip("qiskit_nature")
+    pytest.importorskip("qiskit_algorithms")
+    from quantumpytho.modules.vqe_h2_exact import build_h2_qubit_operator, solve_vqe_h2
+
+    ground = np.linalg.eigvalsh(build_h2_qubit_operator().to_matrix()).min()
+    start = np.random.default_rng(0).uniform(-np.pi, np.pi, 16)
+    exact = solve_vqe_h2(
+        max_iters=100, mode="exact", optimizer="l_bfgs_b", initial_point=start
+    )
+    assert exact.energy == pytest.approx(ground, abs=1e-4)
+
+    engine = QuantumEngine(QuantumConfig(shots=256))
+    shots = solve_vqe_h2(
+        max_iters=3,
+        mode="shots",
+        optimizer="slsqp",
+        engine=engine,
+        initial_point=exact.optimal_point,
+    )
+    assert shots.history[0][1] == pytest.approx(ground, abs=0.1)
+    with pytest.raises(ValueError):
+        solve_vqe_h2(mode="nope")
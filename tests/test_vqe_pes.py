@@ -0,0 +1,98 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from quantumpytho.modules import vqe_h2_pes
+from quantumpytho.modules.vqe_h2_pes import PESPoint, iter_h2_pes, scan_h2_pes
+
+
+def fake_solver(calls):
+    def solve(distance, basis, mapper, max_iters, initial_point, cache):
+        calls.append((distance, None if initial_point is None else initial_point[0]))
+        return PESPoint(distance, -distance, -distance, 1, np.array([distance]))
+
+    return solve
+
+
+def test_chains_warm_start_from_neighbour(monkeypatch):
+    calls = []
+    monkeypatch.setattr(vqe_h2_pes, "_solve_point", fake_solver(calls))
+    distances = [0.5, 0.6, 0.7, 1.0, 1.1, 1.2]
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        points = list(iter_h2_pes(distances, workers=2, executor=pool))
+
+    assert sorted(p.distance for p in points) == distances
+    warm = dict(calls)
+    # Two chains: [0.5, 0.6, 0.7] and [1.0, 1.1, 1.2].
+    assert warm[0.5] is None and warm[1.0] is None
+    assert warm[0.6] == 0.5 and warm[0.7] == 0.6
+    assert warm[1.1] == 1.0 and warm[1.2] == 1.1
+
+
+def test_scan_serial_reports_progress_and_sorts(monkeypatch):
+    monkeypatch.setattr(vqe_h2_pes, "_solve_point", fake_solver([]))
+    seen = []
+    curve = scan_h2_pes([1.0, 0.5], workers=1, progress=seen.append)
+
+    assert [p.distance for p in curve] == [0.5, 1.0]
+    assert len(seen) == 2
+
+
+class StalledPool:
+    """Executor whose first point finishes and whose others never start."""
+
+    def __init__(self):
+        self.futures = []
+
+    def submit(self, fn, *args):
+        fut = Future()
+        if not self.futures:
+            fut.set_result(fn(*args))
+        self.futures.append(fut)
+        return fut
+
+
+def test_cancel_stops_scan_and_cancels_queued_points(monkeypatch):
+    monkeypatch.setattr(vqe_h2_pes, "_solve_point", fake_solver([]))
+    monkeypatch.setattr(vqe_h2_pes, "CANCEL_POLL", 0.01)
+    pool, cancel = StalledPool(), threading.Event()
+    scan = iter_h2_pes([0.5, 0.6, 1.0, 1.1], workers=2, executor=pool, cancel=cancel)
+
+    assert next(scan).distance == 0.5
+    cancel.set()
+    assert next(scan, None) is None
+    # 0.5 finished; 1.0 and 0.6 (0.5's successor) were still queued.
+    assert [f.cancelled() for f in pool.futures] == [False, True, True]
+
+
+@pytest.mark.parametrize(
+    "answers",
+    [
+        ["0.5", "2.0", "0", ""],
+        ["2.0", "0.5", "4", ""],
+        ["abc"],
+        ["0.5", "2", "4", "-1"],
+    ],
+)
+def test_pes_cli_rejects_invalid_ranges(monkeypatch, capsys, answers):
+    from quantumpytho.modules.vqe_h2_cli import run_vqe_h2_pes_cli
+
+    replies = iter(answers)
+    monkeypatch.setattr("builtins.input", lambda _: next(replies))
+    monkeypatch.setattr(vqe_h2_pes, "scan_h2_pes", pytest.fail)
+    run_vqe_h2_pes_cli()
+    assert "[VQE H₂ PES]" in capsys.readouterr().out
+
+
+def test_scan_h2_pes_physical():
+    pytest.importorskip("qiskit_nature")
+    pytest.importorskip("qiskit_algorithms")
+
+    curve = scan_h2_pes([0.6, 0.735, 2.0], workers=2, max_iters=150)
+    energies = {round(p.distance, 3): p.total_energy for p in curve}
+    # Bound molecule: the equilibrium point lies below both ends.
+    assert energies[0.735] < energies[0.6]
+    assert energies[0.735] < energies[2.0]
@@ -0,0 +1,33 @@
+import threading
+
+import pytest
+
+from quantumpytho.workers import PoolSaturated, SimulationPool, worker_engine
+
+
+def test_pool_rejects_when_full():
+    pool = SimulationPool(workers=1, max_queue=1, use_processes=False)
+    release = threading.Event()
+    try:
+        first = pool.submit(release.wait)
+        second = pool.submit(release.wait)
+        with pytest.raises(PoolSaturated):
+            pool.submit(release.wait)
+        release.set()
+        first.result()
+        second.result()
+        # Slots are released once tasks finish.
+        assert pool.submit(lambda: 1).result() == 1
+    finally:
+        release.set()
+        pool.shutdown()
+
+
+def test_each_worker_keeps_its_engine():
+    pool = SimulationPool(workers=1, max_queue=0, use_processes=False)
+    try:
+        a = pool.submit(lambda: id(worker_engine())).result()
+        b = pool.submit(lambda: id(worker_engine())).result()
+        assert a == b
+    finally:
+        pool.shutdown()